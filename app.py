@@ -4,12 +4,19 @@ Metode: SAW (Simple Additive Weighting)
 Author: [Dhoni Prasetya]
 """
 
+import threading
+
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA
-from utils.saw_calculator import hitung_saw, format_hasil
-from utils.pdf_generator import generate_pdf_report
+from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA, get_katalog
+from utils.saw_calculator import format_hasil, hitung_saw
+from utils.chart_service import CACHE_GRAFIK, buat_grafik_plotly, render_grafik_png
+from utils.metrics import METRIK, kolektor_cache
+from utils.render_queue import AntrianRender, GAGAL, MENUNGGU, PENUH, SELESAI, TIDAK_ADA
+
+# pandas, matplotlib, dan reportlab (utils.pdf_generator) sengaja di-import
+# di dalam blok hasil: baru dimuat setelah tombol hitung ditekan, sehingga
+# render pertama halaman tidak menunggu library berat tersebut.
+# Ukur dengan: python -m benchmarks.bench_startup
 
 # ========================================
 # KONFIGURASI HALAMAN
@@ -21,6 +28,239 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# ========================================
+# CACHE (DIPAKAI BERSAMA SEMUA SESI)
+# ========================================
+# Streamlit menjalankan ulang script ini setiap ada interaksi. Hasil
+# perhitungan, CSV, dan PDF di-cache berdasarkan input siswa +
+# sidik katalog + bobot, sehingga rerun dengan input sama hampir tanpa kerja.
+# Grafik di-cache oleh utils/chart_service.py (CACHE_GRAFIK), PDF dirender
+# di background oleh antrian utils/render_queue.py.
+CACHE_MAKS_HASIL = 1024
+CACHE_MAKS_PDF_BYTES = 32 * 2**20
+WORKER_PDF = 2
+INTERVAL_CEK_PDF = 0.3
+
+
+def get_katalog_bobot():
+    """
+    Katalog terkompilasi dan bobot saat ini
+    
+    Dibaca setiap rerun (tidak di-cache_resource): get_katalog memakai ulang
+    katalog yang sudah dikompilasi selama JURUSAN_DATA tidak berubah, dan
+    perubahan BOBOT_KRITERIA langsung masuk ke key cache hasil.
+    """
+    return get_katalog(JURUSAN_DATA), dict(BOBOT_KRITERIA)
+
+
+@st.cache_resource
+def get_statistik_cache():
+    """Counter panggilan & miss per lapisan cache (untuk sidebar)"""
+    return {'lock': threading.Lock(), 'data': {}}
+
+
+def catat_cache(lapisan, miss=False):
+    """Tambah counter panggilan (miss=False) atau miss (miss=True) satu lapisan"""
+    statistik = get_statistik_cache()
+    with statistik['lock']:
+        counter = statistik['data'].setdefault(lapisan, {'panggilan': 0, 'miss': 0})
+        counter['miss' if miss else 'panggilan'] += 1
+
+
+def kolektor_cache_app():
+    """Statistik lapisan cache app untuk ekspor Prometheus (utils/metrics.py)"""
+    statistik = get_statistik_cache()
+    with statistik['lock']:
+        ringkasan = {k: dict(v) for k, v in statistik['data'].items()}
+    sampel = []
+    for lapisan, counter in ringkasan.items():
+        label = {'cache': f"app_{lapisan}"}
+        hit = counter['panggilan'] - counter['miss']
+        sampel.append(('spk_cache_hits_total', 'counter', label, hit))
+        sampel.append(('spk_cache_misses_total', 'counter', label, counter['miss']))
+        sampel.append(('spk_cache_hit_ratio', 'gauge', label,
+                       hit / counter['panggilan'] if counter['panggilan'] else 0.0))
+    return sampel
+
+
+@st.cache_resource
+def init_metrik():
+    """
+    Daftarkan kolektor cache app dan jalankan endpoint /metrics
+    (jika SPK_METRICS_PORT diisi), sekali per proses server
+    """
+    METRIK.daftar_kolektor(kolektor_cache_app)
+    if METRIK.aktif:
+        return METRIK.mulai_server()
+    return None
+
+
+init_metrik()
+
+
+def kunci_perhitungan():
+    """Bagian key cache selain input siswa: (sidik katalog, bobot)"""
+    katalog, bobot = get_katalog_bobot()
+    return katalog.sidik, tuple(sorted(bobot.items()))
+
+
+@st.cache_data(max_entries=CACHE_MAKS_HASIL, show_spinner=False)
+def _hitung_hasil(nilai_akademik, minat, ekonomi, prospek_kerja, sidik_katalog, bobot):
+    catat_cache('Hasil SAW', miss=True)
+    katalog, _ = get_katalog_bobot()
+    return hitung_saw(nilai_akademik, minat, ekonomi, prospek_kerja, katalog, dict(bobot))
+
+
+def hitung_hasil(nilai_akademik, minat, ekonomi, prospek_kerja):
+    """hitung_saw dengan cache per (input, sidik katalog, bobot)"""
+    catat_cache('Hasil SAW')
+    return _hitung_hasil(nilai_akademik, minat, ekonomi, prospek_kerja, *kunci_perhitungan())
+
+
+@st.cache_data(max_entries=CACHE_MAKS_HASIL, show_spinner=False)
+def _buat_csv(nilai_akademik, minat, ekonomi, prospek_kerja, sidik_katalog, bobot):
+    catat_cache('CSV', miss=True)
+    import pandas as pd
+    
+    hasil, detail = _hitung_hasil(nilai_akademik, minat, ekonomi, prospek_kerja,
+                                  sidik_katalog, bobot)
+    df_hasil = pd.DataFrame(hasil)
+    df_hasil['Ranking'] = range(1, len(df_hasil) + 1)
+    df_hasil['Nilai SAW'] = df_hasil['Nilai SAW'].apply(lambda x: f"{x:.4f}")
+    csv_hasil = df_hasil.to_csv(index=False).encode('utf-8')
+    csv_detail = pd.DataFrame(detail).to_csv(index=False).encode('utf-8')
+    return csv_hasil, csv_detail
+
+
+def buat_csv(nilai_akademik, minat, ekonomi, prospek_kerja):
+    """CSV hasil & detail (bytes) dengan cache"""
+    catat_cache('CSV')
+    return _buat_csv(nilai_akademik, minat, ekonomi, prospek_kerja, *kunci_perhitungan())
+
+
+@st.cache_resource
+def get_antrian_pdf():
+    """Antrian render PDF di background, dipakai bersama semua sesi"""
+    antrian = AntrianRender(workers=WORKER_PDF, maks_bytes=CACHE_MAKS_PDF_BYTES)
+    METRIK.daftar_kolektor(kolektor_cache('pdf', antrian))
+    METRIK.daftar_kolektor(antrian.kolektor)
+    return antrian
+
+
+def _render_pdf(nama, nilai_akademik, minat, ekonomi, prospek_kerja, hasil, detail, bobot):
+    """Dijalankan di thread antrian (tanpa akses cache Streamlit)"""
+    from utils.pdf_generator import generate_pdf_report
+    
+    return generate_pdf_report(
+        nama = nama,
+        nilai_akademik = nilai_akademik,
+        minat = minat,
+        ekonomi = ekonomi,
+        prospek_kerja = prospek_kerja,
+        hasil = hasil,
+        detail = detail,
+        bobot_kriteria = bobot
+    )
+
+
+def kirim_pdf(key, nama, nilai_akademik, minat, ekonomi, prospek_kerja):
+    """
+    Kirim job PDF report ke antrian background
+    
+    Hasil SAW dihitung di thread script (memakai cache), thread antrian
+    hanya menjalankan ReportLab. Job dengan key sama dirender sekali.
+    
+    Returns:
+        str: Status dari AntrianRender.kirim
+    """
+    hasil, detail = hitung_hasil(nilai_akademik, minat, ekonomi, prospek_kerja)
+    _, bobot = get_katalog_bobot()
+    return get_antrian_pdf().kirim(key, _render_pdf, nama, nilai_akademik, minat, ekonomi,
+                                   prospek_kerja, hasil, detail, dict(bobot))
+
+
+def minta_pdf(key, input_siswa):
+    """Callback tombol PDF: tandai input yang diminta lalu kirim job ke antrian"""
+    st.session_state['pdf_diminta'] = input_siswa
+    kirim_pdf(key, *input_siswa)
+
+
+def status_pdf(key, input_siswa):
+    """
+    Status job PDF, job yang belum ada di antrian dikirim ulang
+    
+    Returns:
+        dict: Status dari AntrianRender.status ('penuh' jika antrian penuh),
+            ditambah 'pdf' berisi bytes PDF jika sudah selesai
+    """
+    antrian = get_antrian_pdf()
+    status = antrian.status(key)
+    if status['status'] == TIDAK_ADA:
+        # Belum pernah dikirim di proses ini atau sudah dibuang dari cache
+        if kirim_pdf(key, *input_siswa) == PENUH:
+            return {**status, 'status': PENUH, 'pdf': None}
+        status = antrian.status(key)
+    pdf_bytes = antrian.ambil(key) if status['status'] == SELESAI else None
+    if status['status'] == SELESAI and pdf_bytes is None:
+        # Dibuang dari cache di antara status() dan ambil(), render ulang
+        kirim_pdf(key, *input_siswa)
+        status = {**status, 'status': MENUNGGU, 'posisi': 0}
+    return {**status, 'pdf': pdf_bytes}
+
+
+@st.fragment(run_every=INTERVAL_CEK_PDF)
+def pantau_pdf(key, input_siswa):
+    """
+    Status PDF selama masih dirender
+    
+    Streamlit menjalankan ulang fragment ini setiap INTERVAL_CEK_PDF detik
+    tanpa menahan thread script. Setelah job selesai/gagal seluruh app
+    di-rerun agar tampilkan_pdf menampilkan tombol download atau error.
+    """
+    status = status_pdf(key, input_siswa)
+    if status['status'] in (SELESAI, GAGAL):
+        st.rerun()
+    
+    if status['status'] == PENUH:
+        st.caption("⏳ Antrian PDF penuh, mencoba lagi...")
+    elif status['status'] == MENUNGGU and status['posisi']:
+        st.caption(f"⏳ Menunggu antrian PDF ({status['posisi']} di depan)...")
+    else:
+        st.caption("⏳ Membuat PDF...")
+
+
+@st.fragment
+def tampilkan_pdf(nama, nilai_akademik, minat, ekonomi, prospek_kerja):
+    """
+    Tombol & status PDF report
+    
+    Tombol hanya menjalankan ulang fragment ini, dan selama PDF dirender
+    status diperiksa oleh pantau_pdf, bukan seluruh script.
+    """
+    input_siswa = (nama, nilai_akademik, minat, ekonomi, prospek_kerja)
+    key = (*input_siswa, *kunci_perhitungan())
+    
+    if st.session_state.get('pdf_diminta') != input_siswa:
+        st.button("📄 PDF Report", key="minta_pdf", use_container_width=True,
+                  on_click=minta_pdf, args=(key, input_siswa))
+        return
+    
+    status = status_pdf(key, input_siswa)
+    if status['pdf'] is not None:
+        st.download_button(
+            label="📥 PDF Report",
+            data=status['pdf'],
+            file_name=f"report_{nama.replace(' ', '_')}.pdf",
+            mime="application/pdf",
+            use_container_width=True
+        )
+    elif status['status'] == GAGAL:
+        st.error(f"Gagal membuat PDF: {status['error']}")
+        st.button("🔄 Coba lagi", key="ulang_pdf", use_container_width=True,
+                  on_click=kirim_pdf, args=(key, *input_siswa))
+    else:
+        pantau_pdf(key, input_siswa)
+
 # ========================================
 # CSS STYLING - MOBILE FIRST APPROACH
 # ========================================
@@ -580,6 +820,10 @@ with st.sidebar:
     for key, value in BOBOT_KRITERIA.items():
         st.write(f"• **{key.replace('_', ' ').title()}:** {value*100}%")
     
+    st.markdown("---")
+    # Diisi di akhir script, setelah semua lapisan cache dipanggil
+    panel_cache = st.empty()
+    
     st.markdown("---")
     st.markdown("""
     ### 📞 Bantuan
@@ -673,20 +917,28 @@ with col1:
 with col2:
     st.subheader("📊 Hasil")
     
-    if submit_button:
+    # Input hasil terakhir disimpan di session_state supaya hasil tetap tampil
+    # pada rerun tanpa submit (misalnya saat tombol PDF ditekan)
+    if submit_button or 'input_hasil' in st.session_state:
         # Validasi input
-        if not nama or not minat or not ekonomi or nilai_akademik == 0:
+        if submit_button and (not nama or not minat or not ekonomi or nilai_akademik == 0):
             st.error("⚠️ Mohon lengkapi semua data!")
+            st.session_state.pop('input_hasil', None)
         else:
+            if submit_button:
+                st.session_state['input_hasil'] = (nama, nilai_akademik, minat, ekonomi, prospek_kerja)
+            else:
+                nama, nilai_akademik, minat, ekonomi, prospek_kerja = st.session_state['input_hasil']
+            
+            METRIK.tambah('spk_app_hasil_total', submit='ya' if submit_button else 'tidak')
+            
             # Hitung SAW
-            with st.spinner("⏳ Menghitung..."):
-                hasil, detail = hitung_saw(
+            with st.spinner("⏳ Menghitung..."), METRIK.waktu('app_hitung'):
+                hasil, detail = hitung_hasil(
                     nilai_akademik, 
                     minat, 
                     ekonomi, 
-                    prospek_kerja,
-                    JURUSAN_DATA,
-                    BOBOT_KRITERIA
+                    prospek_kerja
                 )
             
             # ===== REKOMENDASI TERBAIK =====
@@ -717,9 +969,12 @@ with col2:
             # ===== TABEL RANKING =====
             st.write("### 📋 Ranking Lengkap")
             
-            df_hasil = pd.DataFrame(hasil)
-            df_hasil['Ranking'] = range(1, len(df_hasil) + 1)
-            df_hasil['Nilai SAW'] = df_hasil['Nilai SAW'].apply(lambda x: f"{x:.4f}")
+            with METRIK.waktu('app_tabel'):
+                import pandas as pd
+                
+                df_hasil = pd.DataFrame(hasil)
+                df_hasil['Ranking'] = range(1, len(df_hasil) + 1)
+                df_hasil['Nilai SAW'] = df_hasil['Nilai SAW'].apply(lambda x: f"{x:.4f}")
             
             st.dataframe(
                 df_hasil[['Ranking', 'Kode', 'Jurusan', 'Nilai SAW']],
@@ -731,26 +986,21 @@ with col2:
             # ===== VISUALISASI =====
             st.write("### 📈 Grafik")
             
-            fig, ax = plt.subplots(figsize=(10, 4))
-            colors = ['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#6b7280']
-            
-            jurusan_names = [h['Jurusan'] for h in hasil]
-            nilai_saw = [h['Nilai SAW'] for h in hasil]
-            
-            bars = ax.barh(jurusan_names, nilai_saw, color=colors, height=0.6)
-            
-            ax.set_xlabel('Nilai SAW', fontsize=11, fontweight='bold')
-            ax.set_title('Perbandingan Nilai SAW', fontsize=12, fontweight='bold', pad=15)
-            ax.grid(axis='x', alpha=0.3, linestyle='--')
-            
-            for i, (bar, nilai) in enumerate(zip(bars, nilai_saw)):
-                width = bar.get_width()
-                ax.text(width + 0.01, bar.get_y() + bar.get_height()/2, 
-                       f'{nilai:.3f}',
-                       ha='left', va='center', fontsize=9, fontweight='bold')
-            
-            plt.tight_layout()
-            st.pyplot(fig)
+            grafik_interaktif = st.toggle(
+                "Grafik interaktif",
+                key="grafik_interaktif",
+                help="Digambar di browser (Plotly), tanpa render gambar di server"
+            )
+            label_grafik = [h['Jurusan'] for h in hasil]
+            nilai_grafik = [h['Nilai SAW'] for h in hasil]
+            if grafik_interaktif:
+                with METRIK.waktu('app_grafik_plotly'):
+                    grafik = buat_grafik_plotly(label_grafik, nilai_grafik)
+                st.plotly_chart(grafik, use_container_width=True)
+            else:
+                with METRIK.waktu('app_grafik_png'):
+                    png_grafik = render_grafik_png(label_grafik, nilai_grafik)
+                st.image(png_grafik)
             
             # ===== DETAIL =====
             with st.expander("🔢 Detail Perhitungan"):
@@ -774,10 +1024,11 @@ with col2:
             st.markdown("---")
             st.write("### 💾 Export Data")
             exp_col1, exp_col2, exp_col3 = st.columns(3)
+            with METRIK.waktu('app_csv'):
+                csv, csv_detail = buat_csv(nilai_akademik, minat, ekonomi, prospek_kerja)
             
             with exp_col1:
             # Export CSV
-                csv = df_hasil.to_csv(index=False).encode('utf-8')
                 st.download_button(
                     label="📥 Hasil",
                     data=csv,
@@ -787,7 +1038,6 @@ with col2:
                 )
             # Export Detail Perhitungan
             with exp_col2:
-                csv_detail = pd.DataFrame(detail).to_csv(index=False).encode('utf-8')
                 st.download_button(
                     label="📥 Detail",
                     data=csv_detail,
@@ -796,24 +1046,8 @@ with col2:
                     use_container_width=True
                 )
             with exp_col3:
-            # Export PDF Report
-                pdf_bytes = generate_pdf_report(
-                    nama = nama,
-                    nilai_akademik = nilai_akademik,
-                    minat = minat,
-                    ekonomi = ekonomi,
-                    prospek_kerja = prospek_kerja,
-                    hasil = hasil,
-                    detail = detail,
-                    bobot_kriteria = BOBOT_KRITERIA
-                )
-                st.download_button(
-                    label="📄 PDF Report",
-                    data=pdf_bytes,
-                    file_name=f"report_{nama.replace(' ', '_')}.pdf",
-                    mime="application/pdf",
-                    use_container_width=True
-                )
+            # Export PDF Report - baru dibuat setelah diminta, dirender di background
+                tampilkan_pdf(nama, nilai_akademik, minat, ekonomi, prospek_kerja)
     else:
         st.info("👈 Isi form dan klik tombol hitung")
         
@@ -838,4 +1072,32 @@ st.markdown("""
     <p style="margin: 3px 0;">Metode SAW</p>
     <p style="margin: 8px 0 3px 0; color: #9ca3af;">© 2024 v1.0</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+# ========================================
+# SIDEBAR - EFEKTIVITAS CACHE
+# ========================================
+with panel_cache.container():
+    st.markdown("### ⚡ Cache")
+    statistik = get_statistik_cache()
+    with statistik['lock']:
+        ringkasan = {k: dict(v) for k, v in statistik['data'].items()}
+    if not ringkasan:
+        st.caption("Belum ada perhitungan")
+    for lapisan, counter in ringkasan.items():
+        hit = counter['panggilan'] - counter['miss']
+        rasio = hit / counter['panggilan'] if counter['panggilan'] else 0.0
+        st.caption(f"{lapisan}: {hit}/{counter['panggilan']} hit ({rasio:.0%})")
+    info_pdf = get_antrian_pdf().info()
+    if info_pdf['hits'] + info_pdf['misses']:
+        st.caption(f"PDF: {info_pdf['hits']}/{info_pdf['hits'] + info_pdf['misses']} hit "
+                   f"({info_pdf['hit_rate']:.0%}, {info_pdf['bytes'] / 2**10:,.0f} KB, "
+                   f"{info_pdf['menunggu'] + info_pdf['berjalan']} dalam antrian)")
+    info_grafik = CACHE_GRAFIK.info()
+    if info_grafik['hits'] + info_grafik['misses']:
+        st.caption(f"Grafik: {info_grafik['hits']}/{info_grafik['hits'] + info_grafik['misses']} hit "
+                   f"({info_grafik['hit_rate']:.0%}, {info_grafik['bytes'] / 2**10:,.0f} KB)")
+
+# Ekspor metrik ke file (textfile collector) jika SPK_METRICS_FILE diisi
+if METRIK.aktif:
+    METRIK.tulis_file()
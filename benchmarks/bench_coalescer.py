@@ -0,0 +1,87 @@
+"""
+Benchmark micro-batching (PenggabungSAW) vs hitung SAW per permintaan
+
+Mensimulasikan banyak permintaan satu siswa yang datang bersamaan di satu
+event loop asyncio, seperti di utils/api_server.py.
+
+Jalankan dari root project:
+    python -m benchmarks.bench_coalescer
+    python -m benchmarks.bench_coalescer --ukuran 5 500 --bersamaan 1 16 256
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.katalog_sintetis import buat_jurusan_sintetis
+from data.jurusan_data import BOBOT_KRITERIA, kompilasi_katalog
+from utils.saw_calculator import hitung_saw_ringkas
+from utils.saw_coalescer import MAKS_BATCH_DEFAULT, PenggabungSAW
+
+UKURAN_KATALOG = [5, 50, 500]
+BERSAMAAN = [1, 16, 64, 256]
+
+
+def buat_siswa(jumlah, seed=0):
+    """Input siswa acak (hampir semuanya unik)"""
+    acak = random.Random(seed)
+    return [(round(acak.uniform(50, 100), 1), acak.choice(['IPA', 'IPS', 'Seni']),
+             acak.choice(['Rendah', 'Sedang', 'Tinggi']), round(acak.uniform(0, 100), 1))
+            for _ in range(jumlah)]
+
+
+async def jalankan(hitung, siswa, bersamaan):
+    """Setiap 'klien' mengirim permintaan berurutan, 'bersamaan' klien sekaligus"""
+    async def klien(bagian):
+        for s in bagian:
+            await hitung(*s)
+    
+    await asyncio.gather(*[klien(siswa[i::bersamaan]) for i in range(bersamaan)])
+
+
+def ukur(hitung, siswa, bersamaan):
+    """Permintaan per detik"""
+    mulai = time.perf_counter()
+    asyncio.run(jalankan(hitung, siswa, bersamaan))
+    return len(siswa) / (time.perf_counter() - mulai)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark micro-batching hitung SAW")
+    parser.add_argument('--ukuran', type=int, nargs='+', default=UKURAN_KATALOG,
+                        help="Ukuran katalog yang diuji")
+    parser.add_argument('--bersamaan', type=int, nargs='+', default=BERSAMAAN,
+                        help="Jumlah permintaan bersamaan yang diuji")
+    parser.add_argument('--permintaan', type=int, default=4000,
+                        help="Jumlah permintaan per pengukuran (default: 4000)")
+    parser.add_argument('--jendela-ms', type=float, default=0.0,
+                        help="Jendela batch dalam ms (default: 0)")
+    parser.add_argument('--maks-batch', type=int, default=MAKS_BATCH_DEFAULT,
+                        help=f"Ukuran batch maksimum (default: {MAKS_BATCH_DEFAULT})")
+    args = parser.parse_args()
+    
+    siswa = buat_siswa(args.permintaan)
+    
+    print(f"{'Jurusan':>8} | {'Bersamaan':>9} | {'Per permintaan':>14} | {'Batch':>12} | "
+          f"{'Speedup':>8} | {'Rata2 batch':>11}")
+    print("-" * 78)
+    
+    for ukuran in args.ukuran:
+        katalog = kompilasi_katalog(buat_jurusan_sintetis(ukuran))
+        
+        async def satu(*s):
+            return hitung_saw_ringkas(*s, katalog, BOBOT_KRITERIA)
+        
+        for bersamaan in args.bersamaan:
+            penggabung = PenggabungSAW(katalog, BOBOT_KRITERIA, jendela_ms=args.jendela_ms,
+                                       maks_batch=args.maks_batch)
+            tunggal = ukur(satu, siswa, bersamaan)
+            batch = ukur(penggabung.hitung, siswa, bersamaan)
+            rata = penggabung.statistik()['rata_rata_batch']
+            print(f"{ukuran:>8} | {bersamaan:>9} | {tunggal:>10,.0f}/dtk | {batch:>8,.0f}/dtk | "
+                  f"{batch / tunggal:>7.1f}x | {rata:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark throughput pembuatan PDF (laporan per detik)
+
+Selain jalur normal (TemplateLaporan dipakai ulang per proses), mode
+baseline membuat TemplateLaporan baru untuk setiap laporan: style dan
+konten statis dibangun ulang seperti sebelum template dipakai bersama.
+Keduanya dilaporkan beserta percepatannya.
+
+Jalankan dari root project:
+    python -m benchmarks.bench_pdf
+    python -m benchmarks.bench_pdf --durasi 5 --json pdf.json
+"""
+
+import argparse
+import json
+import time
+
+from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA, CONTOH_DATA_SISWA
+from utils.saw_calculator import hitung_saw
+from utils.pdf_generator import TemplateLaporan, generate_pdf_report, generate_simple_pdf
+
+
+def ukur_laporan_per_detik(fungsi, durasi):
+    """Panggil fungsi berulang selama durasi detik, kembalikan (laporan/detik, jumlah)"""
+    fungsi()  # pemanasan (import font, cache ReportLab)
+    jumlah = 0
+    mulai = time.perf_counter()
+    while True:
+        fungsi()
+        jumlah += 1
+        detik = time.perf_counter() - mulai
+        if detik >= durasi:
+            return jumlah / detik, jumlah
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark throughput PDF report")
+    parser.add_argument('--durasi', type=float, default=3.0,
+                        help="Lama pengukuran per fungsi dalam detik (default: 3)")
+    parser.add_argument('--json', default=None, help="Simpan hasil ke file JSON")
+    args = parser.parse_args()
+    
+    siswa = CONTOH_DATA_SISWA[0]
+    hasil, detail = hitung_saw(siswa['nilai_akademik'], siswa['minat'], siswa['ekonomi'],
+                               siswa['prospek_kerja'], JURUSAN_DATA, BOBOT_KRITERIA)
+    
+    kasus = {
+        'generate_pdf_report': lambda: generate_pdf_report(
+            siswa['nama'], siswa['nilai_akademik'], siswa['minat'], siswa['ekonomi'],
+            siswa['prospek_kerja'], hasil, detail, BOBOT_KRITERIA
+        ),
+        # Baseline: style & konten statis dibangun ulang setiap laporan
+        'baseline_pdf_report': lambda: TemplateLaporan().render(
+            siswa['nama'], siswa['nilai_akademik'], siswa['minat'], siswa['ekonomi'],
+            siswa['prospek_kerja'], hasil, detail, BOBOT_KRITERIA
+        ),
+        'generate_simple_pdf': lambda: generate_simple_pdf(
+            siswa['nama'], hasil[0]['Jurusan'], hasil[0]['Nilai SAW']
+        ),
+    }
+    
+    ringkasan = {}
+    print(f"{'Fungsi':<22} | {'Laporan/detik':>14} | {'ms/laporan':>10}")
+    print("-" * 54)
+    for nama, fungsi in kasus.items():
+        per_detik, jumlah = ukur_laporan_per_detik(fungsi, args.durasi)
+        ringkasan[nama] = {'laporan_per_detik': per_detik, 'jumlah': jumlah}
+        print(f"{nama:<22} | {per_detik:>14.1f} | {1e3 / per_detik:>10.2f}")
+    
+    percepatan = (ringkasan['generate_pdf_report']['laporan_per_detik']
+                  / ringkasan['baseline_pdf_report']['laporan_per_detik'])
+    ringkasan['percepatan_template'] = percepatan
+    print(f"\nTemplate dipakai ulang vs baseline: {percepatan:.2f}x")
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(ringkasan, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
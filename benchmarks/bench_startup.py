@@ -0,0 +1,169 @@
+"""
+Benchmark waktu startup app.py (cold start)
+
+Setiap pengukuran dijalankan di proses Python baru supaya cache modul
+(sys.modules) tidak ikut terhitung:
+    - import top-level app.py (dibaca otomatis dari app.py dengan ast,
+      jadi import berat yang dipindah kembali ke atas langsung terlihat)
+    - import masing-masing library berat (pandas, matplotlib, reportlab)
+    - jalur hasil pertama: import + hitung SAW + DataFrame + grafik + PDF
+    - render pertama & render setelah submit lewat streamlit.testing
+      (dilewati jika streamlit tidak terpasang)
+
+Jalankan dari root project:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --json startup.json --batas-ms 500
+"""
+
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PATH_APP = os.path.join(ROOT, 'app.py')
+
+LIBRARY_BERAT = {
+    'pandas': 'import pandas',
+    'matplotlib (Figure + Agg)': 'import matplotlib.figure, matplotlib.backends.backend_agg',
+    'reportlab (utils.pdf_generator)': 'import utils.pdf_generator',
+}
+
+KODE_JALUR_HASIL = """
+from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA
+from utils.saw_cache import hitung_saw_cached
+hasil, detail = hitung_saw_cached(85, 'IPA', 'Sedang', 90, JURUSAN_DATA, BOBOT_KRITERIA)
+import pandas as pd
+pd.DataFrame(hasil).to_csv(index=False)
+pd.DataFrame(detail).to_csv(index=False)
+from utils.chart_service import render_grafik_png
+render_grafik_png([h['Jurusan'] for h in hasil], [h['Nilai SAW'] for h in hasil])
+from utils.pdf_generator import generate_pdf_report
+generate_pdf_report('Benchmark', 85, 'IPA', 'Sedang', 90, hasil, detail, BOBOT_KRITERIA)
+"""
+
+KODE_RENDER_STREAMLIT = """
+import time
+mulai = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({path!r}, default_timeout=120).run()
+render_pertama = time.perf_counter() - mulai
+at.text_input[0].input('Benchmark')
+at.number_input[0].set_value(85.0)
+at.selectbox[0].select('IPA')
+at.selectbox[1].select('Sedang')
+mulai = time.perf_counter()
+at.button[0].click().run()
+render_hasil = time.perf_counter() - mulai
+print(render_pertama, render_hasil)
+"""
+
+
+def import_top_level(path):
+    """
+    Daftar statement import di level modul (bukan di dalam blok/fungsi)
+    
+    Args:
+        path (str): Path file Python
+    
+    Returns:
+        list: Baris import, contoh ['import streamlit as st', ...]
+    """
+    with open(path, encoding='utf-8') as f:
+        sumber = f.read()
+    pohon = ast.parse(sumber, filename=path)
+    return [ast.get_source_segment(sumber, node) for node in pohon.body
+            if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def jalankan_terukur(kode, ulang):
+    """
+    Jalankan kode di proses baru beberapa kali, kembalikan median waktu (detik)
+    
+    Waktu diukur di dalam proses anak (tanpa waktu start interpreter).
+    """
+    bungkus = (
+        "import time\n"
+        "_mulai = time.perf_counter()\n"
+        f"{kode}\n"
+        "print(time.perf_counter() - _mulai)\n"
+    )
+    hasil = []
+    for _ in range(ulang):
+        keluaran = subprocess.run(
+            [sys.executable, '-c', bungkus], cwd=ROOT, check=True,
+            capture_output=True, text=True
+        ).stdout
+        hasil.append(float(keluaran.split()[-1]))
+    return statistics.median(hasil)
+
+
+def ukur_render_streamlit(ulang):
+    """Median (render_pertama, render_hasil) dalam detik, None jika streamlit tidak ada"""
+    if importlib.util.find_spec('streamlit') is None:
+        return None
+    hasil = []
+    for _ in range(ulang):
+        keluaran = subprocess.run(
+            [sys.executable, '-c', KODE_RENDER_STREAMLIT.format(path=PATH_APP)],
+            cwd=ROOT, check=True, capture_output=True, text=True
+        ).stdout
+        hasil.append([float(x) for x in keluaran.split()[-2:]])
+    return tuple(statistics.median(kolom) for kolom in zip(*hasil))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark waktu startup app.py")
+    parser.add_argument('--ulang', type=int, default=5,
+                        help="Jumlah proses baru per pengukuran (default: 5)")
+    parser.add_argument('--json', default=None, help="Simpan hasil ke file JSON")
+    parser.add_argument('--batas-ms', type=float, default=None,
+                        help="Gagal (exit 1) jika import top-level app.py melebihi batas ini")
+    args = parser.parse_args()
+    
+    hasil = {}
+    imports = import_top_level(PATH_APP)
+    streamlit_ada = importlib.util.find_spec('streamlit') is not None
+    if not streamlit_ada:
+        # Streamlit tidak ikut diukur jika tidak terpasang
+        imports = [baris for baris in imports if 'streamlit' not in baris]
+    
+    print("Import top-level app.py:")
+    for baris in imports:
+        print(f"    {baris}")
+    hasil['import_app'] = jalankan_terukur("\n".join(imports), args.ulang)
+    
+    for nama, kode in LIBRARY_BERAT.items():
+        hasil[f'import {nama}'] = jalankan_terukur(kode, args.ulang)
+    
+    hasil['jalur_hasil_pertama'] = jalankan_terukur(KODE_JALUR_HASIL, args.ulang)
+    
+    render = ukur_render_streamlit(args.ulang)
+    if render is not None:
+        hasil['render_pertama'], hasil['render_setelah_submit'] = render
+    
+    print()
+    print(f"{'Pengukuran':<40} | {'Median':>10}")
+    print("-" * 55)
+    for nama, detik in hasil.items():
+        print(f"{nama:<40} | {detik * 1e3:>7.1f} ms")
+    if render is None:
+        print(f"{'render streamlit':<40} | {'dilewati (streamlit tidak terpasang)'}")
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'streamlit': streamlit_ada, 'ulang': args.ulang,
+                       'detik': hasil}, f, indent=2)
+    
+    if args.batas_ms is not None and hasil['import_app'] * 1e3 > args.batas_ms:
+        print(f"❌ Import app.py {hasil['import_app'] * 1e3:.1f} ms melebihi batas "
+              f"{args.batas_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
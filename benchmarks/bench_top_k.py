@@ -0,0 +1,91 @@
+"""
+Benchmark mode top_k vs sort penuh
+
+Tiga lapisan diukur terpisah supaya percepatan partial selection tidak
+tercampur dengan biaya lain:
+    seleksi   urutkan_ranking pada satu baris nilai SAW (sort vs top_k saja)
+    ringkas   hitung_saw_ringkas (perhitungan R + seleksi, tanpa dict)
+    dict      hitung_saw end-to-end; pada sort penuh sebagian besar waktunya
+              adalah membuat dictionary untuk setiap jurusan (to_list)
+
+Untuk katalog kecil (lihat _BATAS_SORT_PENUH di utils/saw_calculator.py)
+top_k memakai sort penuh juga, sehingga bisa sedikit lebih lambat karena
+overhead validasi dan slicing; angka di bawah 1.0x dilaporkan apa adanya.
+
+Jalankan dari root project:
+    python -m benchmarks.bench_top_k
+    python -m benchmarks.bench_top_k --k 10 --ukuran 5 500 50000
+"""
+
+import argparse
+import timeit
+
+from benchmarks.katalog_sintetis import buat_jurusan_sintetis
+from data.jurusan_data import BOBOT_KRITERIA, kompilasi_katalog
+from utils.saw_calculator import (
+    hitung_saw, hitung_saw_batch, hitung_saw_ringkas, urutkan_ranking
+)
+
+UKURAN_KATALOG = [5, 50, 500, 5000, 50000]
+
+
+def ukur(fungsi, durasi_min=0.2):
+    """Jalankan fungsi berulang dan kembalikan waktu rata-rata per panggilan (detik)"""
+    timer = timeit.Timer(fungsi)
+    jumlah, total = timer.autorange()
+    while total < durasi_min:
+        jumlah *= 2
+        total = timer.timeit(jumlah)
+    return total / jumlah
+
+
+def format_waktu(detik):
+    """Waktu per panggilan dalam satuan yang mudah dibaca"""
+    if detik < 1e-3:
+        return f"{detik * 1e6:>9.1f} µs"
+    return f"{detik * 1e3:>9.3f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark top_k vs sort penuh")
+    parser.add_argument('--k', type=int, default=3, help="Jumlah jurusan terbaik (default: 3)")
+    parser.add_argument('--ukuran', type=int, nargs='+', default=UKURAN_KATALOG,
+                        help="Ukuran katalog yang diuji")
+    args = parser.parse_args()
+    
+    print(f"{'Jurusan':>8} | {'Lapisan':<8} | {'Sort penuh':>12} | {f'top_k={args.k}':>12} | "
+          f"{'Speedup':>8}")
+    print("-" * 61)
+    
+    for ukuran in args.ukuran:
+        katalog = kompilasi_katalog(buat_jurusan_sintetis(ukuran))
+        # Nilai SAW urut katalog (belum di-ranking), satu siswa
+        _, baris, _ = hitung_saw_batch([85], ['IPA'], ['Sedang'], [90], katalog, BOBOT_KRITERIA,
+                                       top_k=1)
+        
+        kasus = {
+            'seleksi': (
+                lambda: urutkan_ranking(baris),
+                lambda: urutkan_ranking(baris, args.k)
+            ),
+            'ringkas': (
+                lambda: hitung_saw_ringkas(85, 'IPA', 'Sedang', 90, katalog, BOBOT_KRITERIA),
+                lambda: hitung_saw_ringkas(85, 'IPA', 'Sedang', 90, katalog, BOBOT_KRITERIA,
+                                           top_k=args.k)
+            ),
+            'dict': (
+                lambda: hitung_saw(85, 'IPA', 'Sedang', 90, katalog, BOBOT_KRITERIA),
+                lambda: hitung_saw(85, 'IPA', 'Sedang', 90, katalog, BOBOT_KRITERIA,
+                                   top_k=args.k)
+            ),
+        }
+        
+        for lapisan, (fungsi_penuh, fungsi_parsial) in kasus.items():
+            penuh = ukur(fungsi_penuh)
+            parsial = ukur(fungsi_parsial)
+            print(f"{ukuran:>8} | {lapisan:<8} | {format_waktu(penuh)} | {format_waktu(parsial)} | "
+                  f"{penuh / parsial:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Generator data sintetis untuk benchmark
+Membuat katalog jurusan dan data siswa acak dengan format yang sama
+seperti JURUSAN_DATA dan CONTOH_DATA_SISWA
+"""
+
+import numpy as np
+
+from data.jurusan_data import JURUSAN_DATA, BIAYA_JURUSAN_MAP, EKONOMI_SISWA_MAP
+
+PILIHAN_MINAT = ['IPA', 'IPS', 'Seni']
+
+
+def buat_jurusan_sintetis(jumlah, seed=0):
+    """
+    Buat katalog jurusan sintetis
+    
+    Args:
+        jumlah (int): Jumlah jurusan
+        seed (int): Seed random agar hasil bisa diulang
+    
+    Returns:
+        dict: Data jurusan dengan format seperti JURUSAN_DATA
+    """
+    if jumlah <= len(JURUSAN_DATA):
+        return dict(list(JURUSAN_DATA.items())[:jumlah])
+    
+    rng = np.random.default_rng(seed)
+    standar = rng.integers(60, 96, jumlah).tolist()
+    minat = rng.integers(0, len(PILIHAN_MINAT), jumlah).tolist()
+    biaya = rng.integers(0, len(BIAYA_JURUSAN_MAP), jumlah).tolist()
+    prospek = rng.integers(50, 100, jumlah).tolist()
+    kategori_biaya = list(BIAYA_JURUSAN_MAP.keys())
+    
+    return {
+        f'S{i:06d}': {
+            'nama': f'Jurusan Sintetis {i}',
+            'nilai_standar': standar[i],
+            'minat': PILIHAN_MINAT[minat[i]],
+            'biaya': kategori_biaya[biaya[i]],
+            'prospek': prospek[i]
+        }
+        for i in range(jumlah)
+    }
+
+
+def buat_siswa_sintetis(jumlah, seed=0):
+    """
+    Buat data siswa sintetis dalam bentuk kolom
+    
+    Args:
+        jumlah (int): Jumlah siswa
+        seed (int): Seed random agar hasil bisa diulang
+    
+    Returns:
+        dict: Kolom 'nilai_akademik', 'minat', 'ekonomi', 'prospek_kerja'
+    """
+    rng = np.random.default_rng(seed)
+    return {
+        'nilai_akademik': np.round(rng.uniform(50, 100, jumlah), 1),
+        'minat': np.array(PILIHAN_MINAT)[rng.integers(0, len(PILIHAN_MINAT), jumlah)],
+        'ekonomi': np.array(list(EKONOMI_SISWA_MAP.keys()))[
+            rng.integers(0, len(EKONOMI_SISWA_MAP), jumlah)
+        ],
+        'prospek_kerja': rng.integers(0, 101, jumlah).astype(np.float64)
+    }
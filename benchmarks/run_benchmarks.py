@@ -0,0 +1,268 @@
+"""
+Suite benchmark jalur utama SPK (perhitungan, laporan, grafik)
+
+Mengukur waktu per panggilan untuk:
+    - hitung_saw (skalar, sort penuh & top_k) dan hitung_saw_ringkas
+    - hitung_saw_batch / hitung_saw_batch_ringkas untuk satu angkatan
+    - validasi_input dan format_hasil
+    - generate_pdf_report dan generate_simple_pdf
+    - grafik: render PNG (tanpa cache), cache hit, dan figure Plotly
+dengan ukuran katalog dari 5 jurusan (JURUSAN_DATA) sampai katalog sintetis
+50.000 jurusan, dan ukuran angkatan dari 1 sampai 1.000.000 siswa.
+
+Hasil bisa disimpan sebagai JSON dan dibandingkan dengan hasil commit lain;
+exit code 1 jika ada kasus yang melambat melebihi ambang.
+
+Jalankan dari root project:
+    python -m benchmarks.run_benchmarks                      # profil cepat
+    python -m benchmarks.run_benchmarks --profil lengkap --json hasil.json
+    python -m benchmarks.run_benchmarks --baseline main.json --ambang 0.2
+    python -m benchmarks.run_benchmarks --filter pdf --filter grafik
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+from datetime import datetime
+
+import numpy as np
+
+from benchmarks.katalog_sintetis import buat_jurusan_sintetis, buat_siswa_sintetis
+from data.jurusan_data import BOBOT_KRITERIA, kompilasi_katalog
+from utils.saw_calculator import (
+    format_hasil, hitung_saw, hitung_saw_batch, hitung_saw_batch_ringkas,
+    hitung_saw_ringkas, validasi_input
+)
+
+# maks_elemen: kasus batch dengan siswa x jurusan di atas batas ini dilewati
+# (1 juta siswa x 50.000 jurusan = 5e10 elemen, butuh puluhan menit)
+PROFIL = {
+    'cepat': {'katalog': [5, 500, 5000], 'kohort': [1, 1000, 100000],
+              'maks_elemen': 10**7},
+    'lengkap': {'katalog': [5, 50, 500, 5000, 50000], 'kohort': [1, 100, 10000, 1000000],
+                'maks_elemen': 5 * 10**8},
+}
+
+TOP_K = 10
+
+# Batas siswa x jurusan per chunk batch (memori ~10 array float64 sebesar ini)
+ELEMEN_PER_CHUNK = 2 * 10**6
+
+# PDF & grafik untuk katalog besar tidak realistis (ratusan halaman / label)
+BATAS_KATALOG_PDF = 500
+BATAS_KATALOG_GRAFIK = 50
+
+
+def ukur(fungsi, durasi_min=0.2, ulang=3):
+    """
+    Median waktu per panggilan (detik) dari beberapa pengulangan
+    
+    Setiap pengulangan memanggil fungsi sebanyak mungkin sampai minimal
+    durasi_min detik (seperti timeit.autorange).
+    """
+    timer = timeit.Timer(fungsi)
+    fungsi()  # pemanasan (import lazy, cache katalog)
+    hasil = []
+    jumlah = None
+    for _ in range(ulang):
+        if jumlah is None:
+            jumlah, total = timer.autorange()
+            while total < durasi_min:
+                jumlah *= 2
+                total = timer.timeit(jumlah)
+        else:
+            total = timer.timeit(jumlah)
+        hasil.append(total / jumlah)
+    return statistics.median(hasil)
+
+
+def skor_kohort(siswa, katalog, top_k=None, ringkas=False):
+    """Hitung SAW satu angkatan per chunk (memori dibatasi ELEMEN_PER_CHUNK)"""
+    n = len(siswa['nilai_akademik'])
+    ukuran_chunk = max(1, ELEMEN_PER_CHUNK // len(katalog))
+    fungsi = hitung_saw_batch_ringkas if ringkas else hitung_saw_batch
+    for awal in range(0, n, ukuran_chunk):
+        potong = slice(awal, awal + ukuran_chunk)
+        fungsi(siswa['nilai_akademik'][potong], siswa['minat'][potong],
+               siswa['ekonomi'][potong], siswa['prospek_kerja'][potong],
+               katalog, BOBOT_KRITERIA, top_k=top_k)
+
+
+def daftar_kasus(ukuran_katalog, ukuran_kohort, maks_elemen):
+    """
+    Semua kasus benchmark
+    
+    Yields:
+        tuple: (id_kasus, fungsi_tanpa_argumen, jumlah_item_per_panggilan)
+            id_kasus berbentuk 'nama[param=nilai,...]' dan stabil antar
+            commit sehingga bisa dibandingkan dengan baseline
+    """
+    from utils.chart_service import CacheGrafik, _render_png, buat_grafik_plotly
+    from utils.pdf_generator import generate_pdf_report, generate_simple_pdf
+    
+    yield ('validasi_input[valid]',
+           lambda: validasi_input(85, 'IPA', 'Sedang', 90), 1)
+    yield ('validasi_input[tidak_valid]',
+           lambda: validasi_input(120, 'Bahasa', 'Kaya', -5), 1)
+    yield ('generate_simple_pdf',
+           lambda: generate_simple_pdf('Benchmark', 'Teknik Informatika', 0.9123), 1)
+    
+    for m in ukuran_katalog:
+        katalog = kompilasi_katalog(buat_jurusan_sintetis(m))
+        hasil, detail = hitung_saw(85, 'IPA', 'Sedang', 90, katalog, BOBOT_KRITERIA)
+        
+        yield (f'hitung_saw[katalog={m}]',
+               lambda: hitung_saw(85, 'IPA', 'Sedang', 90, katalog, BOBOT_KRITERIA), 1)
+        yield (f'hitung_saw[katalog={m},top_k={TOP_K}]',
+               lambda: hitung_saw(85, 'IPA', 'Sedang', 90, katalog, BOBOT_KRITERIA,
+                                  top_k=TOP_K), 1)
+        yield (f'hitung_saw_ringkas[katalog={m}]',
+               lambda: hitung_saw_ringkas(85, 'IPA', 'Sedang', 90, katalog, BOBOT_KRITERIA), 1)
+        yield (f'format_hasil[katalog={m}]',
+               lambda: format_hasil(hasil, 'Benchmark'), 1)
+        
+        if m <= BATAS_KATALOG_PDF:
+            yield (f'generate_pdf_report[katalog={m}]',
+                   lambda: generate_pdf_report('Benchmark', 85, 'IPA', 'Sedang', 90,
+                                               hasil, detail, BOBOT_KRITERIA), 1)
+        
+        if m <= BATAS_KATALOG_GRAFIK:
+            label = tuple(h['Jurusan'] for h in hasil)
+            nilai = tuple(h['Nilai SAW'] for h in hasil)
+            cache = CacheGrafik()
+            yield (f'grafik_png[katalog={m}]', lambda: _render_png(label, nilai, 150), 1)
+            yield (f'grafik_png_cache_hit[katalog={m}]',
+                   lambda: cache.render_png(label, nilai), 1)
+            yield (f'grafik_plotly[katalog={m}]', lambda: buat_grafik_plotly(label, nilai), 1)
+        
+        for n in ukuran_kohort:
+            if n * m > maks_elemen:
+                continue
+            siswa = buat_siswa_sintetis(n)
+            yield (f'hitung_saw_batch[katalog={m},kohort={n}]',
+                   lambda: skor_kohort(siswa, katalog), n)
+            yield (f'hitung_saw_batch_ringkas[katalog={m},kohort={n},top_k={TOP_K}]',
+                   lambda: skor_kohort(siswa, katalog, top_k=TOP_K, ringkas=True), n)
+
+
+def info_lingkungan():
+    """Versi Python/NumPy, platform, dan commit git (jika ada)"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'waktu': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+    }
+
+
+def bandingkan(hasil, baseline, ambang):
+    """
+    Bandingkan hasil dengan baseline
+    
+    Args:
+        hasil (dict): id_kasus -> data kasus (hasil run ini)
+        baseline (dict): Isi 'hasil' dari file JSON baseline
+        ambang (float): Batas perlambatan relatif, 0.2 = 20% lebih lambat
+    
+    Returns:
+        list: (id_kasus, detik_lama, detik_baru, rasio) yang melebihi ambang
+    """
+    regresi = []
+    print()
+    print(f"{'Kasus':<62} | {'Baseline':>10} | {'Sekarang':>10} | {'Perubahan':>9}")
+    print("-" * 100)
+    for id_kasus, data in hasil.items():
+        lama = baseline.get(id_kasus)
+        if lama is None:
+            continue
+        rasio = data['detik'] / lama['detik']
+        tanda = ''
+        if rasio > 1 + ambang:
+            regresi.append((id_kasus, lama['detik'], data['detik'], rasio))
+            tanda = ' ❌'
+        print(f"{id_kasus:<62} | {format_waktu(lama['detik']):>10} | "
+              f"{format_waktu(data['detik']):>10} | {(rasio - 1) * 100:>+8.1f}%{tanda}")
+    return regresi
+
+
+def format_waktu(detik):
+    """Waktu dengan satuan yang sesuai (µs / ms / s)"""
+    if detik < 1e-3:
+        return f"{detik * 1e6:.1f} µs"
+    if detik < 1:
+        return f"{detik * 1e3:.2f} ms"
+    return f"{detik:.2f} s"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Suite benchmark SPK Jurusan")
+    parser.add_argument('--profil', choices=sorted(PROFIL), default='cepat',
+                        help="Ukuran katalog & angkatan yang diuji (default: cepat)")
+    parser.add_argument('--katalog', type=int, nargs='+', default=None,
+                        help="Ukuran katalog (menimpa profil)")
+    parser.add_argument('--kohort', type=int, nargs='+', default=None,
+                        help="Ukuran angkatan (menimpa profil)")
+    parser.add_argument('--maks-elemen', type=int, default=None,
+                        help="Lewati kasus batch dengan siswa x jurusan di atas batas ini "
+                             "(menimpa profil)")
+    parser.add_argument('--filter', action='append', default=None,
+                        help="Hanya jalankan kasus yang id-nya mengandung teks ini (bisa berulang)")
+    parser.add_argument('--durasi-min', type=float, default=0.2,
+                        help="Durasi minimum satu pengulangan dalam detik (default: 0.2)")
+    parser.add_argument('--ulang', type=int, default=3,
+                        help="Jumlah pengulangan, median yang dipakai (default: 3)")
+    parser.add_argument('--json', default=None, help="Simpan hasil ke file JSON")
+    parser.add_argument('--baseline', default=None, help="File JSON hasil run sebelumnya")
+    parser.add_argument('--ambang', type=float, default=0.2,
+                        help="Gagal jika lebih lambat dari baseline melebihi rasio ini (default: 0.2)")
+    args = parser.parse_args(argv)
+    
+    ukuran_katalog = args.katalog or PROFIL[args.profil]['katalog']
+    ukuran_kohort = args.kohort or PROFIL[args.profil]['kohort']
+    maks_elemen = args.maks_elemen or PROFIL[args.profil]['maks_elemen']
+    
+    hasil = {}
+    print(f"{'Kasus':<62} | {'Per panggilan':>13} | {'Item/detik':>14}")
+    print("-" * 96)
+    mulai = time.perf_counter()
+    for id_kasus, fungsi, item in daftar_kasus(ukuran_katalog, ukuran_kohort, maks_elemen):
+        if args.filter and not any(f in id_kasus for f in args.filter):
+            continue
+        detik = ukur(fungsi, args.durasi_min, args.ulang)
+        hasil[id_kasus] = {'detik': detik, 'item': item, 'item_per_detik': item / detik}
+        print(f"{id_kasus:<62} | {format_waktu(detik):>13} | {item / detik:>14,.0f}", flush=True)
+    print(f"\n{len(hasil)} kasus dalam {time.perf_counter() - mulai:.1f} detik")
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({
+                'lingkungan': info_lingkungan(),
+                'parameter': {'katalog': ukuran_katalog, 'kohort': ukuran_kohort,
+                              'maks_elemen': maks_elemen, 'top_k': TOP_K, 'ulang': args.ulang,
+                              'durasi_min': args.durasi_min},
+                'hasil': hasil
+            }, f, indent=2, ensure_ascii=False)
+    
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)['hasil']
+        regresi = bandingkan(hasil, baseline, args.ambang)
+        if regresi:
+            print(f"\n❌ {len(regresi)} kasus melambat lebih dari {args.ambang:.0%} dibanding baseline")
+            sys.exit(1)
+        print(f"\n✅ Tidak ada kasus yang melambat lebih dari {args.ambang:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,12 @@ Data Master Jurusan dan Bobot Kriteria
 File ini berisi semua data statis yang digunakan dalam aplikasi SPK
 """
 
+import hashlib
+import os
+from collections.abc import Mapping
+
+import numpy as np
+
 # ========================================
 # DATA JURUSAN (ALTERNATIF)
 # ========================================
@@ -55,6 +61,9 @@ BOBOT_KRITERIA = {
     'prospek_kerja': 0.15     # 15%
 }
 
+# Urutan kriteria pada sumbu terakhir matriks R (R1, R2, R3, R4)
+URUTAN_KRITERIA = ('nilai_akademik', 'minat', 'ekonomi', 'prospek_kerja')
+
 # ========================================
 # MAPPING NILAI EKONOMI
 # ========================================
@@ -90,26 +99,36 @@ def validasi_bobot():
         raise ValueError(f"Total bobot kriteria harus 1.0, saat ini: {total}")
     return True
 
-def get_info_jurusan(kode_jurusan):
+def get_info_jurusan(kode_jurusan, katalog=None):
     """
     Mendapatkan informasi lengkap suatu jurusan berdasarkan kode
     
     Args:
         kode_jurusan (str): Kode jurusan (contoh: 'A1')
+        katalog (KatalogJurusan | str, optional): Katalog lain, misalnya
+            katalog biner dari muat_katalog_biner() atau path file-nya.
+            Default: JURUSAN_DATA
     
     Returns:
         dict: Informasi lengkap jurusan atau None jika tidak ditemukan
     """
-    return JURUSAN_DATA.get(kode_jurusan, None)
+    if katalog is None:
+        return JURUSAN_DATA.get(kode_jurusan, None)
+    return get_katalog(katalog).info(kode_jurusan)
 
-def get_semua_nama_jurusan():
+def get_semua_nama_jurusan(katalog=None):
     """
     Mendapatkan list semua nama jurusan yang tersedia
     
+    Args:
+        katalog (KatalogJurusan | str, optional): Katalog lain (default: JURUSAN_DATA)
+    
     Returns:
         list: List nama jurusan
     """
-    return [data['nama'] for data in JURUSAN_DATA.values()]
+    if katalog is None:
+        return [data['nama'] for data in JURUSAN_DATA.values()]
+    return get_katalog(katalog).nama.tolist()
 
 # ========================================
 # INFORMASI KRITERIA
@@ -141,6 +160,347 @@ KETERANGAN_KRITERIA = {
     }
 }
 
+# ========================================
+# KATALOG TERKOMPILASI (MATRIKS KEPUTUSAN)
+# ========================================
+class TabelString:
+    """
+    Kolom string read-only di atas buffer UTF-8 + offset (tanpa objek per baris)
+    
+    Dipakai katalog biner: teks ke-i = data[offset[i]:offset[i+1]], baru
+    di-decode saat diakses. Indexing mengikuti np.ndarray: integer
+    menghasilkan str, array indeks/slice menghasilkan np.ndarray object.
+    
+    Args:
+        offset (np.ndarray): int64 (M+1,)
+        data (np.ndarray): uint8, semua teks disambung
+        urutan (np.ndarray, optional): Permutasi int32 yang mengurutkan teks
+            (byte UTF-8) secara ascending, untuk pencarian biner
+    """
+    
+    __slots__ = ('offset', 'data', 'urutan')
+    
+    def __init__(self, offset, data, urutan=None):
+        self.offset = offset
+        self.data = data
+        self.urutan = urutan
+    
+    def __reduce__(self):
+        return (type(self), (self.offset, self.data, self.urutan))
+    
+    def __len__(self):
+        return len(self.offset) - 1
+    
+    def _bytes(self, i):
+        return self.data[self.offset[i]:self.offset[i + 1]].tobytes()
+    
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            if i < 0:
+                i += len(self)
+            if not 0 <= i < len(self):
+                raise IndexError(i)
+            return self._bytes(i).decode('utf-8')
+        
+        if isinstance(i, slice):
+            indeks = np.arange(*i.indices(len(self)))
+        else:
+            indeks = np.asarray(i)
+            indeks = np.where(indeks < 0, indeks + len(self), indeks)
+        hasil = np.empty(indeks.shape, dtype=object)
+        for posisi, j in np.ndenumerate(indeks):
+            hasil[posisi] = self._bytes(j).decode('utf-8')
+        return hasil
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    def tolist(self):
+        data = self.data.tobytes()
+        offset = self.offset.tolist()
+        return [data[a:b].decode('utf-8') for a, b in zip(offset[:-1], offset[1:])]
+    
+    def cari(self, teks):
+        """
+        Posisi teks di kolom (pencarian biner jika urutan tersedia)
+        
+        Returns:
+            int | None: Posisi baris, None jika tidak ada
+        """
+        target = teks.encode('utf-8')
+        if self.urutan is None:
+            for i in range(len(self)):
+                if self._bytes(i) == target:
+                    return i
+            return None
+        
+        bawah, atas = 0, len(self.urutan)
+        while bawah < atas:
+            tengah = (bawah + atas) // 2
+            if self._bytes(self.urutan[tengah]) < target:
+                bawah = tengah + 1
+            else:
+                atas = tengah
+        if bawah < len(self.urutan) and self._bytes(self.urutan[bawah]) == target:
+            return int(self.urutan[bawah])
+        return None
+    
+    def __repr__(self):
+        return f"TabelString({len(self)} baris)"
+
+
+class IndeksString(Mapping):
+    """Mapping teks -> posisi di atas TabelString (pengganti dict indeks_kode)"""
+    
+    __slots__ = ('tabel',)
+    
+    def __init__(self, tabel):
+        self.tabel = tabel
+    
+    def __getitem__(self, teks):
+        posisi = self.tabel.cari(teks) if isinstance(teks, str) else None
+        if posisi is None:
+            raise KeyError(teks)
+        return posisi
+    
+    def __iter__(self):
+        return iter(self.tabel)
+    
+    def __len__(self):
+        return len(self.tabel)
+
+
+class KatalogJurusan:
+    """
+    Matriks keputusan jurusan dalam bentuk array NumPy yang contiguous
+    
+    Dibangun sekali dari dictionary JURUSAN_DATA (atau dimuat dari file
+    katalog biner, lihat data/katalog_biner.py) sehingga perhitungan SAW
+    tidak perlu lagi membaca dictionary dan membandingkan string per jurusan.
+    Semua array bersifat read-only dan urutannya sama dengan urutan
+    jurusan pada dictionary sumber. kode dan nama berupa np.ndarray object,
+    atau TabelString untuk katalog biner.
+    
+    Attributes:
+        kode (np.ndarray): Kode jurusan (M,)
+        nama (np.ndarray): Nama jurusan (M,)
+        nilai_standar (np.ndarray): Nilai standar akademik (M,) float64
+        minat (np.ndarray): Kode integer minat jurusan (M,), indeks ke pilihan_minat
+        biaya_kategori (np.ndarray): Kode integer kategori biaya (M,),
+            indeks ke pilihan_biaya
+        biaya (np.ndarray): Nilai numerik biaya dari BIAYA_JURUSAN_MAP (M,) float64
+        prospek (np.ndarray): Prospek kerja (M,) float64
+        pilihan_minat (tuple): Daftar minat sesuai kode integer
+        pilihan_biaya (tuple): Daftar kategori biaya sesuai kode integer
+        indeks_kode (Mapping): Mapping kode jurusan -> posisi kolom
+        sidik (str): Hash isi katalog, berubah jika data jurusan berubah
+        sumber (str | None): Path file katalog biner jika dimuat dari file.
+            Katalog seperti ini di-pickle sebagai path, sehingga proses
+            worker membuka ulang file yang sama (halaman memori dipakai bersama)
+        tabel_kategori: Cache tabel R2/R3 per kategori, diisi oleh
+            engine SAW (utils.saw_calculator.get_tabel_kategori)
+    """
+    
+    __slots__ = (
+        'kode', 'nama', 'nilai_standar', 'minat', 'biaya_kategori',
+        'biaya', 'prospek', 'pilihan_minat', 'pilihan_biaya', 'indeks_kode',
+        'sidik', 'tabel_kategori', 'sumber'
+    )
+    
+    def __init__(self, kode, nama, nilai_standar, minat, biaya_kategori,
+                 biaya, prospek, pilihan_minat, pilihan_biaya, sidik=None, sumber=None):
+        self.kode = kode if isinstance(kode, TabelString) else _array_readonly(kode, dtype=object)
+        self.nama = nama if isinstance(nama, TabelString) else _array_readonly(nama, dtype=object)
+        self.nilai_standar = _array_readonly(nilai_standar, dtype=np.float64)
+        self.minat = _array_readonly(minat, dtype=np.int8)
+        self.biaya_kategori = _array_readonly(biaya_kategori, dtype=np.int8)
+        self.biaya = _array_readonly(biaya, dtype=np.float64)
+        self.prospek = _array_readonly(prospek, dtype=np.float64)
+        self.pilihan_minat = tuple(pilihan_minat)
+        self.pilihan_biaya = tuple(pilihan_biaya)
+        if isinstance(self.kode, TabelString):
+            self.indeks_kode = IndeksString(self.kode)
+        else:
+            self.indeks_kode = {k: i for i, k in enumerate(self.kode.tolist())}
+        self.sidik = self._hitung_sidik() if sidik is None else sidik
+        self.tabel_kategori = None
+        self.sumber = sumber
+    
+    def _hitung_sidik(self):
+        """Hash SHA-1 dari seluruh kolom katalog"""
+        h = hashlib.sha1()
+        for teks in (self.kode, self.nama):
+            h.update("\x1f".join(map(str, teks.tolist())).encode('utf-8'))
+            h.update(b"\x1e")
+        for kolom in (self.nilai_standar, self.minat, self.biaya_kategori,
+                      self.biaya, self.prospek):
+            h.update(kolom.tobytes())
+        h.update(repr((self.pilihan_minat, self.pilihan_biaya)).encode('utf-8'))
+        return h.hexdigest()
+    
+    def info(self, kode_jurusan):
+        """
+        Data satu jurusan dalam format dictionary JURUSAN_DATA
+        
+        Returns:
+            dict: nama, nilai_standar, minat, biaya, prospek (None jika tidak ada)
+        """
+        i = self.indeks_kode.get(kode_jurusan)
+        if i is None:
+            return None
+        return {
+            'nama': self.nama[i],
+            'nilai_standar': float(self.nilai_standar[i]),
+            'minat': self.pilihan_minat[self.minat[i]],
+            'biaya': self.pilihan_biaya[self.biaya_kategori[i]],
+            'prospek': float(self.prospek[i])
+        }
+    
+    def __len__(self):
+        return len(self.kode)
+    
+    def __reduce__(self):
+        # Katalog biner dibuka ulang dari file (memory-map yang sama);
+        # katalog di memori dibangun ulang dari kolomnya, indeks_kode dan
+        # tabel_kategori dibuat lagi oleh __init__ / get_tabel_kategori
+        if self.sumber is not None:
+            return (_buka_katalog_biner, (self.sumber,))
+        return (type(self), (
+            self.kode, self.nama, self.nilai_standar, self.minat, self.biaya_kategori,
+            self.biaya, self.prospek, self.pilihan_minat, self.pilihan_biaya, self.sidik
+        ))
+    
+    def __repr__(self):
+        if self.sumber is not None:
+            return f"KatalogJurusan({len(self)} jurusan, sumber={self.sumber!r})"
+        return f"KatalogJurusan({len(self)} jurusan)"
+
+
+def _array_readonly(nilai, dtype):
+    """Buat array contiguous yang tidak bisa diubah (aman dipakai bersama)"""
+    if isinstance(nilai, np.ndarray) and not nilai.flags.writeable \
+            and nilai.flags.c_contiguous and nilai.dtype == dtype:
+        # Sudah read-only (misalnya memory-map katalog biner), tanpa salinan
+        return nilai
+    arr = np.ascontiguousarray(np.array(nilai, dtype=dtype))
+    arr.setflags(write=False)
+    return arr
+
+
+def _daftar_pilihan(bawaan, nilai_katalog):
+    """Gabungkan pilihan bawaan dengan nilai lain yang muncul di katalog"""
+    pilihan = list(bawaan)
+    for nilai in nilai_katalog:
+        if nilai not in pilihan:
+            pilihan.append(nilai)
+    return pilihan
+
+
+def kompilasi_katalog(jurusan_data):
+    """
+    Kompilasi dictionary jurusan menjadi KatalogJurusan
+    
+    Args:
+        jurusan_data (dict): Data jurusan dengan format seperti JURUSAN_DATA
+    
+    Returns:
+        KatalogJurusan: Matriks keputusan terkompilasi
+    """
+    daftar = list(jurusan_data.values())
+    
+    pilihan_minat = _daftar_pilihan(
+        KETERANGAN_KRITERIA['minat']['pilihan'],
+        [d['minat'] for d in daftar]
+    )
+    pilihan_biaya = _daftar_pilihan(
+        BIAYA_JURUSAN_MAP.keys(),
+        [d['biaya'] for d in daftar]
+    )
+    indeks_minat = {m: i for i, m in enumerate(pilihan_minat)}
+    indeks_biaya = {b: i for i, b in enumerate(pilihan_biaya)}
+    
+    return KatalogJurusan(
+        kode=list(jurusan_data.keys()),
+        nama=[d['nama'] for d in daftar],
+        nilai_standar=[d['nilai_standar'] for d in daftar],
+        minat=[indeks_minat[d['minat']] for d in daftar],
+        biaya_kategori=[indeks_biaya[d['biaya']] for d in daftar],
+        biaya=[BIAYA_JURUSAN_MAP[d['biaya']] for d in daftar],
+        prospek=[d['prospek'] for d in daftar],
+        pilihan_minat=pilihan_minat,
+        pilihan_biaya=pilihan_biaya
+    )
+
+
+def _sidik_data():
+    """
+    Snapshot isi JURUSAN_DATA & BIAYA_JURUSAN_MAP untuk mendeteksi perubahan
+    
+    Jauh lebih murah daripada kompilasi ulang (beberapa mikrodetik untuk
+    JURUSAN_DATA bawaan), sehingga bisa diperiksa di setiap get_katalog.
+    """
+    return (
+        tuple((kode, tuple(data.items())) for kode, data in JURUSAN_DATA.items()),
+        tuple(BIAYA_JURUSAN_MAP.items())
+    )
+
+
+# Dibangun sekali saat import, dipakai ulang oleh semua jalur perhitungan
+# selama isi JURUSAN_DATA & BIAYA_JURUSAN_MAP tidak berubah
+KATALOG_JURUSAN = kompilasi_katalog(JURUSAN_DATA)
+_SIDIK_KATALOG = _sidik_data()
+
+
+def muat_ulang_katalog():
+    """
+    Bangun ulang KATALOG_JURUSAN dari isi JURUSAN_DATA & BIAYA_JURUSAN_MAP
+    
+    get_katalog(JURUSAN_DATA) sudah melakukannya otomatis saat isi data
+    berubah; fungsi ini untuk memaksa kompilasi ulang.
+    
+    Returns:
+        KatalogJurusan: Katalog baru
+    """
+    global KATALOG_JURUSAN, _SIDIK_KATALOG
+    sidik = _sidik_data()
+    KATALOG_JURUSAN = kompilasi_katalog(JURUSAN_DATA)
+    _SIDIK_KATALOG = sidik
+    return KATALOG_JURUSAN
+
+
+def get_katalog(jurusan_data):
+    """
+    Dapatkan KatalogJurusan untuk data jurusan yang diberikan
+    
+    JURUSAN_DATA memakai katalog yang sudah dibangun (dikompilasi ulang
+    otomatis jika isi JURUSAN_DATA atau BIAYA_JURUSAN_MAP diubah di
+    tempat), dictionary lain dikompilasi saat itu juga, dan path (str)
+    dibuka sebagai file katalog biner dengan memory-map.
+    
+    Args:
+        jurusan_data (dict | KatalogJurusan | str): Data jurusan, katalog,
+            atau path file katalog biner
+    
+    Returns:
+        KatalogJurusan: Katalog terkompilasi
+    """
+    if isinstance(jurusan_data, KatalogJurusan):
+        return jurusan_data
+    if jurusan_data is JURUSAN_DATA:
+        if _sidik_data() != _SIDIK_KATALOG:
+            return muat_ulang_katalog()
+        return KATALOG_JURUSAN
+    if isinstance(jurusan_data, (str, os.PathLike)):
+        return _buka_katalog_biner(jurusan_data)
+    return kompilasi_katalog(jurusan_data)
+
+
+def _buka_katalog_biner(path):
+    """muat_katalog_biner (import ditunda untuk menghindari import melingkar)"""
+    from data.katalog_biner import muat_katalog_biner
+    return muat_katalog_biner(path)
+
 # ========================================
 # CONTOH DATA TESTING
 # ========================================
@@ -0,0 +1,231 @@
+"""
+Format file katalog jurusan biner (memory-mapped)
+Untuk katalog besar (puluhan ribu jurusan) yang terlalu mahal jika disimpan
+sebagai dictionary Python. Semua kolom berada dalam satu file dan dibuka
+dengan satu memory-map read-only, sehingga beberapa proses di satu host
+memakai halaman memori yang sama dan waktu muat tidak bergantung pada
+jumlah jurusan.
+
+Layout file (little-endian):
+    0    magic 'SPKKATLG' (8 byte)
+    8    uint32 versi format
+    12   uint32 panjang meta (byte)
+    16   meta JSON UTF-8: jumlah jurusan, pilihan_minat, pilihan_biaya,
+         sidik katalog, dan posisi setiap kolom {nama: [offset, dtype, jumlah]}
+    ...  kolom, masing-masing dimulai di kelipatan 64 byte:
+         nilai_standar  float64 (M,)
+         biaya          float64 (M,)   nilai BIAYA_JURUSAN_MAP saat ditulis
+         prospek        float64 (M,)
+         minat          int8 (M,)      indeks ke pilihan_minat
+         biaya_kategori int8 (M,)      indeks ke pilihan_biaya
+         kode_offset    int64 (M+1,)   teks kode ke-i = kode_data[offset[i]:offset[i+1]]
+         kode_data      uint8          semua kode (UTF-8) disambung
+         kode_urut      int32 (M,)     permutasi kode terurut (pencarian biner)
+         nama_offset    int64 (M+1,)
+         nama_data      uint8
+
+Contoh:
+    tulis_katalog_biner('nasional.katalog', jurusan_data)
+    katalog = muat_katalog_biner('nasional.katalog')
+    hitung_saw(85, 'IPA', 'Sedang', 90, katalog, BOBOT_KRITERIA)
+
+Konversi dari CSV (kode,nama,nilai_standar,minat,biaya,prospek), dari root project:
+    python -m data.katalog_biner jurusan.csv -o nasional.katalog
+"""
+
+import argparse
+import csv
+import json
+import os
+import struct
+
+import numpy as np
+
+from data.jurusan_data import KatalogJurusan, TabelString, get_katalog
+
+VERSI_FORMAT = 1
+
+_MAGIC = b'SPKKATLG'
+_HEADER = struct.Struct('<8sII')
+_RATA = 64
+
+KOLOM_CSV = ('kode', 'nama', 'nilai_standar', 'minat', 'biaya', 'prospek')
+
+# Katalog yang sudah dibuka per proses: (path, mtime, ukuran) -> KatalogJurusan
+_KATALOG_TERBUKA = {}
+
+
+def _tabel_string(daftar_teks):
+    """Encode list teks menjadi (offset int64, data uint8, encoded)"""
+    encoded = [str(t).encode('utf-8') for t in daftar_teks]
+    offset = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offset[1:])
+    data = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    return offset, data, encoded
+
+
+def tulis_katalog_biner(path, jurusan_data):
+    """
+    Tulis katalog jurusan ke file biner
+    
+    Args:
+        path (str): Path file tujuan
+        jurusan_data (dict | KatalogJurusan): Data jurusan atau katalog
+    
+    Returns:
+        int: Jumlah jurusan yang ditulis
+    """
+    katalog = get_katalog(jurusan_data)
+    kode_offset, kode_data, kode_encoded = _tabel_string(katalog.kode.tolist())
+    nama_offset, nama_data, _ = _tabel_string(katalog.nama.tolist())
+    kode_urut = np.array(sorted(range(len(kode_encoded)), key=kode_encoded.__getitem__),
+                         dtype=np.int32)
+    
+    kolom = [
+        ('nilai_standar', katalog.nilai_standar),
+        ('biaya', katalog.biaya),
+        ('prospek', katalog.prospek),
+        ('minat', katalog.minat),
+        ('biaya_kategori', katalog.biaya_kategori),
+        ('kode_offset', kode_offset),
+        ('kode_data', kode_data),
+        ('kode_urut', kode_urut),
+        ('nama_offset', nama_offset),
+        ('nama_data', nama_data),
+    ]
+    kolom = [(nama, np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder('<')))
+             for nama, arr in kolom]
+    
+    # Panjang meta mempengaruhi offset kolom, ulangi sampai stabil
+    awal = 0
+    while True:
+        posisi = {}
+        offset = awal
+        for nama, arr in kolom:
+            posisi[nama] = [offset, arr.dtype.str, len(arr)]
+            offset += -(-arr.nbytes // _RATA) * _RATA
+        meta = {
+            'versi_format': VERSI_FORMAT,
+            'jumlah': len(katalog),
+            'pilihan_minat': list(katalog.pilihan_minat),
+            'pilihan_biaya': list(katalog.pilihan_biaya),
+            'sidik': katalog.sidik,
+            'kolom': posisi
+        }
+        meta_bytes = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+        awal_baru = -(-(_HEADER.size + len(meta_bytes)) // _RATA) * _RATA
+        if awal_baru == awal:
+            break
+        awal = awal_baru
+    
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, VERSI_FORMAT, len(meta_bytes)))
+        f.write(meta_bytes)
+        for nama, arr in kolom:
+            f.write(b'\0' * (meta['kolom'][nama][0] - f.tell()))
+            f.write(arr.tobytes())
+    return len(katalog)
+
+
+def muat_katalog_biner(path, mmap=True):
+    """
+    Buka file katalog biner sebagai KatalogJurusan
+    
+    Kolom numerik dan string dipakai langsung dari memory-map (tanpa
+    salinan, tanpa objek Python per jurusan). Katalog yang sama hanya
+    dibuka sekali per proses selama file tidak berubah.
+    
+    Args:
+        path (str): Path file katalog
+        mmap (bool): Buka dengan memory-map (default) atau baca ke memori
+    
+    Returns:
+        KatalogJurusan: Katalog siap dipakai engine SAW
+    
+    Raises:
+        ValueError: Jika file bukan katalog biner atau versinya tidak didukung
+    """
+    path = os.path.abspath(os.fspath(path))
+    stat = os.stat(path)
+    kunci = (path, stat.st_mtime_ns, stat.st_size, mmap)
+    if kunci in _KATALOG_TERBUKA:
+        return _KATALOG_TERBUKA[kunci]
+    
+    with open(path, 'rb') as f:
+        magic, versi, panjang_meta = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != _MAGIC:
+            raise ValueError(f"Bukan file katalog biner: {path}")
+        if versi != VERSI_FORMAT:
+            raise ValueError(f"Versi format katalog tidak didukung: {versi}")
+        meta = json.loads(f.read(panjang_meta).decode('utf-8'))
+    
+    if mmap:
+        buffer = np.memmap(path, dtype=np.uint8, mode='r')
+    else:
+        buffer = np.fromfile(path, dtype=np.uint8)
+        buffer.setflags(write=False)
+    
+    def kolom(nama):
+        offset, dtype, jumlah = meta['kolom'][nama]
+        dtype = np.dtype(dtype)
+        return buffer[offset:offset + dtype.itemsize * jumlah].view(dtype)
+    
+    katalog = KatalogJurusan(
+        kode=TabelString(kolom('kode_offset'), kolom('kode_data'), kolom('kode_urut')),
+        nama=TabelString(kolom('nama_offset'), kolom('nama_data')),
+        nilai_standar=kolom('nilai_standar'),
+        minat=kolom('minat'),
+        biaya_kategori=kolom('biaya_kategori'),
+        biaya=kolom('biaya'),
+        prospek=kolom('prospek'),
+        pilihan_minat=meta['pilihan_minat'],
+        pilihan_biaya=meta['pilihan_biaya'],
+        sidik=meta['sidik'],
+        sumber=path if mmap else None
+    )
+    # Versi lama file yang sama tidak dipakai lagi
+    for lama in [k for k in _KATALOG_TERBUKA if k[0] == path]:
+        del _KATALOG_TERBUKA[lama]
+    _KATALOG_TERBUKA[kunci] = katalog
+    return katalog
+
+
+def baca_csv_jurusan(path):
+    """
+    Baca file CSV jurusan ke format dictionary JURUSAN_DATA
+    
+    Args:
+        path (str): File CSV dengan kolom KOLOM_CSV
+    
+    Returns:
+        dict: Data jurusan
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        kurang = [k for k in KOLOM_CSV if k not in (reader.fieldnames or [])]
+        if kurang:
+            raise ValueError(f"Kolom wajib tidak ada: {', '.join(kurang)}")
+        return {
+            row['kode']: {
+                'nama': row['nama'],
+                'nilai_standar': float(row['nilai_standar']),
+                'minat': row['minat'],
+                'biaya': row['biaya'],
+                'prospek': float(row['prospek'])
+            }
+            for row in reader
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Konversi katalog jurusan CSV ke format biner")
+    parser.add_argument('input', help="File CSV jurusan (kode,nama,nilai_standar,minat,biaya,prospek)")
+    parser.add_argument('-o', '--output', required=True, help="File katalog biner tujuan")
+    args = parser.parse_args(argv)
+    
+    jumlah = tulis_katalog_biner(args.output, baca_csv_jurusan(args.input))
+    print(f"✅ {jumlah:,} jurusan ditulis ke {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Test app.py dengan streamlit.testing (AppTest)
+
+Fokus pada tombol PDF: rerun seluruh app (toggle grafik, submit ulang)
+selama job PDF masih menunggu/berjalan tidak boleh memicu error.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('streamlit')
+from streamlit.testing.v1 import AppTest
+
+from utils import pdf_generator
+
+APP = str(Path(__file__).resolve().parent.parent / 'app.py')
+
+
+@pytest.fixture
+def render_ditahan(monkeypatch):
+    """generate_pdf_report yang baru selesai setelah event di-set"""
+    lepas = threading.Event()
+    
+    def render(**kwargs):
+        lepas.wait(30)
+        return b'%PDF-1.4 palsu'
+    
+    monkeypatch.setattr(pdf_generator, 'generate_pdf_report', render)
+    yield lepas
+    lepas.set()
+
+
+def _tombol(at, label):
+    return next(b for b in at.button if b.label == label)
+
+
+def _hitung(at, nama):
+    at.text_input[0].input(nama)
+    at.number_input[0].set_value(85.0)
+    at.selectbox[0].select('IPA')
+    at.selectbox[1].select('Sedang')
+    _tombol(at, "🔍 Hitung").click().run()
+    assert not at.exception
+
+
+def _status_pdf(at):
+    return [c.value for c in at.caption if c.value.startswith('⏳')]
+
+
+def test_rerun_penuh_saat_pdf_dirender(render_ditahan):
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.run()
+    _hitung(at, 'Siswa Rerun PDF')
+    
+    _tombol(at, "📄 PDF Report").click().run()
+    assert not at.exception
+    assert _status_pdf(at)
+    
+    # Rerun seluruh app selama job MENUNGGU/BERJALAN
+    at.toggle(key='grafik_interaktif').set_value(True).run()
+    assert not at.exception
+    assert _status_pdf(at)
+    
+    _hitung(at, 'Siswa Rerun PDF')
+    assert _status_pdf(at)
+    
+    render_ditahan.set()
+    batas = time.monotonic() + 10
+    while not at.get('download_button') and time.monotonic() < batas:
+        time.sleep(0.05)
+        at.run()
+        assert not at.exception
+    assert at.get('download_button')
+    assert not _status_pdf(at)
+
+
+def test_pdf_gagal_bisa_dicoba_lagi(monkeypatch):
+    percobaan = []
+    
+    def render(**kwargs):
+        percobaan.append(1)
+        if len(percobaan) == 1:
+            raise RuntimeError("rusak")
+        return b'%PDF-1.4 palsu'
+    
+    monkeypatch.setattr(pdf_generator, 'generate_pdf_report', render)
+    at = AppTest.from_file(APP, default_timeout=30)
+    at.run()
+    _hitung(at, 'Siswa PDF Gagal')
+    _tombol(at, "📄 PDF Report").click().run()
+    
+    batas = time.monotonic() + 10
+    while not at.error and time.monotonic() < batas:
+        time.sleep(0.05)
+        at.run()
+    assert 'rusak' in at.error[0].value
+    
+    _tombol(at, "🔄 Coba lagi").click().run()
+    assert not at.exception
+    while not at.get('download_button') and time.monotonic() < batas:
+        time.sleep(0.05)
+        at.run()
+    assert at.get('download_button')
+    assert len(percobaan) == 2
@@ -0,0 +1,130 @@
+"""
+Test buku laporan (satu PDF, daftar isi + bagian per siswa)
+
+Struktur PDF gabungan diperiksa dengan baca_objek_pdf: offset xref, pohon
+halaman, outline, dan link daftar isi harus konsisten.
+"""
+
+import re
+import tracemalloc
+from io import BytesIO
+
+import pytest
+from reportlab.pdfgen import canvas
+
+from data.jurusan_data import BOBOT_KRITERIA, KATALOG_JURUSAN
+from utils.pdf_generator import get_template_laporan
+from utils.pdf_merge import PenulisPdfGabungan, baca_objek_pdf
+from utils.saw_calculator import hitung_saw
+
+
+def _laporan(jumlah):
+    for i in range(jumlah):
+        minat, ekonomi = ('IPA', 'IPS', 'Seni')[i % 3], ('Rendah', 'Sedang', 'Tinggi')[i % 3]
+        hasil, detail = hitung_saw(60 + i, minat, ekonomi, 70, KATALOG_JURUSAN, BOBOT_KRITERIA,
+                                   top_k=3)
+        yield (f"Siswa {i}", 60 + i, minat, ekonomi, 70, hasil, detail, BOBOT_KRITERIA)
+
+
+def _daftar_isi(jumlah):
+    return [(f"Siswa {i}", 'Jurusan', 0.5) for i in range(jumlah)]
+
+
+def _buku(jumlah, ukuran_bagian):
+    output = BytesIO()
+    total = get_template_laporan().render_gabungan(_daftar_isi(jumlah), _laporan(jumlah), output,
+                                                   ukuran_bagian=ukuran_bagian)
+    assert total == jumlah
+    return output.getvalue()
+
+
+def _ref(teks, nama):
+    return int(re.search(rb'/' + nama + rb' (\d+) 0 R', teks).group(1))
+
+
+def _tujuan(teks):
+    return [int(n) for n in re.findall(rb'/Dest \[ (\d+) 0 R /Fit \]', teks)]
+
+
+def _struktur(data):
+    objek, trailer = baca_objek_pdf(data)
+    catalog = objek[_ref(trailer, b'Root')][0]
+    pages = objek[_ref(catalog, b'Pages')][0]
+    kids = [int(n) for n in re.findall(rb'(\d+) 0 R', re.search(rb'/Kids \[(.*?)\]', pages).group(1))]
+    assert int(re.search(rb'/Count (\d+)', pages).group(1)) == len(kids)
+    for nomor in kids:
+        assert re.search(rb'/Type\s*/Page\b', objek[nomor][0])
+    return objek, catalog, kids
+
+
+def test_penulis_urutan_halaman_dari_selesai():
+    def pdf(*teks):
+        buffer = BytesIO()
+        c = canvas.Canvas(buffer)
+        for t in teks:
+            c.drawString(100, 100, t)
+            c.showPage()
+        c.save()
+        return buffer.getvalue()
+    
+    output = BytesIO()
+    with PenulisPdfGabungan(output) as penulis:
+        a = penulis.tambah(pdf('a1', 'a2'))
+        b = penulis.tambah(pdf('b1'), tautan={0: [((0, 0, 10, 10), a[1])]})
+        penulis.selesai(b + a, outline=[('Ä', a[0])])
+    
+    objek, catalog, kids = _struktur(output.getvalue())
+    assert kids == b + a
+    assert _tujuan(objek[b[0]][0]) == [a[1]]
+    outline = objek[_ref(catalog, b'Outlines')][0]
+    assert _tujuan(objek[_ref(outline, b'First')][0]) == [a[0]]
+
+
+@pytest.mark.parametrize('jumlah, ukuran_bagian', [(7, 3), (5, 32), (0, 4)])
+def test_buku_laporan_konsisten(jumlah, ukuran_bagian):
+    objek, catalog, kids = _struktur(_buku(jumlah, ukuran_bagian))
+    
+    # Link daftar isi dan outline menunjuk halaman awal siswa yang sama
+    link = [t for nomor in kids for t in _tujuan(objek[nomor][0])]
+    assert len(link) == jumlah
+    if jumlah:
+        outline = objek[_ref(catalog, b'Outlines')][0]
+        item = _ref(outline, b'First')
+        tujuan_outline = []
+        while True:
+            isi = objek[item][0]
+            tujuan_outline += _tujuan(isi)
+            if b'/Next' not in isi:
+                break
+            item = _ref(isi, b'Next')
+        assert tujuan_outline == link
+    
+    # Halaman awal siswa urut dan setiap siswa punya bagian sendiri
+    posisi = [kids.index(t) for t in link]
+    assert posisi == sorted(set(posisi))
+    assert not jumlah or posisi[0] >= 1
+
+
+def test_buku_laporan_jumlah_tidak_sama():
+    with pytest.raises(ValueError, match="tidak sama"):
+        get_template_laporan().render_gabungan(_daftar_isi(3), _laporan(2), BytesIO())
+
+
+def test_memori_buku_laporan_tidak_bertambah_per_halaman(tmp_path):
+    template = get_template_laporan()
+    
+    def puncak(jumlah):
+        tracemalloc.start()
+        try:
+            template.render_gabungan(_daftar_isi(jumlah), _laporan(jumlah),
+                                     str(tmp_path / f'buku_{jumlah}.pdf'), ukuran_bagian=4)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    
+    # Build pertama mengisi cache ReportLab (font, teks) yang tidak dilepas
+    puncak(64)
+    kecil, besar = puncak(16), puncak(64)
+    # Daftar isi ikut bertambah, tetapi halaman yang sudah disalin ke output
+    # tidak boleh ditahan (satu canvas untuk semua siswa: kira-kira 3x)
+    assert besar < kecil * 1.5
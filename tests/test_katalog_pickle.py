@@ -0,0 +1,101 @@
+"""
+Test pickle KatalogJurusan dan skor_kohort dengan worker spawn
+
+Katalog dikirim ke worker lewat initargs ProcessPoolExecutor, sehingga
+harus bisa di-pickle baik katalog di memori maupun katalog biner.
+"""
+
+import csv
+import functools
+import multiprocessing
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from data.jurusan_data import JURUSAN_DATA, KATALOG_JURUSAN, BOBOT_KRITERIA, kompilasi_katalog
+from data.katalog_biner import muat_katalog_biner, tulis_katalog_biner
+from utils import cohort_scorer
+from utils.saw_calculator import hitung_saw_batch
+
+
+def _sama(a, b):
+    assert a.kode.tolist() == b.kode.tolist()
+    assert a.nama.tolist() == b.nama.tolist()
+    for kolom in ('nilai_standar', 'minat', 'biaya_kategori', 'biaya', 'prospek'):
+        np.testing.assert_array_equal(getattr(a, kolom), getattr(b, kolom))
+    assert a.pilihan_minat == b.pilihan_minat
+    assert a.pilihan_biaya == b.pilihan_biaya
+    assert a.sidik == b.sidik
+    assert a.info(a.kode[0]) == b.info(b.kode[0])
+
+
+@pytest.fixture
+def path_katalog(tmp_path):
+    path = str(tmp_path / 'katalog.bin')
+    tulis_katalog_biner(path, JURUSAN_DATA)
+    return path
+
+
+@pytest.mark.parametrize('katalog', [
+    KATALOG_JURUSAN,
+    kompilasi_katalog(JURUSAN_DATA),
+], ids=['KATALOG_JURUSAN', 'kompilasi_katalog'])
+def test_pickle_katalog_memori(katalog):
+    salinan = pickle.loads(pickle.dumps(katalog))
+    _sama(katalog, salinan)
+    assert salinan.sumber is None
+    assert not salinan.nilai_standar.flags.writeable
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_pickle_katalog_biner(path_katalog, mmap):
+    katalog = muat_katalog_biner(path_katalog, mmap=mmap)
+    salinan = pickle.loads(pickle.dumps(katalog))
+    _sama(katalog, salinan)
+    assert salinan.sumber == katalog.sumber
+
+
+def test_pickle_hasil_saw_sama():
+    salinan = pickle.loads(pickle.dumps(KATALOG_JURUSAN))
+    argumen = ([85, 70], ['IPA', 'Seni'], ['Sedang', 'Rendah'], [90, 60])
+    asli = hitung_saw_batch(*argumen, KATALOG_JURUSAN, BOBOT_KRITERIA)
+    baru = hitung_saw_batch(*argumen, salinan, BOBOT_KRITERIA)
+    np.testing.assert_array_equal(asli[1], baru[1])
+    np.testing.assert_array_equal(asli[2], baru[2])
+
+
+def _tulis_siswa(path, jumlah):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['id', 'nilai_akademik', 'minat', 'ekonomi', 'prospek_kerja'])
+        for i in range(jumlah):
+            writer.writerow([f's{i}', 60 + i % 40, ('IPA', 'IPS', 'Seni')[i % 3],
+                             ('Rendah', 'Sedang', 'Tinggi')[i % 3], 50 + i % 50])
+
+
+@pytest.mark.parametrize('sumber', ['memori', 'biner', 'biner_tanpa_mmap'])
+def test_skor_kohort_spawn(tmp_path, monkeypatch, path_katalog, sumber):
+    jurusan_data = {
+        'memori': kompilasi_katalog(JURUSAN_DATA),
+        'biner': muat_katalog_biner(path_katalog),
+        'biner_tanpa_mmap': muat_katalog_biner(path_katalog, mmap=False),
+    }[sumber]
+    path_input = str(tmp_path / 'siswa.csv')
+    _tulis_siswa(path_input, 250)
+    
+    path_acuan = str(tmp_path / 'acuan.csv')
+    cohort_scorer.skor_kohort(path_input, path_acuan, workers=1, ukuran_chunk=100,
+                              jurusan_data=jurusan_data)
+    
+    monkeypatch.setattr(cohort_scorer, 'ProcessPoolExecutor', functools.partial(
+        ProcessPoolExecutor, mp_context=multiprocessing.get_context('spawn')
+    ))
+    path_spawn = str(tmp_path / 'spawn.csv')
+    statistik = cohort_scorer.skor_kohort(path_input, path_spawn, workers=2, ukuran_chunk=100,
+                                          jurusan_data=jurusan_data)
+    
+    assert statistik['baris'] == 250
+    with open(path_acuan, encoding='utf-8') as a, open(path_spawn, encoding='utf-8') as b:
+        assert a.read() == b.read()
@@ -0,0 +1,54 @@
+"""
+Test AntrianRender: status job sampai selesai atau gagal
+"""
+
+import pytest
+
+from utils.render_queue import AntrianRender, GAGAL, SELESAI, TIDAK_ADA
+
+
+@pytest.fixture
+def antrian():
+    return AntrianRender(workers=1, maks_bytes=100)
+
+
+def test_job_selesai_dilayani_dari_cache(antrian):
+    antrian.kirim('a', lambda: b'pdf')
+    assert antrian.tunggu('a', timeout=5)['status'] == SELESAI
+    assert antrian.ambil('a') == b'pdf'
+    assert antrian.kirim('a', lambda: b'lain') == SELESAI
+    assert antrian.info()['hits'] == 1
+
+
+def test_fungsi_error_dicatat_gagal(antrian):
+    def gagal():
+        raise RuntimeError("rusak")
+    
+    antrian.kirim('a', gagal)
+    status = antrian.tunggu('a', timeout=5)
+    assert status['status'] == GAGAL
+    assert status['error'] == "RuntimeError: rusak"
+
+
+def test_hasil_tanpa_len_dicatat_gagal(antrian):
+    antrian.kirim('a', lambda: None)
+    status = antrian.tunggu('a', timeout=5)
+    assert status['status'] == GAGAL
+    assert status['error'].startswith('TypeError')
+    assert antrian.info()['berjalan'] == 0
+
+
+def test_hasil_terlalu_besar_dicatat_gagal(antrian):
+    antrian.kirim('a', lambda: b'x' * 101)
+    status = antrian.tunggu('a', timeout=5)
+    assert status['status'] == GAGAL
+    assert antrian.ambil('a') is None
+
+
+def test_kegagalan_dibatasi_lru():
+    antrian = AntrianRender(workers=1, maks_gagal=2)
+    for key in 'abc':
+        antrian.kirim(key, lambda: None)
+        antrian.tunggu(key, timeout=5)
+    assert antrian.status('a')['status'] == TIDAK_ADA
+    assert antrian.status('c')['status'] == GAGAL
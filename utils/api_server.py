@@ -0,0 +1,417 @@
+"""
+HTTP API headless untuk perhitungan SAW (tanpa Streamlit)
+Server asyncio murni (library standar) untuk portal siswa atau sistem lain
+yang hanya butuh ranking, tanpa memuat CSS, sidebar, dan grafik.
+
+Perhitungan SAW dijalankan langsung di event loop. Permintaan /hitung yang
+datang bersamaan digabung menjadi satu batch matriks (utils/saw_coalescer.py),
+sedangkan render PDF dikirim ke process pool sehingga event loop tidak pernah
+terblokir oleh ReportLab.
+
+Contoh (dari root project):
+    python -m utils.api_server --port 8080 --workers 2
+    python -m utils.api_server --jendela-ms 5 --maks-batch 256   # batch lebih besar
+    python -m utils.api_server --tanpa-batch                     # hitung per permintaan
+
+Endpoint:
+    GET  /health     -> {"status": "ok"}
+    GET  /metrics    -> Metrik format Prometheus (lihat utils/metrics.py)
+    GET  /statistik  -> Statistik batch /hitung dan cache
+    POST /validasi   -> {"valid": true, "error": ""}
+    POST /hitung     -> {"hasil": [...], "detail": [...]}
+    POST /pdf        -> application/pdf
+
+Body POST berupa JSON:
+    {"nama": "Andi", "nilai_akademik": 85, "minat": "IPA",
+     "ekonomi": "Sedang", "prospek_kerja": 90, "top_k": 3, "detail": false}
+'nama' hanya dipakai /pdf, 'top_k' dan 'detail' bersifat opsional.
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+
+from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA, get_katalog
+from utils.metrics import METRIK
+from utils.pdf_generator import get_template_laporan
+from utils.saw_cache import CACHE_SAW, hitung_saw_cached
+from utils.saw_coalescer import JENDELA_MS_DEFAULT, MAKS_BATCH_DEFAULT, PenggabungSAW
+from utils.saw_calculator import hitung_saw_ringkas, validasi_input
+
+# Batas ukuran header & body request (byte)
+MAKS_HEADER = 16 * 1024
+MAKS_BODY = 64 * 1024
+
+# Koneksi keep-alive ditutup jika tidak ada request selama ini (detik)
+TIMEOUT_IDLE = 30
+
+# Batas waktu menunggu request yang sedang berjalan saat server berhenti (detik)
+TIMEOUT_BERHENTI = 10
+
+# Katalog & bobot per worker PDF, diisi sekali oleh _init_worker
+_KATALOG = None
+_BOBOT = None
+
+
+class ErrorHTTP(Exception):
+    """Error yang dikirim ke client sebagai response JSON {"error": ...}"""
+    
+    def __init__(self, status, pesan):
+        super().__init__(pesan)
+        self.status = status
+        self.pesan = pesan
+
+
+def _init_worker(jurusan_data, bobot_kriteria):
+    """Kompilasi katalog dan template PDF sekali per proses worker"""
+    global _KATALOG, _BOBOT
+    _KATALOG = get_katalog(jurusan_data)
+    _BOBOT = bobot_kriteria
+    get_template_laporan()
+
+
+def render_pdf(nama, nilai_akademik, minat, ekonomi, prospek_kerja):
+    """
+    Hitung SAW lalu render PDF report di proses worker
+    
+    Hasil SAW dihitung ulang di worker (murah) agar yang dikirim antar
+    proses hanya input siswa dan bytes PDF.
+    
+    Returns:
+        bytes: Isi file PDF
+    """
+    hasil, detail = hitung_saw_ringkas(nilai_akademik, minat, ekonomi, prospek_kerja,
+                                       _KATALOG, _BOBOT)
+    return get_template_laporan().render(nama, nilai_akademik, minat, ekonomi, prospek_kerja,
+                                         hasil, detail, _BOBOT)
+
+
+def ambil_input_siswa(data):
+    """
+    Ambil input siswa dari body JSON (tanpa validasi rentang & kategori)
+    
+    Args:
+        data (dict): Body request
+    
+    Returns:
+        tuple: (nilai_akademik, minat, ekonomi, prospek_kerja)
+    
+    Raises:
+        ErrorHTTP: 400 jika field tidak ada atau nilai bukan angka
+    """
+    if not isinstance(data, dict):
+        raise ErrorHTTP(400, "Body harus berupa objek JSON")
+    kurang = [k for k in ('nilai_akademik', 'minat', 'ekonomi', 'prospek_kerja') if k not in data]
+    if kurang:
+        raise ErrorHTTP(400, f"Field wajib tidak ada: {', '.join(kurang)}")
+    
+    try:
+        nilai_akademik = float(data['nilai_akademik'])
+        prospek_kerja = float(data['prospek_kerja'])
+    except (TypeError, ValueError):
+        raise ErrorHTTP(400, "nilai_akademik dan prospek_kerja harus berupa angka")
+    return nilai_akademik, data['minat'], data['ekonomi'], prospek_kerja
+
+
+def baca_input_siswa(data):
+    """
+    Ambil input siswa dari body JSON lalu validasi dengan validasi_input
+    
+    Raises:
+        ErrorHTTP: 400 jika input tidak lengkap atau tidak valid
+    """
+    siswa = ambil_input_siswa(data)
+    is_valid, error_message = validasi_input(*siswa)
+    if not is_valid:
+        raise ErrorHTTP(400, error_message)
+    return siswa
+
+
+def _baca_top_k(data):
+    top_k = data.get('top_k')
+    if top_k is None:
+        return None
+    if not isinstance(top_k, int) or isinstance(top_k, bool) or top_k < 1:
+        raise ErrorHTTP(400, "top_k harus bilangan bulat positif")
+    return top_k
+
+
+def _response(status, isi, content_type, keep_alive):
+    """Bytes response HTTP/1.1 lengkap (header + body)"""
+    header = (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(isi)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    return header.encode('latin-1') + isi
+
+
+def _json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class ServerAPI:
+    """
+    Handler HTTP/1.1 (keep-alive) untuk endpoint SAW
+    
+    Args:
+        jurusan_data (dict | KatalogJurusan | str, optional): Data jurusan atau
+            path katalog biner (default: JURUSAN_DATA)
+        bobot_kriteria (dict, optional): Bobot (default: BOBOT_KRITERIA)
+        workers (int, optional): Jumlah proses render PDF (default: jumlah CPU)
+        jendela_ms (float | None): Jendela micro-batching /hitung (milidetik).
+            None = tanpa batch, setiap permintaan dihitung sendiri (CACHE_SAW)
+        maks_batch (int): Ukuran batch maksimum /hitung
+    """
+    
+    def __init__(self, jurusan_data=None, bobot_kriteria=None, workers=None,
+                 jendela_ms=JENDELA_MS_DEFAULT, maks_batch=MAKS_BATCH_DEFAULT):
+        self.jurusan_data = JURUSAN_DATA if jurusan_data is None else jurusan_data
+        self.katalog = get_katalog(self.jurusan_data)
+        self.bobot_kriteria = BOBOT_KRITERIA if bobot_kriteria is None else bobot_kriteria
+        self.workers = workers or os.cpu_count() or 1
+        self.penggabung = None
+        if jendela_ms is not None:
+            self.penggabung = PenggabungSAW(self.katalog, self.bobot_kriteria,
+                                            jendela_ms=jendela_ms, maks_batch=maks_batch)
+            METRIK.daftar_kolektor(self.penggabung.kolektor)
+        self._pool = None
+        self._koneksi = set()
+        self._menunggu = set()
+        self._berhenti = False
+        self._rute = {
+            ('GET', '/health'): self.health,
+            ('GET', '/metrics'): self.metrics,
+            ('GET', '/statistik'): self.statistik,
+            ('POST', '/validasi'): self.validasi,
+            ('POST', '/hitung'): self.hitung,
+            ('POST', '/pdf'): self.pdf,
+        }
+    
+    @property
+    def pool(self):
+        """
+        Process pool PDF, dibuat saat request /pdf pertama
+        
+        Memakai 'spawn' agar worker tidak mewarisi socket server (dengan fork,
+        worker yang tertinggal tetap memegang port setelah server berhenti).
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.workers,
+                                             mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=_init_worker,
+                                             initargs=(self.jurusan_data, self.bobot_kriteria))
+        return self._pool
+    
+    def tutup(self):
+        """Hentikan process pool PDF"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+    
+    # ========================================
+    # ENDPOINT
+    # Setiap endpoint mengembalikan (status, isi_bytes, content_type)
+    # ========================================
+    async def health(self, data):
+        return 200, _json({'status': 'ok'}), 'application/json'
+    
+    async def metrics(self, data):
+        return (200, METRIK.ekspor_prometheus().encode('utf-8'),
+                'text/plain; version=0.0.4; charset=utf-8')
+    
+    async def statistik(self, data):
+        isi = {
+            'batch': self.penggabung.statistik() if self.penggabung else None,
+            'cache_saw': CACHE_SAW.info()
+        }
+        return 200, _json(isi), 'application/json'
+    
+    async def validasi(self, data):
+        is_valid, error_message = validasi_input(*ambil_input_siswa(data))
+        return 200, _json({'valid': is_valid, 'error': error_message}), 'application/json'
+    
+    async def hitung(self, data):
+        siswa = baca_input_siswa(data)
+        top_k = _baca_top_k(data)
+        if self.penggabung is None:
+            hasil, detail = hitung_saw_cached(*siswa, self.katalog, self.bobot_kriteria,
+                                              top_k=top_k)
+        else:
+            hasil, detail = await self.penggabung.hitung(*siswa, top_k=top_k)
+            hasil = hasil.to_list()
+            if data.get('detail'):
+                detail = detail.to_list()
+        isi = {'hasil': hasil}
+        if data.get('detail'):
+            isi['detail'] = detail
+        return 200, _json(isi), 'application/json'
+    
+    async def pdf(self, data):
+        siswa = baca_input_siswa(data)
+        nama = str(data.get('nama') or 'Siswa')
+        loop = asyncio.get_running_loop()
+        pdf = await loop.run_in_executor(self.pool, render_pdf, nama, *siswa)
+        return 200, pdf, 'application/pdf'
+    
+    # ========================================
+    # PROTOKOL HTTP
+    # ========================================
+    async def tangani_koneksi(self, reader, writer):
+        """Layani request berurutan di satu koneksi sampai ditutup"""
+        self._koneksi.add(asyncio.current_task())
+        try:
+            while not self._berhenti:
+                # Koneksi yang sedang menunggu request langsung ditutup saat server berhenti
+                self._menunggu.add(writer)
+                try:
+                    kepala = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), TIMEOUT_IDLE)
+                except asyncio.LimitOverrunError:
+                    writer.write(_response(431, _json({'error': "Header terlalu besar"}),
+                                           'application/json', False))
+                    break
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                finally:
+                    self._menunggu.discard(writer)
+                
+                respons, keep_alive = await self.tangani_request(kepala, reader)
+                writer.write(respons)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._koneksi.discard(asyncio.current_task())
+            writer.close()
+    
+    async def tangani_request(self, kepala, reader):
+        """
+        Parse satu request, panggil endpoint, dan susun response
+        
+        Returns:
+            tuple: (response_bytes, keep_alive)
+        """
+        baris = kepala.decode('latin-1').split('\r\n')
+        try:
+            method, path, versi = baris[0].split(' ')
+        except ValueError:
+            return _response(400, _json({'error': "Request line tidak valid"}),
+                             'application/json', False), False
+        
+        header = {}
+        for b in baris[1:]:
+            if ':' in b:
+                k, v = b.split(':', 1)
+                header[k.strip().lower()] = v.strip()
+        koneksi = header.get('connection', '').lower()
+        keep_alive = koneksi != 'close' if versi == 'HTTP/1.1' else koneksi == 'keep-alive'
+        
+        try:
+            panjang = int(header.get('content-length', 0))
+        except ValueError:
+            panjang = -1
+        if panjang < 0 or panjang > MAKS_BODY:
+            return _response(413, _json({'error': "Body terlalu besar atau tidak valid"}),
+                             'application/json', False), False
+        body = await reader.readexactly(panjang) if panjang else b''
+        
+        path = path.split('?', 1)[0]
+        endpoint = self._rute.get((method, path))
+        try:
+            if endpoint is None:
+                if any(p == path for _, p in self._rute):
+                    raise ErrorHTTP(405, f"Method {method} tidak didukung untuk {path}")
+                raise ErrorHTTP(404, f"Endpoint tidak ditemukan: {path}")
+            try:
+                data = json.loads(body) if body else {}
+            except ValueError:
+                raise ErrorHTTP(400, "Body bukan JSON yang valid")
+            with METRIK.waktu(f"api_{path.strip('/')}"):
+                status, isi, content_type = await endpoint(data)
+        except ErrorHTTP as e:
+            status, isi, content_type = e.status, _json({'error': e.pesan}), 'application/json'
+        except Exception as e:
+            status, isi, content_type = 500, _json({'error': f"{type(e).__name__}: {e}"}), 'application/json'
+        
+        METRIK.tambah('spk_api_request_total', path=path, status=str(status))
+        keep_alive = keep_alive and not self._berhenti
+        return _response(status, isi, content_type, keep_alive), keep_alive
+    
+    async def jalankan(self, host='127.0.0.1', port=8080, berhenti=None):
+        """
+        Jalankan server sampai event berhenti di-set
+        
+        Saat berhenti, server tidak menerima koneksi baru, koneksi keep-alive
+        yang menganggur ditutup, dan request yang sedang berjalan ditunggu
+        (maksimal TIMEOUT_BERHENTI detik).
+        
+        Args:
+            host (str): Alamat bind
+            port (int): Port
+            berhenti (asyncio.Event, optional): Default: di-set oleh SIGINT/SIGTERM
+        """
+        loop = asyncio.get_running_loop()
+        if berhenti is None:
+            berhenti = asyncio.Event()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, berhenti.set)
+                except (NotImplementedError, RuntimeError):
+                    pass  # Windows / bukan main thread: Ctrl+C tetap menghentikan asyncio.run
+        
+        server = await asyncio.start_server(self.tangani_koneksi, host, port, limit=MAKS_HEADER)
+        try:
+            await berhenti.wait()
+        finally:
+            self._berhenti = True
+            server.close()
+            for writer in list(self._menunggu):
+                writer.close()
+            if self._koneksi:
+                await asyncio.wait(list(self._koneksi), timeout=TIMEOUT_BERHENTI)
+            await server.wait_closed()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="HTTP API headless untuk perhitungan SAW")
+    parser.add_argument('--host', default='127.0.0.1',
+                        help="Alamat bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8080,
+                        help="Port (default: 8080)")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Jumlah proses render PDF (default: jumlah CPU)")
+    parser.add_argument('--jendela-ms', type=float, default=JENDELA_MS_DEFAULT,
+                        help=f"Waktu tunggu maksimum batch /hitung dalam ms (default: {JENDELA_MS_DEFAULT})")
+    parser.add_argument('--maks-batch', type=int, default=MAKS_BATCH_DEFAULT,
+                        help=f"Jumlah permintaan maksimum per batch /hitung (default: {MAKS_BATCH_DEFAULT})")
+    parser.add_argument('--tanpa-batch', action='store_true',
+                        help="Hitung setiap permintaan /hitung sendiri-sendiri (memakai CACHE_SAW)")
+    parser.add_argument('--katalog', default=None,
+                        help="File katalog biner (default: JURUSAN_DATA, lihat data/katalog_biner.py)")
+    args = parser.parse_args(argv)
+    
+    api = ServerAPI(jurusan_data=args.katalog, workers=args.workers,
+                    jendela_ms=None if args.tanpa_batch else args.jendela_ms,
+                    maks_batch=args.maks_batch)
+    print(f"🚀 SPK API di http://{args.host}:{args.port} "
+          f"({len(api.katalog.kode)} jurusan, {api.workers} worker PDF)", file=sys.stderr)
+    try:
+        asyncio.run(api.jalankan(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        api.tutup()
+
+
+if __name__ == "__main__":
+    main()
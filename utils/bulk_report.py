@@ -0,0 +1,313 @@
+"""
+Laporan PDF massal untuk satu kelas / angkatan
+Setiap siswa di file CSV dihitung SAW-nya lalu dibuatkan PDF report
+(generate_pdf_report) secara paralel di process pool. PDF langsung ditulis
+ke arsip ZIP di disk sesuai urutan input, sehingga hanya PDF dari batch
+yang sedang diproses yang berada di memori.
+
+Contoh (dari root project):
+    python -m utils.bulk_report kelas_12.csv -o laporan_kelas_12.zip --workers 4
+
+Format input sama dengan utils/cohort_scorer.py:
+    id,nilai_akademik,minat,ekonomi,prospek_kerja
+    S001,85,IPA,Sedang,90
+Nama siswa di laporan diambil dari kolom id (atau 'nama'). Baris yang tidak
+lolos validasi_input ditulis ke file reject (--reject).
+
+Untuk satu buku laporan (satu PDF dengan daftar isi, satu bagian per siswa):
+    python -m utils.bulk_report kelas_12.csv -o buku_kelas_12.pdf --gabung
+Bagian siswa dibangun per kelompok kecil dan langsung ditulis ke file,
+sehingga memori hampir tidak bergantung jumlah siswa (lihat buat_buku_laporan).
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA, get_katalog
+from utils.cohort_ingest import (
+    PenulisReject, baca_chunk, baca_header, iter_chunk_siswa, parse_chunk,
+    pipeline_kohort, skor_chunk_siswa
+)
+from utils.pdf_generator import generate_pdf_gabungan, get_template_laporan
+from utils.saw_calculator import hitung_saw_batch
+from utils.saw_result import susun_hasil
+
+# Jumlah siswa per task worker. Kecil agar PDF yang menunggu ditulis ke ZIP
+# tetap sedikit, tetapi cukup besar untuk menutupi overhead kirim task.
+UKURAN_BATCH_DEFAULT = 8
+
+# Jumlah siswa per chunk saat membaca input untuk buku laporan (satu proses)
+UKURAN_CHUNK_BUKU = 256
+
+# Katalog & bobot per worker, diisi sekali oleh _init_worker
+_KATALOG = None
+_BOBOT = None
+
+
+def _init_worker(jurusan_data, bobot_kriteria):
+    """Kompilasi katalog dan template PDF sekali per proses worker"""
+    global _KATALOG, _BOBOT
+    _KATALOG = get_katalog(jurusan_data)
+    _BOBOT = bobot_kriteria
+    get_template_laporan()
+
+
+def nama_file_laporan(nomor_baris, id_siswa):
+    """
+    Nama file PDF di dalam ZIP, contoh '000002_Andi_Pratama.pdf'
+    
+    Nomor baris membuat nama tetap unik walaupun id siswa sama.
+    """
+    aman = re.sub(r'[^\w.-]+', '_', str(id_siswa), flags=re.UNICODE).strip('._')
+    return f"{nomor_baris:06d}_{aman[:60] or 'siswa'}.pdf"
+
+
+def render_batch(header, nomor_baris, rows, top_k=None):
+    """
+    Parse, validasi, hitung SAW, dan render PDF untuk satu batch siswa
+    
+    Args:
+        header (list): Nama kolom file input
+        nomor_baris (list): Nomor baris file untuk setiap record
+        rows (list): Record CSV dari baca_chunk
+        top_k (int | None): Jumlah jurusan di laporan (default: semua)
+    
+    Returns:
+        tuple: (laporan, ditolak)
+            - laporan: List (nama_file, pdf_bytes) sesuai urutan input
+            - ditolak: List (nomor_baris, alasan, row)
+    """
+    chunk, ditolak = parse_chunk(header, nomor_baris, rows)
+    if not chunk.ids:
+        return [], ditolak
+    
+    skor = skor_chunk_siswa(chunk, _KATALOG, _BOBOT, top_k=top_k, dengan_r=True)
+    batch = susun_hasil(_KATALOG, skor.ranking, skor.nilai_saw, skor.matriks_r)
+    template = get_template_laporan()
+    
+    laporan = []
+    for i, id_siswa in enumerate(chunk.ids):
+        hasil, detail = batch[i]
+        pdf = template.render(id_siswa, chunk.nilai_akademik[i], chunk.minat[i],
+                              chunk.ekonomi[i], chunk.prospek_kerja[i],
+                              hasil, detail, _BOBOT)
+        laporan.append((nama_file_laporan(chunk.nomor_baris[i], id_siswa), pdf))
+    return laporan, ditolak
+
+
+def buat_laporan_massal(path_input, path_zip, workers=None,
+                        ukuran_batch=UKURAN_BATCH_DEFAULT, top_k=None,
+                        jurusan_data=None, bobot_kriteria=None, progress=None,
+                        path_reject=None):
+    """
+    Buat PDF report untuk setiap siswa dan simpan ke satu arsip ZIP
+    
+    Jumlah batch yang sedang diproses dibatasi (2 x workers), dan setiap PDF
+    langsung ditulis ke ZIP begitu batch-nya selesai, sehingga memori tidak
+    bergantung pada jumlah siswa. PDF disimpan tanpa kompresi ZIP karena
+    isinya sudah terkompresi.
+    
+    Args:
+        path_input (str): Path file CSV siswa
+        path_zip (str): Path arsip ZIP tujuan
+        workers (int, optional): Jumlah proses (default: jumlah CPU)
+        ukuran_batch (int): Jumlah siswa per task worker
+        top_k (int, optional): Jumlah jurusan di setiap laporan (default: semua)
+        jurusan_data (dict | KatalogJurusan | str, optional): Data jurusan atau
+            path katalog biner (default: JURUSAN_DATA)
+        bobot_kriteria (dict, optional): Bobot (default: BOBOT_KRITERIA)
+        progress (callable, optional): Dipanggil dengan (jumlah_laporan, detik)
+            setiap kali satu batch selesai ditulis
+        path_reject (str, optional): File CSV untuk baris yang ditolak
+            (default: <path_zip>.reject.csv, hanya dibuat jika ada reject)
+    
+    Returns:
+        dict: Statistik (laporan, ditolak, detik, laporan_per_detik, bytes,
+            workers, path_reject)
+    """
+    workers = workers or os.cpu_count() or 1
+    jurusan_data = JURUSAN_DATA if jurusan_data is None else jurusan_data
+    bobot_kriteria = BOBOT_KRITERIA if bobot_kriteria is None else bobot_kriteria
+    katalog = get_katalog(jurusan_data)
+    path_reject = path_zip + '.reject.csv' if path_reject is None else path_reject
+    
+    mulai = time.perf_counter()
+    total = 0
+    total_bytes = 0
+    
+    with open(path_input, newline='', encoding='utf-8-sig') as f_in, \
+            zipfile.ZipFile(path_zip, 'w', compression=zipfile.ZIP_STORED) as arsip, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(katalog, bobot_kriteria)) as pool:
+        header = baca_header(f_in)
+        
+        with PenulisReject(path_reject, header) as penulis_reject:
+            antrian = deque()
+            
+            def tulis_satu():
+                nonlocal total, total_bytes
+                laporan, ditolak = antrian.popleft().result()
+                for nama_file, pdf in laporan:
+                    arsip.writestr(nama_file, pdf)
+                    total_bytes += len(pdf)
+                penulis_reject.tulis(ditolak)
+                total += len(laporan)
+                if progress is not None:
+                    progress(total, time.perf_counter() - mulai)
+            
+            for nomor_baris, rows in baca_chunk(f_in, ukuran_batch):
+                antrian.append(pool.submit(render_batch, header, nomor_baris, rows, top_k))
+                if len(antrian) >= 2 * workers:
+                    tulis_satu()
+            
+            while antrian:
+                tulis_satu()
+    
+    detik = time.perf_counter() - mulai
+    return {
+        'laporan': total,
+        'ditolak': penulis_reject.jumlah,
+        'detik': detik,
+        'laporan_per_detik': total / detik if detik > 0 else 0.0,
+        'bytes': total_bytes,
+        'workers': workers,
+        'path_reject': path_reject
+    }
+
+
+def buat_buku_laporan(path_input, output, top_k=None, jurusan_data=None,
+                      bobot_kriteria=None, ukuran_chunk=UKURAN_CHUNK_BUKU,
+                      progress=None, path_reject=None):
+    """
+    Buat satu PDF berisi laporan semua siswa, didahului halaman daftar isi
+    
+    File input dibaca dua kali: pertama untuk daftar isi (nama, rekomendasi
+    terbaik, nilai SAW) dan file reject, kedua untuk membuat bagian setiap
+    siswa per kelompok (UKURAN_BAGIAN_GABUNGAN di utils/pdf_generator.py)
+    yang langsung ditulis ke output, lihat TemplateLaporan.render_gabungan.
+    
+    Yang bertambah sesuai jumlah siswa hanya daftar isi (satu baris per
+    siswa), sehingga puncak memori hampir tetap (terukur: 45 / 46 / 53 MB
+    untuk 100 / 800 / 2400 siswa, semua jurusan).
+    
+    Args:
+        path_input (str): Path file CSV siswa
+        output (str | file): Path PDF tujuan atau file-like (mode biner)
+        top_k (int, optional): Jumlah jurusan di setiap laporan (default: semua)
+        jurusan_data (dict | KatalogJurusan | str, optional): Default JURUSAN_DATA
+        bobot_kriteria (dict, optional): Default BOBOT_KRITERIA
+        ukuran_chunk (int): Jumlah baris per chunk saat membaca input
+        progress (callable, optional): Dipanggil dengan (jumlah_laporan, detik)
+            setiap kali data satu siswa disiapkan; satu kelompok disiapkan
+            sekaligus sebelum di-render, jadi progres maju per kelompok
+        path_reject (str, optional): File CSV untuk baris yang ditolak
+    
+    Returns:
+        dict: Statistik (laporan, ditolak, detik, laporan_per_detik, path_reject)
+    """
+    jurusan_data = JURUSAN_DATA if jurusan_data is None else jurusan_data
+    bobot_kriteria = BOBOT_KRITERIA if bobot_kriteria is None else bobot_kriteria
+    katalog = get_katalog(jurusan_data)
+    if path_reject is None and isinstance(output, (str, os.PathLike)):
+        path_reject = os.fspath(output) + '.reject.csv'
+    
+    mulai = time.perf_counter()
+    
+    # Tahap 1: daftar isi (cukup jurusan terbaik per siswa)
+    daftar_isi = []
+    with open(path_input, newline='', encoding='utf-8-sig') as f_in:
+        header = baca_header(f_in)
+        f_in.seek(0)
+        with PenulisReject(path_reject, header) as penulis_reject:
+            for chunk in iter_chunk_siswa(f_in, ukuran_chunk, penulis_reject):
+                if not chunk.ids:
+                    continue
+                _, nilai_saw, ranking = hitung_saw_batch(
+                    chunk.nilai_akademik, chunk.minat, chunk.ekonomi, chunk.prospek_kerja,
+                    katalog, bobot_kriteria, top_k=1
+                )
+                terbaik = ranking[:, 0]
+                nilai_terbaik = nilai_saw[np.arange(len(terbaik)), terbaik]
+                for id_siswa, j, nilai in zip(chunk.ids, terbaik.tolist(), nilai_terbaik.tolist()):
+                    daftar_isi.append((id_siswa, katalog.nama[j], nilai))
+    
+    # Tahap 2: bagian per siswa, dibuat saat dibutuhkan oleh layout
+    def laporan():
+        jumlah = 0
+        for skor in pipeline_kohort(path_input, None, ukuran_chunk, katalog,
+                                    bobot_kriteria, top_k=top_k, dengan_r=True):
+            chunk = skor.chunk
+            batch = susun_hasil(katalog, skor.ranking, skor.nilai_saw, skor.matriks_r)
+            for i, id_siswa in enumerate(chunk.ids):
+                hasil, detail = batch[i]
+                jumlah += 1
+                if progress is not None:
+                    progress(jumlah, time.perf_counter() - mulai)
+                yield (id_siswa, chunk.nilai_akademik[i], chunk.minat[i], chunk.ekonomi[i],
+                       chunk.prospek_kerja[i], hasil, detail, bobot_kriteria)
+    
+    total = generate_pdf_gabungan(daftar_isi, laporan(), output)
+    
+    detik = time.perf_counter() - mulai
+    return {
+        'laporan': total,
+        'ditolak': penulis_reject.jumlah,
+        'detik': detik,
+        'laporan_per_detik': total / detik if detik > 0 else 0.0,
+        'path_reject': path_reject
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Buat PDF report untuk satu kelas (ZIP atau satu PDF)")
+    parser.add_argument('input', help="File CSV siswa")
+    parser.add_argument('-o', '--output', required=True,
+                        help="File ZIP tujuan, atau file PDF jika --gabung")
+    parser.add_argument('--gabung', action='store_true',
+                        help="Tulis satu PDF dengan daftar isi, satu bagian per siswa")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument('--batch-size', type=int, default=UKURAN_BATCH_DEFAULT,
+                        help=f"Jumlah siswa per task worker (default: {UKURAN_BATCH_DEFAULT})")
+    parser.add_argument('--top-k', type=int, default=None,
+                        help="Hanya tampilkan k jurusan terbaik di laporan (default: semua)")
+    parser.add_argument('--reject', default=None,
+                        help="File CSV baris yang ditolak (default: <output>.reject.csv)")
+    parser.add_argument('--katalog', default=None,
+                        help="File katalog biner (default: JURUSAN_DATA, lihat data/katalog_biner.py)")
+    args = parser.parse_args(argv)
+    
+    def progress(jumlah, detik):
+        per_detik = jumlah / detik if detik > 0 else 0.0
+        print(f"\r⏳ {jumlah:,} laporan ({per_detik:,.1f} laporan/detik)",
+              end='', file=sys.stderr, flush=True)
+    
+    if args.gabung:
+        stat = buat_buku_laporan(args.input, args.output, top_k=args.top_k,
+                                 jurusan_data=args.katalog, progress=progress,
+                                 path_reject=args.reject)
+        print(f"\r✅ {stat['laporan']:,} laporan dalam {stat['detik']:.2f} detik "
+              f"({stat['laporan_per_detik']:,.1f} laporan/detik) -> {args.output}",
+              file=sys.stderr)
+    else:
+        stat = buat_laporan_massal(args.input, args.output, workers=args.workers,
+                                   ukuran_batch=args.batch_size, top_k=args.top_k,
+                                   jurusan_data=args.katalog, progress=progress,
+                                   path_reject=args.reject)
+        print(f"\r✅ {stat['laporan']:,} laporan ({stat['bytes'] / 2**20:,.1f} MB) dalam "
+              f"{stat['detik']:.2f} detik ({stat['laporan_per_detik']:,.1f} laporan/detik, "
+              f"{stat['workers']} workers) -> {args.output}", file=sys.stderr)
+    if stat['ditolak']:
+        print(f"⚠️ {stat['ditolak']:,} baris ditolak, lihat {stat['path_reject']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Service grafik perbandingan nilai SAW
+Grafik PNG (matplotlib) di-cache berdasarkan label & nilai SAW, dan dibuat
+dengan API object-oriented (Figure + FigureCanvasAgg) tanpa pyplot: figure
+tidak pernah masuk registry global pyplot, sehingga langsung dilepas setelah
+PNG dibuat dan aman dipakai dari banyak thread (sesi Streamlit).
+
+Sebagai alternatif, buat_grafik_plotly membuat grafik Plotly yang digambar
+di browser (tanpa rasterisasi di server).
+
+matplotlib & plotly baru di-import saat grafik pertama dibuat.
+"""
+
+import threading
+from collections import OrderedDict
+from io import BytesIO
+
+from utils.metrics import METRIK, kolektor_cache, terukur
+
+WARNA_BAR = ['#10b981', '#3b82f6', '#f59e0b', '#ef4444', '#6b7280']
+
+
+class CacheGrafik:
+    """
+    Cache LRU untuk PNG grafik nilai SAW dengan batas jumlah entri & byte
+    
+    Key cache: (label jurusan, nilai SAW, dpi). Nilai SAW yang sama selalu
+    menghasilkan PNG yang sama, sehingga grafik hanya dirender sekali.
+    Ukuran PNG bergantung pada jumlah jurusan dan dpi, sehingga total
+    ukuran juga dibatasi (maks_bytes), tidak hanya jumlah entri.
+    
+    Args:
+        maxsize (int): Jumlah maksimum entri sebelum entri terlama dibuang
+        maks_bytes (int): Total ukuran PNG di cache sebelum entri terlama
+            dibuang; PNG yang lebih besar dari ini tidak disimpan
+    """
+    
+    def __init__(self, maxsize=128, maks_bytes=8 * 2**20):
+        self.maxsize = maxsize
+        self.maks_bytes = maks_bytes
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+    
+    def render_png(self, jurusan_names, nilai_saw, dpi=150):
+        """
+        PNG grafik batang horizontal nilai SAW (memakai cache)
+        
+        Args:
+            jurusan_names (list): Label jurusan sesuai urutan ranking
+            nilai_saw (list): Nilai SAW sesuai urutan label
+            dpi (int): Resolusi PNG
+        
+        Returns:
+            bytes: Isi file PNG
+        """
+        key = (tuple(jurusan_names), tuple(float(v) for v in nilai_saw), dpi)
+        
+        with self._lock:
+            png = self._data.get(key)
+            if png is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return png
+        
+        png = _render_png(key[0], key[1], dpi)
+        with self._lock:
+            self.misses += 1
+            if len(png) <= self.maks_bytes:
+                # Thread lain bisa sudah menyimpan key yang sama
+                lama = self._data.pop(key, None)
+                if lama is not None:
+                    self._bytes -= len(lama)
+                self._data[key] = png
+                self._bytes += len(png)
+                while len(self._data) > self.maxsize or self._bytes > self.maks_bytes:
+                    _, lama = self._data.popitem(last=False)
+                    self._bytes -= len(lama)
+        return png
+    
+    def clear(self):
+        """Kosongkan cache dan reset statistik"""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+    
+    def info(self):
+        """
+        Statistik cache
+        
+        Returns:
+            dict: hits, misses, size, maxsize, hit_rate, bytes, maks_bytes
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / total if total else 0.0,
+                'bytes': self._bytes,
+                'maks_bytes': self.maks_bytes
+            }
+
+
+@terukur('grafik_png')
+def _render_png(jurusan_names, nilai_saw, dpi):
+    """Render grafik ke PNG, figure dilepas sebelum fungsi selesai"""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    
+    fig = Figure(figsize=(10, 4))
+    FigureCanvasAgg(fig)
+    try:
+        ax = fig.subplots()
+        bars = ax.barh(jurusan_names, nilai_saw, color=WARNA_BAR, height=0.6)
+        
+        ax.set_xlabel('Nilai SAW', fontsize=11, fontweight='bold')
+        ax.set_title('Perbandingan Nilai SAW', fontsize=12, fontweight='bold', pad=15)
+        ax.grid(axis='x', alpha=0.3, linestyle='--')
+        
+        for bar, nilai in zip(bars, nilai_saw):
+            width = bar.get_width()
+            ax.text(width + 0.01, bar.get_y() + bar.get_height()/2,
+                   f'{nilai:.3f}',
+                   ha='left', va='center', fontsize=9, fontweight='bold')
+        
+        fig.tight_layout()
+        buffer = BytesIO()
+        fig.savefig(buffer, format='png', dpi=dpi)
+        return buffer.getvalue()
+    finally:
+        # Putus referensi artist <-> figure agar memori langsung bisa dibebaskan
+        fig.clear()
+
+
+@terukur('grafik_plotly')
+def buat_grafik_plotly(jurusan_names, nilai_saw):
+    """
+    Grafik Plotly (digambar di browser) dengan tampilan sama seperti PNG
+    
+    Args:
+        jurusan_names (list): Label jurusan sesuai urutan ranking
+        nilai_saw (list): Nilai SAW sesuai urutan label
+    
+    Returns:
+        plotly.graph_objects.Figure: Figure untuk st.plotly_chart
+    """
+    import plotly.graph_objects as go
+    
+    nilai_saw = [float(v) for v in nilai_saw]
+    fig = go.Figure(go.Bar(
+        x=nilai_saw,
+        y=list(jurusan_names),
+        orientation='h',
+        marker_color=[WARNA_BAR[i % len(WARNA_BAR)] for i in range(len(nilai_saw))],
+        text=[f'{v:.3f}' for v in nilai_saw],
+        textposition='outside',
+        hovertemplate='%{y}: %{x:.4f}<extra></extra>'
+    ))
+    fig.update_layout(
+        title={'text': '<b>Perbandingan Nilai SAW</b>', 'x': 0.5},
+        xaxis={'title': '<b>Nilai SAW</b>', 'gridcolor': 'rgba(0,0,0,0.1)', 'griddash': 'dash'},
+        height=400,
+        margin={'l': 10, 'r': 10, 't': 50, 'b': 10},
+        plot_bgcolor='white'
+    )
+    return fig
+
+
+# Cache default untuk satu proses
+CACHE_GRAFIK = CacheGrafik()
+METRIK.daftar_kolektor(kolektor_cache('grafik', CACHE_GRAFIK))
+
+
+def render_grafik_png(jurusan_names, nilai_saw, dpi=150):
+    """
+    PNG grafik perbandingan nilai SAW memakai CACHE_GRAFIK
+    
+    Args:
+        Sama seperti CacheGrafik.render_png
+    
+    Returns:
+        bytes: Isi file PNG
+    """
+    return CACHE_GRAFIK.render_png(jurusan_names, nilai_saw, dpi=dpi)
@@ -0,0 +1,235 @@
+"""
+Indeks terbalik hasil SAW satu angkatan: siswa terbaik per jurusan
+Menjawab pertanyaan "siapa N siswa yang paling cocok untuk jurusan X?"
+tanpa menghitung ulang hitung_saw per siswa. Setiap jurusan menyimpan
+urutan siswa (descending berdasarkan nilai SAW) yang diperbarui secara
+inkremental setiap kali chunk siswa baru dihitung.
+
+Contoh:
+    indeks = IndeksTopSiswa(KATALOG_JURUSAN.kode, kapasitas=500)
+    for hasil in pipeline_kohort('siswa.csv'):
+        indeks.tambah_chunk(hasil)
+    indeks.top('A1', 200)
+"""
+
+import numpy as np
+
+from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA, get_katalog
+from utils.cohort_ingest import pipeline_kohort
+from utils.saw_calculator import urutkan_ranking
+
+# Jumlah baris HasilBiner yang dibaca sekaligus saat membangun indeks
+_UKURAN_BLOK_BINER = 65536
+
+# Jumlah siswa terbaik per jurusan yang disimpan jika kapasitas tidak diisi.
+# Dengan kapasitas terbatas biaya setiap tambah() hanya bergantung pada
+# ukuran chunk, bukan jumlah siswa yang sudah masuk.
+KAPASITAS_DEFAULT = 1000
+
+
+def _gabung_urutan(siswa_lama, nilai_lama, siswa_baru, nilai_baru, kapasitas=None):
+    """
+    Gabung dua urutan descending per baris tanpa sort ulang dari nol
+    
+    Gabungan [lama, baru] terdiri dari dua run yang sudah urut, sehingga
+    sort stabil (timsort) cukup melakukan satu merge linear per baris,
+    lebih murah daripada partial selection + sort k kandidat. Nilai yang
+    sama: elemen lama di depan (termasuk NaN di akhir).
+    
+    Returns:
+        tuple: (siswa, nilai) berukuran (M, min(kapasitas, n_lama + n_baru))
+    """
+    siswa = np.concatenate((siswa_lama, siswa_baru), axis=1)
+    nilai = np.concatenate((nilai_lama, nilai_baru), axis=1)
+    urutan = urutkan_ranking(nilai)[:, :kapasitas]
+    return np.take_along_axis(siswa, urutan, axis=1), np.take_along_axis(nilai, urutan, axis=1)
+
+
+class IndeksTopSiswa:
+    """
+    Urutan siswa per jurusan berdasarkan nilai SAW
+    
+    Per jurusan disimpan array nomor siswa dan nilai SAW yang sudah urut
+    descending. Nilai yang sama diurutkan sesuai urutan siswa ditambahkan
+    (siswa yang lebih dulu masuk di depan), sama seperti sort stabil.
+    Chunk baru di-sort sendiri (cukup kapasitas teratas) lalu di-merge
+    dengan urutan lama, sehingga siswa lama tidak di-sort ulang.
+    
+    Id siswa hanya disimpan selama siswa tersebut masih ada di urutan
+    salah satu jurusan, sehingga dengan kapasitas terbatas memori indeks
+    tetap M x kapasitas berapa pun jumlah siswanya.
+    
+    Args:
+        kode_jurusan (list): Kode jurusan sesuai urutan kolom nilai_saw
+        kapasitas (int, optional): Hanya simpan sejumlah ini siswa terbaik
+            per jurusan. Default KAPASITAS_DEFAULT. None = semua siswa;
+            setiap tambah() lalu menggabung ulang seluruh urutan lama,
+            sehingga total biayanya kuadratik terhadap jumlah chunk.
+    """
+    
+    def __init__(self, kode_jurusan, kapasitas=KAPASITAS_DEFAULT):
+        self.kode_jurusan = list(kode_jurusan)
+        self.kapasitas = kapasitas
+        self.jumlah = 0
+        self._ids = {}
+        self._indeks_kode = {k: i for i, k in enumerate(self.kode_jurusan)}
+        m = len(self.kode_jurusan)
+        self._siswa = np.zeros((m, 0), dtype=np.int64)
+        self._nilai = np.zeros((m, 0), dtype=np.float64)
+    
+    def __len__(self):
+        """Jumlah siswa yang sudah ditambahkan"""
+        return self.jumlah
+    
+    def tambah(self, ids, nilai_saw):
+        """
+        Tambahkan siswa yang sudah dihitung ke indeks
+        
+        Args:
+            ids (list): Id siswa (N,)
+            nilai_saw (np.ndarray): Nilai SAW (N, M) dari hitung_saw_batch
+        """
+        nilai_baru = np.asarray(nilai_saw, dtype=np.float64).T
+        if nilai_baru.shape != (len(self.kode_jurusan), len(ids)):
+            raise ValueError(
+                f"nilai_saw harus berukuran ({len(ids)}, {len(self.kode_jurusan)}), "
+                f"saat ini: {nilai_baru.shape[::-1]}"
+            )
+        if not len(ids):
+            return
+        
+        # Urutkan chunk baru per jurusan (cukup kapasitas teratas)
+        awal = self.jumlah
+        urutan = urutkan_ranking(nilai_baru, self.kapasitas)
+        siswa_baru = urutan + awal
+        nilai_baru = np.take_along_axis(nilai_baru, urutan, axis=1)
+        self.jumlah += len(ids)
+        
+        # Gabung dengan urutan lama (merge, tanpa sort ulang); siswa lama di
+        # depan agar nilai yang sama tetap urut sesuai waktu masuk
+        self._siswa, self._nilai = _gabung_urutan(
+            self._siswa, self._nilai, siswa_baru, nilai_baru, self.kapasitas
+        )
+        
+        # Simpan id yang masih dirujuk saja; siswa yang tergeser dari semua
+        # jurusan tidak akan muncul lagi di top()
+        if self.kapasitas is None:
+            self._ids.update(zip(range(awal, self.jumlah), ids))
+            return
+        ids = list(ids)
+        self._ids = {
+            nomor: self._ids[nomor] if nomor < awal else ids[nomor - awal]
+            for nomor in np.unique(self._siswa).tolist()
+        }
+    
+    def tambah_chunk(self, chunk_hasil):
+        """
+        Tambahkan ChunkHasil dari pipeline_kohort / skor_chunk_siswa
+        
+        Args:
+            chunk_hasil (ChunkHasil): Hasil satu chunk
+        """
+        if list(chunk_hasil.kode) != self.kode_jurusan:
+            raise ValueError("Kode jurusan chunk tidak sama dengan indeks")
+        self.tambah(chunk_hasil.chunk.ids, chunk_hasil.nilai_saw)
+    
+    def _kolom(self, kode_jurusan):
+        if kode_jurusan not in self._indeks_kode:
+            raise KeyError(f"Kode jurusan tidak dikenal: {kode_jurusan}")
+        return self._indeks_kode[kode_jurusan]
+    
+    def top_array(self, kode_jurusan, n):
+        """
+        N siswa terbaik untuk satu jurusan sebagai array
+        
+        Args:
+            kode_jurusan (str): Kode jurusan
+            n (int): Jumlah siswa
+        
+        Returns:
+            tuple: (nomor_siswa, nilai_saw), masing-masing np.ndarray (n,)
+                - nomor_siswa: Nomor urut siswa saat ditambahkan (mulai 0)
+        """
+        j = self._kolom(kode_jurusan)
+        if self.kapasitas is not None and n > self.kapasitas:
+            raise ValueError(f"n melebihi kapasitas indeks ({self.kapasitas})")
+        return self._siswa[j, :n], self._nilai[j, :n]
+    
+    def top(self, kode_jurusan, n):
+        """
+        N siswa terbaik untuk satu jurusan
+        
+        Args:
+            kode_jurusan (str): Kode jurusan
+            n (int): Jumlah siswa
+        
+        Returns:
+            list: List dictionary {'Peringkat', 'Id', 'Nilai SAW'}
+        """
+        siswa, nilai = self.top_array(kode_jurusan, n)
+        return [
+            {'Peringkat': i, 'Id': self._ids[s], 'Nilai SAW': v}
+            for i, (s, v) in enumerate(zip(siswa.tolist(), nilai.tolist()), 1)
+        ]
+    
+    def peringkat(self, kode_jurusan, nomor_siswa):
+        """
+        Peringkat siswa (berdasarkan nomor urut masuk) untuk satu jurusan
+        
+        Returns:
+            int | None: Peringkat (1 = terbaik), None jika di luar kapasitas
+        """
+        j = self._kolom(kode_jurusan)
+        posisi = np.flatnonzero(self._siswa[j] == nomor_siswa)
+        return int(posisi[0]) + 1 if len(posisi) else None
+
+
+def indeks_dari_hasil_biner(hasil_biner, kapasitas=KAPASITAS_DEFAULT,
+                            ukuran_blok=_UKURAN_BLOK_BINER):
+    """
+    Bangun IndeksTopSiswa dari direktori hasil biner (utils.result_store)
+    
+    Nilai SAW dibaca per blok dari memory-map, sehingga file yang lebih
+    besar dari memori tetap bisa diindeks jika kapasitas diisi.
+    
+    Args:
+        hasil_biner (HasilBiner): Hasil dari baca_hasil_biner
+        kapasitas (int, optional): Jumlah siswa terbaik per jurusan
+            (default KAPASITAS_DEFAULT, None = semua siswa)
+        ukuran_blok (int): Jumlah baris per blok
+    
+    Returns:
+        IndeksTopSiswa: Indeks semua siswa di file
+    """
+    indeks = IndeksTopSiswa(hasil_biner.kode_jurusan, kapasitas=kapasitas)
+    for awal in range(0, len(hasil_biner), ukuran_blok):
+        akhir = min(awal + ukuran_blok, len(hasil_biner))
+        indeks.tambah(hasil_biner.ids(awal, akhir), hasil_biner.nilai_saw[awal:akhir])
+    return indeks
+
+
+def indeks_dari_csv(path_input, kapasitas=KAPASITAS_DEFAULT, ukuran_chunk=10000,
+                    jurusan_data=None, bobot_kriteria=None, path_reject=None):
+    """
+    Hitung SAW file siswa secara streaming dan bangun IndeksTopSiswa
+    
+    Args:
+        path_input (str): Path file CSV siswa
+        kapasitas (int, optional): Jumlah siswa terbaik per jurusan
+            (default KAPASITAS_DEFAULT, None = semua siswa)
+        ukuran_chunk (int): Jumlah baris per chunk
+        jurusan_data (dict | KatalogJurusan, optional): Default JURUSAN_DATA
+        bobot_kriteria (dict, optional): Default BOBOT_KRITERIA
+        path_reject (str, optional): Path file CSV untuk baris yang ditolak
+    
+    Returns:
+        IndeksTopSiswa: Indeks semua siswa yang valid
+    """
+    katalog = get_katalog(JURUSAN_DATA if jurusan_data is None else jurusan_data)
+    bobot_kriteria = BOBOT_KRITERIA if bobot_kriteria is None else bobot_kriteria
+    
+    indeks = IndeksTopSiswa(katalog.kode, kapasitas=kapasitas)
+    for hasil in pipeline_kohort(path_input, path_reject, ukuran_chunk=ukuran_chunk,
+                                 jurusan_data=katalog, bobot_kriteria=bobot_kriteria):
+        indeks.tambah_chunk(hasil)
+    return indeks
@@ -0,0 +1,290 @@
+"""
+Ingest file siswa (cohort) secara streaming
+File dibaca per chunk dengan ukuran tetap, setiap baris divalidasi dengan
+aturan validasi_input, lalu chunk yang valid dihitung dan diteruskan ke
+tahap berikutnya. Pemakaian memori bergantung pada ukuran chunk, bukan
+ukuran file. Baris yang tidak valid ditulis ke file reject terpisah.
+"""
+
+import csv
+from collections import namedtuple
+
+from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA, get_katalog
+from utils.metrics import terukur
+from utils.saw_calculator import (
+    hitung_matriks_normalisasi, hitung_nilai_preferensi, hitung_saw_batch,
+    urutkan_ranking, validasi_input
+)
+
+KOLOM_WAJIB = ('nilai_akademik', 'minat', 'ekonomi', 'prospek_kerja')
+
+ChunkSiswa = namedtuple('ChunkSiswa', [
+    'nomor_baris', 'ids', 'nilai_akademik', 'minat', 'ekonomi', 'prospek_kerja'
+])
+ChunkSiswa.__doc__ = """
+Satu chunk siswa yang sudah lolos validasi (semua field berupa list sepanjang N)
+"""
+
+ChunkHasil = namedtuple('ChunkHasil', ['chunk', 'kode', 'nilai_saw', 'ranking', 'matriks_r'])
+ChunkHasil.__doc__ = """
+Hasil perhitungan SAW untuk satu ChunkSiswa (matriks_r None jika tidak diminta)
+"""
+
+
+def kolom_id(header):
+    """Nama kolom yang dipakai sebagai id siswa (None = nomor baris)"""
+    for nama in ('id', 'nama'):
+        if nama in header:
+            return nama
+    return None
+
+
+def baca_header(file_input):
+    """
+    Baca dan cek header file siswa
+    
+    Args:
+        file_input (file): File teks yang sudah dibuka, posisi di awal file
+    
+    Returns:
+        list: Nama kolom
+    
+    Raises:
+        ValueError: Jika ada kolom wajib yang tidak ada
+    """
+    header = next(csv.reader(file_input), [])
+    if header:
+        # BOM dari file yang dibuka tanpa encoding 'utf-8-sig'
+        header[0] = header[0].lstrip('\ufeff')
+    kurang = [k for k in KOLOM_WAJIB if k not in header]
+    if kurang:
+        raise ValueError(f"Kolom wajib tidak ada: {', '.join(kurang)}")
+    return header
+
+
+def baca_chunk(file_input, ukuran_chunk, nomor_awal=2):
+    """
+    Baca file per chunk record CSV
+    
+    Satu csv.reader dipakai untuk seluruh file, sehingga field ber-quote
+    yang berisi baris baru tetap menjadi satu record. Nomor baris setiap
+    record (baris awalnya di file) dihitung dari reader.line_num.
+    
+    Args:
+        file_input (file): File teks yang sudah dibuka dengan newline=''
+            (setelah header)
+        ukuran_chunk (int): Jumlah record per chunk
+        nomor_awal (int): Nomor baris file untuk baris pertama yang dibaca
+    
+    Yields:
+        tuple: (list_nomor_baris, list_row)
+    """
+    reader = csv.reader(file_input)
+    geser = nomor_awal - 1
+    nomor = []
+    rows = []
+    akhir = 0
+    for row in reader:
+        nomor.append(geser + akhir + 1)
+        akhir = reader.line_num
+        rows.append(row)
+        if len(rows) >= ukuran_chunk:
+            yield nomor, rows
+            nomor = []
+            rows = []
+    if rows:
+        yield nomor, rows
+
+
+def parse_chunk(header, nomor_baris, rows):
+    """
+    Parse dan validasi satu chunk record dari baca_chunk
+    
+    Setiap baris dicek dengan validasi_input. Baris kosong dilewati,
+    baris yang tidak valid dikumpulkan sebagai reject.
+    
+    Args:
+        header (list): Nama kolom file input
+        nomor_baris (list): Nomor baris file untuk setiap record
+        rows (list): Record CSV (list of str)
+    
+    Returns:
+        tuple: (chunk_siswa, ditolak)
+            - chunk_siswa: ChunkSiswa berisi baris yang valid
+            - ditolak: List (nomor_baris, alasan, row)
+    """
+    posisi = {nama: i for i, nama in enumerate(header)}
+    p_nilai = posisi['nilai_akademik']
+    p_minat = posisi['minat']
+    p_ekonomi = posisi['ekonomi']
+    p_prospek = posisi['prospek_kerja']
+    p_id = posisi.get(kolom_id(header))
+    
+    chunk = ChunkSiswa([], [], [], [], [], [])
+    ditolak = []
+    
+    for nomor, row in zip(nomor_baris, rows):
+        if not row:
+            continue
+        if len(row) != len(header):
+            ditolak.append((nomor, f"Jumlah kolom harus {len(header)}, saat ini: {len(row)}", row))
+            continue
+        
+        try:
+            nilai_akademik = float(row[p_nilai])
+            prospek_kerja = float(row[p_prospek])
+        except ValueError:
+            ditolak.append((nomor, "Nilai akademik dan prospek kerja harus berupa angka", row))
+            continue
+        
+        minat = row[p_minat].strip()
+        ekonomi = row[p_ekonomi].strip()
+        
+        is_valid, error_msg = validasi_input(nilai_akademik, minat, ekonomi, prospek_kerja)
+        if not is_valid:
+            ditolak.append((nomor, error_msg, row))
+            continue
+        
+        chunk.nomor_baris.append(nomor)
+        chunk.ids.append(row[p_id] if p_id is not None else str(nomor - 1))
+        chunk.nilai_akademik.append(nilai_akademik)
+        chunk.minat.append(minat)
+        chunk.ekonomi.append(ekonomi)
+        chunk.prospek_kerja.append(prospek_kerja)
+    
+    return chunk, ditolak
+
+
+class PenulisReject:
+    """
+    Penulis file reject (CSV) yang baru dibuat saat ada baris pertama ditolak
+    
+    Format: nomor_baris, alasan, lalu kolom asli dari file input.
+    
+    Args:
+        path (str | None): Path file reject. None = reject hanya dihitung.
+        header (list): Header file input
+    """
+    
+    def __init__(self, path, header):
+        self.path = path
+        self.header = header
+        self.jumlah = 0
+        self._file = None
+        self._writer = None
+    
+    def tulis(self, ditolak):
+        """Tulis list (nomor_baris, alasan, row) dari parse_chunk"""
+        if not ditolak:
+            return
+        self.jumlah += len(ditolak)
+        if self.path is None:
+            return
+        if self._writer is None:
+            self._file = open(self.path, 'w', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._file, lineterminator='\n')
+            self._writer.writerow(['nomor_baris', 'alasan'] + list(self.header))
+        for nomor, alasan, row in ditolak:
+            self._writer.writerow([nomor, alasan] + list(row))
+    
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def iter_chunk_siswa(file_input, ukuran_chunk, penulis_reject=None):
+    """
+    Generator ChunkSiswa yang sudah divalidasi dari file yang terbuka
+    
+    Args:
+        file_input (file): File teks siswa, posisi di awal file (header)
+        ukuran_chunk (int): Jumlah baris per chunk
+        penulis_reject (PenulisReject, optional): Tujuan baris yang ditolak
+    
+    Yields:
+        ChunkSiswa: Chunk berisi baris valid (bisa kosong jika semua ditolak)
+    """
+    header = baca_header(file_input)
+    for nomor_baris, rows in baca_chunk(file_input, ukuran_chunk):
+        chunk, ditolak = parse_chunk(header, nomor_baris, rows)
+        if penulis_reject is not None:
+            penulis_reject.tulis(ditolak)
+        yield chunk
+
+
+@terukur('skor_chunk_siswa')
+def skor_chunk_siswa(chunk, jurusan_data, bobot_kriteria, top_k=None, dengan_r=False):
+    """
+    Hitung SAW untuk satu ChunkSiswa
+    
+    Args:
+        chunk (ChunkSiswa): Chunk siswa yang valid
+        jurusan_data (dict | KatalogJurusan): Data semua jurusan
+        bobot_kriteria (dict): Bobot untuk setiap kriteria
+        top_k (int, optional): Jumlah jurusan terbaik dalam ranking
+        dengan_r (bool): Sertakan tensor R1-R4 (N, M, 4) di hasil
+    
+    Returns:
+        ChunkHasil: Chunk beserta kode jurusan, nilai SAW (N, M), dan ranking
+    """
+    if not dengan_r:
+        kode, nilai_saw, ranking = hitung_saw_batch(
+            chunk.nilai_akademik, chunk.minat, chunk.ekonomi, chunk.prospek_kerja,
+            jurusan_data, bobot_kriteria, top_k=top_k
+        )
+        return ChunkHasil(chunk, kode, nilai_saw, ranking, None)
+    
+    kode, matriks_r = hitung_matriks_normalisasi(
+        chunk.nilai_akademik, chunk.minat, chunk.ekonomi, chunk.prospek_kerja,
+        jurusan_data
+    )
+    # Penjumlahan eksplisit agar nilai identik dengan hitung_saw_batch
+    nilai_saw = hitung_nilai_preferensi(
+        matriks_r[..., 0], matriks_r[..., 1], matriks_r[..., 2], matriks_r[..., 3],
+        bobot_kriteria
+    )
+    return ChunkHasil(chunk, kode, nilai_saw, urutkan_ranking(nilai_saw, top_k), matriks_r)
+
+
+def pipeline_kohort(path_input, path_reject=None, ukuran_chunk=10000,
+                    jurusan_data=None, bobot_kriteria=None, top_k=None, dengan_r=False):
+    """
+    Pipeline streaming: baca -> validasi -> hitung SAW, per chunk
+    
+    Hanya satu chunk yang berada di memori pada satu waktu. Chunk yang
+    semua barisnya ditolak tidak diteruskan.
+    
+    Contoh:
+        for hasil in pipeline_kohort('siswa.csv', 'reject.csv'):
+            simpan(hasil)
+    
+    Args:
+        path_input (str): Path file CSV siswa
+        path_reject (str, optional): Path file CSV untuk baris yang ditolak
+        ukuran_chunk (int): Jumlah baris per chunk
+        jurusan_data (dict | KatalogJurusan, optional): Default JURUSAN_DATA
+        bobot_kriteria (dict, optional): Default BOBOT_KRITERIA
+        top_k (int, optional): Jumlah jurusan terbaik dalam ranking
+        dengan_r (bool): Sertakan tensor R1-R4 di setiap ChunkHasil
+    
+    Yields:
+        ChunkHasil: Hasil perhitungan per chunk
+    """
+    katalog = get_katalog(JURUSAN_DATA if jurusan_data is None else jurusan_data)
+    bobot_kriteria = BOBOT_KRITERIA if bobot_kriteria is None else bobot_kriteria
+    
+    with open(path_input, newline='', encoding='utf-8-sig') as f_in:
+        header = baca_header(f_in)
+        f_in.seek(0)
+        with PenulisReject(path_reject, header) as penulis_reject:
+            for chunk in iter_chunk_siswa(f_in, ukuran_chunk, penulis_reject):
+                if chunk.ids:
+                    yield skor_chunk_siswa(chunk, katalog, bobot_kriteria,
+                                           top_k=top_k, dengan_r=dengan_r)
@@ -0,0 +1,292 @@
+"""
+Perhitungan SAW untuk satu angkatan (cohort) dari command line
+File siswa dipecah menjadi chunk, setiap chunk dihitung paralel di process
+pool, lalu ranking ditulis ke file output sesuai urutan input
+
+Contoh (dari root project):
+    python -m utils.cohort_scorer siswa.csv -o ranking.csv --workers 8 --chunk-size 20000
+
+Format input (CSV dengan header):
+    id,nilai_akademik,minat,ekonomi,prospek_kerja
+    S001,85,IPA,Sedang,90
+Kolom id boleh diganti 'nama'; jika tidak ada, nomor baris dipakai sebagai id.
+Baris yang tidak lolos validasi_input ditulis ke file reject (--reject).
+
+Output bisa berupa CSV (default) atau direktori biner kolumnar yang bisa
+di-memory-map (--format biner, lihat utils/result_store.py):
+    python -m utils.cohort_scorer siswa.csv -o hasil.saw --format biner
+
+Katalog jurusan besar bisa diberikan sebagai file katalog biner
+(lihat data/katalog_biner.py), dibuka dengan memory-map oleh setiap worker:
+    python -m utils.cohort_scorer siswa.csv -o ranking.csv --katalog nasional.katalog --top-k 10
+"""
+
+import argparse
+import csv
+import io
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA, get_katalog
+from utils.cohort_ingest import (
+    PenulisReject, baca_chunk, baca_header, parse_chunk, skor_chunk_siswa
+)
+from utils.result_store import PenulisHasilBiner
+from utils.saw_calculator import validasi_top_k
+
+FORMAT_OUTPUT = ('csv', 'biner')
+
+# Batas kira-kira memori satu chunk di worker (R1-R4, V, dan array sementara
+# berukuran siswa x jurusan), agar katalog besar tidak membuat worker kehabisan memori
+BATAS_MEMORI_CHUNK_MB = 256
+_ARRAY_PER_ELEMEN = 10
+
+# Katalog & bobot per worker, diisi sekali oleh _init_worker
+_KATALOG = None
+_BOBOT = None
+
+
+def _init_worker(jurusan_data, bobot_kriteria):
+    """Kompilasi katalog sekali per proses worker"""
+    global _KATALOG, _BOBOT
+    _KATALOG = get_katalog(jurusan_data)
+    _BOBOT = bobot_kriteria
+
+
+def skor_chunk(header, nomor_baris, rows, top_k, format_output='csv', dengan_r=True):
+    """
+    Parse, validasi, dan hitung SAW untuk satu chunk
+    
+    Args:
+        header (list): Nama kolom file input
+        nomor_baris (list): Nomor baris file untuk setiap record
+        rows (list): Record CSV dari baca_chunk
+        top_k (int | None): Jumlah jurusan terbaik yang ditulis
+        format_output (str): 'csv' atau 'biner'
+        dengan_r (bool): Sertakan R1-R4 (hanya untuk format biner)
+    
+    Returns:
+        tuple: (data_output, jumlah_baris_valid, ditolak)
+            - data_output: Teks CSV, atau tuple (ids, nilai_saw, ranking,
+              matriks_r) untuk format biner, None jika chunk kosong
+    """
+    chunk, ditolak = parse_chunk(header, nomor_baris, rows)
+    if not chunk.ids:
+        return None, 0, ditolak
+    
+    if format_output == 'biner':
+        hasil = skor_chunk_siswa(chunk, _KATALOG, _BOBOT, top_k=top_k, dengan_r=dengan_r)
+        data = (chunk.ids, hasil.nilai_saw, hasil.ranking, hasil.matriks_r)
+    else:
+        hasil = skor_chunk_siswa(chunk, _KATALOG, _BOBOT, top_k=top_k)
+        data = format_ranking(chunk.ids, hasil.kode, hasil.nilai_saw, hasil.ranking)
+    return data, len(chunk.ids), ditolak
+
+
+def format_ranking(ids, kode, nilai_saw, ranking):
+    """
+    Format ranking menjadi baris CSV: id, kode_1, nilai_1, ..., kode_k, nilai_k
+    
+    Returns:
+        str: Teks CSV tanpa header
+    """
+    nilai_urut = np.take_along_axis(nilai_saw, ranking, axis=1).tolist()
+    
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator='\n')
+    for id_siswa, urutan, nilai in zip(ids, ranking.tolist(), nilai_urut):
+        row = [id_siswa]
+        for j, v in zip(urutan, nilai):
+            row.append(kode[j])
+            row.append(f"{v:.6f}")
+        writer.writerow(row)
+    return buffer.getvalue()
+
+
+def header_output(jumlah_kolom):
+    """Header file output untuk jumlah_kolom jurusan teratas"""
+    header = ['id']
+    for i in range(1, jumlah_kolom + 1):
+        header += [f'kode_{i}', f'nilai_{i}']
+    return header
+
+
+class _PenulisCsv:
+    """Penulis output CSV ranking (header ditulis saat dibuka)"""
+    
+    def __init__(self, path, jumlah_kolom):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        csv.writer(self._file, lineterminator='\n').writerow(header_output(jumlah_kolom))
+    
+    def tulis(self, teks):
+        self._file.write(teks)
+    
+    def close(self):
+        self._file.close()
+
+
+class _PenulisBiner:
+    """Adapter PenulisHasilBiner untuk data dari skor_chunk"""
+    
+    def __init__(self, path, katalog, bobot_kriteria, dengan_r, dengan_kolom):
+        self._penulis = PenulisHasilBiner(
+            path, katalog.kode.tolist(), katalog.nama.tolist(),
+            bobot_kriteria=bobot_kriteria, simpan_r=dengan_r, simpan_kolom=dengan_kolom
+        )
+    
+    def tulis(self, data):
+        ids, nilai_saw, ranking, matriks_r = data
+        self._penulis.tulis(ids, nilai_saw, ranking, matriks_r)
+    
+    def close(self):
+        self._penulis.close()
+
+
+def _batasi_ukuran_chunk(ukuran_chunk, jumlah_jurusan):
+    """Perkecil chunk jika (siswa x jurusan) melebihi BATAS_MEMORI_CHUNK_MB"""
+    batas_elemen = BATAS_MEMORI_CHUNK_MB * 2**20 // (8 * _ARRAY_PER_ELEMEN)
+    return max(1, min(ukuran_chunk, batas_elemen // max(jumlah_jurusan, 1)))
+
+
+def skor_kohort(path_input, path_output, workers=None, ukuran_chunk=20000,
+                top_k=None, jurusan_data=None, bobot_kriteria=None, progress=None,
+                path_reject=None, format_output='csv', dengan_r=True, dengan_kolom=True):
+    """
+    Hitung ranking SAW untuk seluruh file siswa memakai process pool
+    
+    Jumlah chunk yang sedang diproses dibatasi (2 x workers) sehingga memori
+    tidak bergantung pada ukuran file, dan output ditulis sesuai urutan input.
+    
+    Args:
+        path_input (str): Path file CSV siswa
+        path_output (str): Path file CSV ranking, atau direktori untuk format biner
+        workers (int, optional): Jumlah proses (default: jumlah CPU)
+        ukuran_chunk (int): Jumlah baris per chunk (diperkecil otomatis untuk
+            katalog besar, lihat BATAS_MEMORI_CHUNK_MB)
+        top_k (int, optional): Jumlah jurusan teratas yang ditulis (default: semua)
+        jurusan_data (dict | KatalogJurusan | str, optional): Data jurusan atau
+            path katalog biner (default: JURUSAN_DATA). Katalog biner dibuka
+            ulang oleh setiap worker dengan memory-map yang sama.
+        bobot_kriteria (dict, optional): Bobot (default: BOBOT_KRITERIA)
+        progress (callable, optional): Dipanggil dengan jumlah baris yang sudah ditulis
+        path_reject (str, optional): File CSV untuk baris yang ditolak
+            (default: <path_output>.reject.csv, hanya dibuat jika ada reject)
+        format_output (str): 'csv' atau 'biner'
+        dengan_r (bool): Simpan R1-R4 di output biner
+        dengan_kolom (bool): Simpan salinan transpos nilai SAW di output biner
+            (baca per jurusan, lihat utils/result_store.py)
+    
+    Returns:
+        dict: Statistik (baris, ditolak, detik, baris_per_detik, workers)
+    """
+    if format_output not in FORMAT_OUTPUT:
+        raise ValueError(f"Format output harus salah satu dari {FORMAT_OUTPUT}")
+    
+    workers = workers or os.cpu_count() or 1
+    jurusan_data = JURUSAN_DATA if jurusan_data is None else jurusan_data
+    bobot_kriteria = BOBOT_KRITERIA if bobot_kriteria is None else bobot_kriteria
+    katalog = get_katalog(jurusan_data)
+    path_reject = path_output + '.reject.csv' if path_reject is None else path_reject
+    jumlah_kolom = len(katalog) if top_k is None else validasi_top_k(top_k, len(katalog))
+    
+    ukuran_chunk = _batasi_ukuran_chunk(ukuran_chunk, len(katalog))
+    
+    mulai = time.perf_counter()
+    total = 0
+    
+    if format_output == 'biner':
+        penulis = _PenulisBiner(path_output, katalog, bobot_kriteria, dengan_r, dengan_kolom)
+    else:
+        penulis = _PenulisCsv(path_output, jumlah_kolom)
+    
+    try:
+        with open(path_input, newline='', encoding='utf-8-sig') as f_in, \
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                    initargs=(katalog, bobot_kriteria)) as pool:
+            header = baca_header(f_in)
+            
+            with PenulisReject(path_reject, header) as penulis_reject:
+                antrian = deque()
+                
+                def tulis_satu():
+                    nonlocal total
+                    data, jumlah, ditolak = antrian.popleft().result()
+                    if data is not None:
+                        penulis.tulis(data)
+                    penulis_reject.tulis(ditolak)
+                    total += jumlah
+                    if progress is not None:
+                        progress(total)
+                
+                for nomor_baris, rows in baca_chunk(f_in, ukuran_chunk):
+                    antrian.append(pool.submit(skor_chunk, header, nomor_baris, rows,
+                                               top_k, format_output, dengan_r))
+                    if len(antrian) >= 2 * workers:
+                        tulis_satu()
+                
+                while antrian:
+                    tulis_satu()
+    finally:
+        penulis.close()
+    
+    detik = time.perf_counter() - mulai
+    return {
+        'baris': total,
+        'ditolak': penulis_reject.jumlah,
+        'detik': detik,
+        'baris_per_detik': total / detik if detik > 0 else 0.0,
+        'workers': workers,
+        'path_reject': path_reject
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hitung ranking SAW untuk satu angkatan siswa")
+    parser.add_argument('input', help="File CSV siswa")
+    parser.add_argument('-o', '--output', required=True,
+                        help="File CSV hasil ranking, atau direktori untuk format biner")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument('--chunk-size', type=int, default=20000,
+                        help="Jumlah baris per chunk (default: 20000)")
+    parser.add_argument('--top-k', type=int, default=None,
+                        help="Hanya tulis k jurusan terbaik (default: semua)")
+    parser.add_argument('--reject', default=None,
+                        help="File CSV baris yang ditolak (default: <output>.reject.csv)")
+    parser.add_argument('--format', choices=FORMAT_OUTPUT, default=None,
+                        help="Format output (default: biner jika output berakhiran .saw, selain itu csv)")
+    parser.add_argument('--tanpa-r', action='store_true',
+                        help="Jangan simpan R1-R4 di output biner")
+    parser.add_argument('--tanpa-kolom', action='store_true',
+                        help="Jangan simpan salinan transpos nilai SAW (per jurusan) di output biner")
+    parser.add_argument('--katalog', default=None,
+                        help="File katalog biner (default: JURUSAN_DATA, lihat data/katalog_biner.py)")
+    args = parser.parse_args(argv)
+    
+    format_output = args.format
+    if format_output is None:
+        format_output = 'biner' if args.output.rstrip('/\\').endswith('.saw') else 'csv'
+    
+    def progress(jumlah):
+        print(f"\r⏳ {jumlah:,} baris", end='', file=sys.stderr, flush=True)
+    
+    stat = skor_kohort(args.input, args.output, workers=args.workers,
+                       ukuran_chunk=args.chunk_size, top_k=args.top_k,
+                       jurusan_data=args.katalog, progress=progress,
+                       path_reject=args.reject, format_output=format_output,
+                       dengan_r=not args.tanpa_r, dengan_kolom=not args.tanpa_kolom)
+    
+    print(f"\r✅ {stat['baris']:,} baris dalam {stat['detik']:.2f} detik "
+          f"({stat['baris_per_detik']:,.0f} baris/detik, {stat['workers']} workers)",
+          file=sys.stderr)
+    if stat['ditolak']:
+        print(f"⚠️ {stat['ditolak']:,} baris ditolak, lihat {stat['path_reject']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
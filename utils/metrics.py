@@ -0,0 +1,327 @@
+"""
+Instrumentasi ringan: timer, counter, dan histogram latency per tahap
+Metrik diekspor dalam format teks Prometheus, lewat file (untuk textfile
+collector node_exporter) atau endpoint HTTP lokal /metrics.
+
+Nonaktif secara default. Saat nonaktif, timer dan counter hanya memeriksa
+satu atribut lalu langsung kembali (tanpa perf_counter, lock, atau alokasi).
+
+Aktifkan dengan environment variable:
+    SPK_METRICS=1                 aktifkan pencatatan
+    SPK_METRICS_PORT=9464         (opsional) jalankan endpoint HTTP /metrics
+    SPK_METRICS_FILE=spk.prom     (opsional) file tujuan tulis_file()
+
+Contoh:
+    from utils.metrics import METRIK, terukur
+    
+    @terukur('hitung_saw')
+    def hitung_saw(...):
+        ...
+    
+    with METRIK.waktu('app_csv'):
+        buat_csv(...)
+    
+    METRIK.tambah('spk_pdf_diminta_total')
+"""
+
+import bisect
+import functools
+import os
+import threading
+import time
+
+# Batas atas bucket histogram latency (detik)
+BUCKET_DEFAULT = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+                  0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+NAMA_HISTOGRAM_TAHAP = 'spk_tahap_durasi_detik'
+
+
+class _TanpaUkur:
+    """Context manager kosong, dipakai saat metrik nonaktif"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        return False
+
+
+_TANPA_UKUR = _TanpaUkur()
+
+
+class _Timer:
+    """Context manager yang mencatat durasi blok ke histogram tahap"""
+    
+    __slots__ = ('_registry', '_tahap', '_mulai')
+    
+    def __init__(self, registry, tahap):
+        self._registry = registry
+        self._tahap = tahap
+    
+    def __enter__(self):
+        self._mulai = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self._registry.amati(self._tahap, time.perf_counter() - self._mulai)
+        return False
+
+
+class _Histogram:
+    """Histogram kumulatif ala Prometheus untuk satu label"""
+    
+    __slots__ = ('bucket', 'jumlah', 'total')
+    
+    def __init__(self, jumlah_bucket):
+        self.bucket = [0] * jumlah_bucket
+        self.jumlah = 0
+        self.total = 0.0
+
+
+class RegistryMetrik:
+    """
+    Penyimpan counter & histogram latency untuk satu proses
+    
+    Args:
+        aktif (bool): Catat metrik atau tidak (bisa diubah kapan saja)
+        bucket (tuple): Batas atas bucket histogram dalam detik
+    """
+    
+    def __init__(self, aktif=False, bucket=BUCKET_DEFAULT):
+        self.aktif = aktif
+        self.bucket = tuple(bucket)
+        self._histogram = {}
+        self._counter = {}
+        self._kolektor = []
+        self._lock = threading.Lock()
+    
+    def waktu(self, tahap):
+        """
+        Context manager pengukur durasi satu tahap
+        
+        Args:
+            tahap (str): Nama tahap (label 'tahap' di histogram)
+        """
+        if not self.aktif:
+            return _TANPA_UKUR
+        return _Timer(self, tahap)
+    
+    def amati(self, tahap, detik):
+        """Catat satu durasi (detik) ke histogram tahap"""
+        if not self.aktif:
+            return
+        i = bisect.bisect_left(self.bucket, detik)
+        with self._lock:
+            histogram = self._histogram.get(tahap)
+            if histogram is None:
+                histogram = self._histogram[tahap] = _Histogram(len(self.bucket))
+            if i < len(self.bucket):
+                histogram.bucket[i] += 1
+            histogram.jumlah += 1
+            histogram.total += detik
+    
+    def tambah(self, nama, nilai=1, **label):
+        """
+        Tambah counter
+        
+        Args:
+            nama (str): Nama metrik, sebaiknya berakhiran _total
+            nilai (float): Penambahan
+            **label: Label metrik, contoh lapisan='CSV'
+        """
+        if not self.aktif:
+            return
+        key = (nama, tuple(sorted(label.items())))
+        with self._lock:
+            self._counter[key] = self._counter.get(key, 0) + nilai
+    
+    def daftar_kolektor(self, kolektor):
+        """
+        Daftarkan fungsi yang dibaca saat ekspor (misalnya statistik cache)
+        
+        Kolektor dipanggil tanpa argumen dan mengembalikan list
+        (nama, tipe, label_dict, nilai) dengan tipe 'counter' atau 'gauge'.
+        Tidak ada biaya di jalur panas karena nilainya dibaca saat ekspor.
+        """
+        with self._lock:
+            if kolektor not in self._kolektor:
+                self._kolektor.append(kolektor)
+        return kolektor
+    
+    def reset(self):
+        """Hapus semua counter dan histogram (kolektor tetap terdaftar)"""
+        with self._lock:
+            self._histogram.clear()
+            self._counter.clear()
+    
+    def snapshot(self):
+        """
+        Salinan data metrik saat ini
+        
+        Returns:
+            dict: {'histogram': {tahap: (bucket, jumlah, total)},
+                   'counter': {(nama, label): nilai}}
+        """
+        with self._lock:
+            return {
+                'histogram': {t: (list(h.bucket), h.jumlah, h.total)
+                              for t, h in self._histogram.items()},
+                'counter': dict(self._counter)
+            }
+    
+    def ekspor_prometheus(self):
+        """
+        Semua metrik dalam format teks Prometheus (versi 0.0.4)
+        
+        Returns:
+            str: Teks eksposisi
+        """
+        data = self.snapshot()
+        with self._lock:
+            kolektor = list(self._kolektor)
+        baris = []
+        
+        if data['histogram']:
+            baris.append(f"# HELP {NAMA_HISTOGRAM_TAHAP} Durasi setiap tahap dalam detik")
+            baris.append(f"# TYPE {NAMA_HISTOGRAM_TAHAP} histogram")
+            for tahap, (bucket, jumlah, total) in sorted(data['histogram'].items()):
+                label = f'tahap="{_escape(tahap)}"'
+                kumulatif = 0
+                for batas, n in zip(self.bucket, bucket):
+                    kumulatif += n
+                    baris.append(f'{NAMA_HISTOGRAM_TAHAP}_bucket{{{label},le="{batas:g}"}} {kumulatif}')
+                baris.append(f'{NAMA_HISTOGRAM_TAHAP}_bucket{{{label},le="+Inf"}} {jumlah}')
+                baris.append(f'{NAMA_HISTOGRAM_TAHAP}_sum{{{label}}} {total!r}')
+                baris.append(f'{NAMA_HISTOGRAM_TAHAP}_count{{{label}}} {jumlah}')
+        
+        sampel = [(nama, 'counter', dict(label), nilai)
+                  for (nama, label), nilai in data['counter'].items()]
+        for fungsi in kolektor:
+            sampel.extend(fungsi())
+        
+        tipe_tertulis = set()
+        for nama, tipe, label, nilai in sorted(sampel, key=lambda s: (s[0], sorted(s[2].items()))):
+            if nama not in tipe_tertulis:
+                baris.append(f"# TYPE {nama} {tipe}")
+                tipe_tertulis.add(nama)
+            baris.append(f"{nama}{_format_label(label)} {float(nilai)!r}")
+        
+        return "\n".join(baris) + "\n"
+    
+    def tulis_file(self, path=None):
+        """
+        Tulis ekspor Prometheus ke file secara atomik (tulis sementara + rename)
+        
+        Args:
+            path (str, optional): Default SPK_METRICS_FILE
+        
+        Returns:
+            str | None: Path yang ditulis, None jika tidak ada path
+        """
+        path = path or os.environ.get('SPK_METRICS_FILE')
+        if not path:
+            return None
+        sementara = f"{path}.{os.getpid()}.tmp"
+        with open(sementara, 'w', encoding='utf-8') as f:
+            f.write(self.ekspor_prometheus())
+        os.replace(sementara, path)
+        return path
+    
+    def mulai_server(self, port=None, host='127.0.0.1'):
+        """
+        Jalankan endpoint HTTP /metrics di thread daemon
+        
+        Args:
+            port (int, optional): Default SPK_METRICS_PORT
+            host (str): Alamat bind (default hanya lokal)
+        
+        Returns:
+            ThreadingHTTPServer | None: Server, None jika port tidak diisi
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        port = port if port is not None else os.environ.get('SPK_METRICS_PORT')
+        if not port:
+            return None
+        registry = self
+        
+        class HandlerMetrik(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                isi = registry.ekspor_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(isi)))
+                self.end_headers()
+                self.wfile.write(isi)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer((host, int(port)), HandlerMetrik)
+        threading.Thread(target=server.serve_forever, name='spk-metrics', daemon=True).start()
+        return server
+
+
+def _escape(teks):
+    return str(teks).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_label(label):
+    if not label:
+        return ''
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in sorted(label.items())) + '}'
+
+
+def kolektor_cache(nama_cache, cache):
+    """
+    Kolektor untuk objek cache dengan method info() (CacheSAW, CacheGrafik)
+    
+    Args:
+        nama_cache (str): Nilai label 'cache'
+        cache: Objek dengan info() berisi hits, misses, size, hit_rate
+    
+    Returns:
+        callable: Kolektor untuk RegistryMetrik.daftar_kolektor
+    """
+    def kolektor():
+        info = cache.info()
+        label = {'cache': nama_cache}
+        return [
+            ('spk_cache_hits_total', 'counter', label, info['hits']),
+            ('spk_cache_misses_total', 'counter', label, info['misses']),
+            ('spk_cache_entri', 'gauge', label, info['size']),
+            ('spk_cache_hit_ratio', 'gauge', label, info['hit_rate']),
+        ]
+    return kolektor
+
+
+# Registry default untuk satu proses
+METRIK = RegistryMetrik(aktif=os.environ.get('SPK_METRICS', '').lower() in ('1', 'true', 'ya', 'on'))
+
+
+def terukur(tahap, registry=None):
+    """
+    Decorator: catat durasi setiap panggilan fungsi ke histogram tahap
+    
+    Args:
+        tahap (str): Nama tahap
+        registry (RegistryMetrik, optional): Default METRIK
+    """
+    registry = METRIK if registry is None else registry
+    
+    def dekorator(fungsi):
+        @functools.wraps(fungsi)
+        def pembungkus(*args, **kwargs):
+            if not registry.aktif:
+                return fungsi(*args, **kwargs)
+            mulai = time.perf_counter()
+            try:
+                return fungsi(*args, **kwargs)
+            finally:
+                registry.amati(tahap, time.perf_counter() - mulai)
+        return pembungkus
+    return dekorator
@@ -3,17 +3,603 @@ PDF Generator untuk SPK Pemilihan Jurusan
 Menggunakan ReportLab untuk generate PDF report
 """
 
+import copy
+from array import array
+from itertools import islice
+
 from reportlab.lib.pagesizes import A4, letter
 from reportlab.lib import colors
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+from reportlab.platypus.flowables import Flowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
 from io import BytesIO
 from datetime import datetime
-import pandas as pd
 
+from utils.metrics import terukur
+from utils.pdf_merge import PenulisPdfGabungan
+
+# ========================================
+# TEMPLATE LAPORAN (DIBANGUN SEKALI PER PROSES)
+# ========================================
+# Jumlah siswa per dokumen ReportLab saat membangun laporan gabungan;
+# halaman satu bagian ada di memori sampai bagian tersebut disalin ke output
+UKURAN_BAGIAN_GABUNGAN = 32
+
+KETERANGAN_TEXT = """
+    <b>R1 - Nilai Akademik (Benefit):</b> Normalisasi berdasarkan nilai standar jurusan<br/>
+    <b>R2 - Minat (Benefit):</b> Nilai 1.0 jika minat cocok, 0.6 jika tidak cocok<br/>
+    <b>R3 - Ekonomi (Cost):</b> Normalisasi biaya kuliah vs kemampuan ekonomi<br/>
+    <b>R4 - Prospek Kerja (Benefit):</b> Normalisasi prioritas prospek kerja<br/>
+    <br/>
+    <b>Formula SAW:</b> Vi = Σ(Wj × Rij)<br/>
+    Di mana:<br/>
+    • Vi = Nilai preferensi alternatif ke-i<br/>
+    • Wj = Bobot kriteria ke-j<br/>
+    • Rij = Rating kinerja ternormalisasi<br/>
+    <br/>
+    <b>Kesimpulan:</b><br/>
+    Semakin tinggi nilai Total (Vi), semakin cocok jurusan tersebut dengan profil siswa.
+    """
+
+
+class TemplateLaporan:
+    """
+    Template PDF report yang dibangun sekali dan dipakai ulang
+    
+    Style paragraf, TableStyle, dan paragraf statis (judul, KETERANGAN,
+    footer) hanya dibuat sekali. Setiap laporan hanya membuat tabel dan
+    paragraf yang berisi data siswa. Paragraf statis disalin (shallow copy)
+    per laporan karena ReportLab menyimpan hasil wrap di objek flowable.
+    """
+    
+    def __init__(self):
+        self.styles = getSampleStyleSheet()
+        styles = self.styles
+        
+        # Custom styles
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=18,
+            textColor=colors.HexColor('#1e40af'),
+            spaceAfter=10,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        )
+        
+        self.subtitle_style = ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Normal'],
+            fontSize=12,
+            textColor=colors.HexColor('#6b7280'),
+            spaceAfter=20,
+            alignment=TA_CENTER,
+            fontName='Helvetica'
+        )
+        
+        self.heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=14,
+            textColor=colors.HexColor('#1f2937'),
+            spaceAfter=12,
+            spaceBefore=12,
+            fontName='Helvetica-Bold'
+        )
+        
+        self.normal_style = ParagraphStyle(
+            'CustomNormal',
+            parent=styles['Normal'],
+            fontSize=10,
+            textColor=colors.HexColor('#374151'),
+            spaceAfter=6,
+            fontName='Helvetica'
+        )
+        
+        self.footer_style = ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.HexColor('#9ca3af'),
+            alignment=TA_CENTER
+        )
+        
+        self.rekomendasi_style = ParagraphStyle(
+            'Bold', fontSize=14, textColor=colors.HexColor('#059669')
+        )
+        
+        # Table styles
+        self.table_siswa_style = TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1f2937')),
+            ('TEXTCOLOR', (2, 0), (2, -1), colors.HexColor('#059669')),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+        ])
+        
+        self.table_rekomendasi_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#d1fae5')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#047857')),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 11),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#10b981')),
+            ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#10b981')),
+            ('TOPPADDING', (0, 0), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+        ])
+        
+        self.table_ranking_style = TableStyle([
+            # Header
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            
+            # Body
+            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#d1fae5')),  # Rank 1
+            ('TEXTCOLOR', (0, 1), (-1, 1), colors.HexColor('#047857')),
+            ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+            
+            ('BACKGROUND', (0, 2), (-1, -1), colors.white),
+            ('TEXTCOLOR', (0, 2), (-1, -1), colors.black),
+            ('FONTNAME', (0, 2), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+            ('ALIGN', (2, 1), (2, -1), 'LEFT'),
+            
+            # Grid
+            ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#3b82f6')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ])
+        
+        self.table_bobot_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f59e0b')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            
+            ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#f59e0b')),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ])
+        
+        self.table_detail_style = TableStyle([
+            # Header
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366f1')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 9),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            
+            # Rank 1 row
+            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#d1fae5')),
+            ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
+            
+            # Body
+            ('BACKGROUND', (0, 2), (-1, -1), colors.white),
+            ('FONTNAME', (0, 2), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 8),
+            ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
+            ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+            
+            ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#6366f1')),
+            ('TOPPADDING', (0, 0), (-1, -1), 5),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+        ])
+        
+        # Paragraf statis
+        self.header = [
+            Paragraph("🎓 SISTEM PENDUKUNG KEPUTUSAN", self.title_style),
+            Paragraph("PEMILIHAN JURUSAN KULIAH", self.title_style),
+            Paragraph("Metode SAW (Simple Additive Weighting)", self.subtitle_style),
+        ]
+        self.judul_data_siswa = Paragraph("📋 DATA SISWA", self.heading_style)
+        self.judul_rekomendasi = Paragraph("🏆 REKOMENDASI TERBAIK", self.heading_style)
+        self.judul_ranking = Paragraph("📊 RANKING LENGKAP SEMUA JURUSAN", self.heading_style)
+        self.judul_bobot = Paragraph("⚖️ BOBOT KRITERIA PENILAIAN", self.heading_style)
+        self.judul_detail = Paragraph("🔢 DETAIL PERHITUNGAN NORMALISASI", self.heading_style)
+        self.pengantar_detail = Paragraph(
+            "Tabel berikut menampilkan nilai normalisasi (R) untuk setiap kriteria:",
+            self.normal_style
+        )
+        self.judul_keterangan = Paragraph("📖 KETERANGAN", self.heading_style)
+        self.keterangan = Paragraph(KETERANGAN_TEXT, self.normal_style)
+        self.footer_atas = [
+            Paragraph("─" * 80, self.footer_style),
+            Paragraph("Sistem Pendukung Keputusan Pemilihan Jurusan", self.footer_style),
+            Paragraph("Metode SAW (Simple Additive Weighting)", self.footer_style),
+        ]
+        self.footer_bawah = Paragraph("© 2024 SPK Jurusan v1.0", self.footer_style)
+        
+        # Daftar isi (laporan gabungan)
+        self.judul_daftar_isi = Paragraph("📑 DAFTAR ISI", self.heading_style)
+        self.table_daftar_isi_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+            
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('ALIGN', (0, 1), (0, -1), 'CENTER'),
+            ('ALIGN', (3, 1), (3, -1), 'CENTER'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f3f4f6')]),
+            
+            ('INNERGRID', (0, 0), (-1, -1), 0.25, colors.grey),
+            ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#3b82f6')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ])
+    
+    def buat_dokumen(self, output):
+        """SimpleDocTemplate dengan ukuran halaman & margin laporan"""
+        return SimpleDocTemplate(
+            output,
+            pagesize=A4,
+            rightMargin=0.75*inch,
+            leftMargin=0.75*inch,
+            topMargin=1*inch,
+            bottomMargin=0.75*inch
+        )
+    
+    def elemen_laporan(self, nama, nilai_akademik, minat, ekonomi, prospek_kerja,
+                       hasil, detail, bobot_kriteria):
+        """
+        Daftar flowable laporan satu siswa (argumen sama dengan generate_pdf_report)
+        
+        Returns:
+            list: Flowable siap di-build dengan SimpleDocTemplate
+        """
+        statis = copy.copy
+        sekarang = datetime.now()
+        elements = []
+        
+        # ========================================
+        # HEADER
+        # ========================================
+        elements.extend(statis(p) for p in self.header)
+        elements.append(Spacer(1, 0.3*inch))
+        
+        # ========================================
+        # INFO SISWA
+        # ========================================
+        elements.append(statis(self.judul_data_siswa))
+        
+        data_siswa = [
+            ['Nama Lengkap', ':', nama],
+            ['Nilai Akademik', ':', f'{nilai_akademik:.1f}'],
+            ['Minat Bidang Studi', ':', minat],
+            ['Kemampuan Ekonomi', ':', ekonomi],
+            ['Prioritas Prospek Kerja', ':', f'{prospek_kerja}/100'],
+            ['Tanggal Analisis', ':', sekarang.strftime('%d %B %Y, %H:%M')]
+        ]
+        
+        table_siswa = Table(data_siswa, colWidths=[2*inch, 0.3*inch, 3*inch])
+        table_siswa.setStyle(self.table_siswa_style)
+        
+        elements.append(table_siswa)
+        elements.append(Spacer(1, 0.3*inch))
+        
+        # ========================================
+        # REKOMENDASI TERBAIK
+        # ========================================
+        best = hasil[0]
+        
+        elements.append(statis(self.judul_rekomendasi))
+        
+        # Box untuk rekomendasi
+        rekomendasi_data = [
+            [Paragraph(f"<b>{best['Jurusan']}</b>", self.rekomendasi_style)],
+            [f"Kode: {best['Kode']}"],
+            [f"Nilai SAW: {best['Nilai SAW']:.4f}"],
+            ['Ranking: #1']
+        ]
+        
+        table_rekomendasi = Table(rekomendasi_data, colWidths=[5.5*inch])
+        table_rekomendasi.setStyle(self.table_rekomendasi_style)
+        
+        elements.append(table_rekomendasi)
+        elements.append(Spacer(1, 0.3*inch))
+        
+        # ========================================
+        # RANKING LENGKAP
+        # ========================================
+        elements.append(statis(self.judul_ranking))
+        
+        # Prepare data untuk tabel
+        ranking_data = [['Rank', 'Kode', 'Nama Jurusan', 'Nilai SAW']]
+        
+        for i, h in enumerate(hasil, 1):
+            ranking_data.append([
+                str(i),
+                h['Kode'],
+                h['Jurusan'],
+                f"{h['Nilai SAW']:.4f}"
+            ])
+        
+        table_ranking = Table(ranking_data, colWidths=[0.7*inch, 0.7*inch, 2.8*inch, 1.3*inch])
+        table_ranking.setStyle(self.table_ranking_style)
+        
+        elements.append(table_ranking)
+        elements.append(Spacer(1, 0.3*inch))
+        
+        # ========================================
+        # BOBOT KRITERIA
+        # ========================================
+        elements.append(statis(self.judul_bobot))
+        
+        bobot_data = [['Kriteria', 'Bobot', 'Persentase']]
+        for key, value in bobot_kriteria.items():
+            bobot_data.append([
+                key.replace('_', ' ').title(),
+                f'{value:.2f}',
+                f'{value*100:.0f}%'
+            ])
+        
+        table_bobot = Table(bobot_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch])
+        table_bobot.setStyle(self.table_bobot_style)
+        
+        elements.append(table_bobot)
+        elements.append(PageBreak())
+        
+        # ========================================
+        # DETAIL PERHITUNGAN (Page 2)
+        # ========================================
+        elements.append(statis(self.judul_detail))
+        elements.append(statis(self.pengantar_detail))
+        elements.append(Spacer(1, 0.1*inch))
+        
+        # Prepare detail data
+        detail_data = [['Kode', 'Jurusan', 'R1', 'R2', 'R3', 'R4', 'Total']]
+        
+        for d in detail:
+            detail_data.append([
+                d['Kode'],
+                d['Jurusan'][:15],  # Trim nama kalau kepanjangan
+                f"{d['R1']:.3f}",
+                f"{d['R2']:.3f}",
+                f"{d['R3']:.3f}",
+                f"{d['R4']:.3f}",
+                f"{d['Total']:.4f}"
+            ])
+        
+        table_detail = Table(detail_data, colWidths=[0.5*inch, 1.8*inch, 0.6*inch, 0.6*inch, 0.6*inch, 0.6*inch, 0.8*inch])
+        table_detail.setStyle(self.table_detail_style)
+        
+        elements.append(table_detail)
+        elements.append(Spacer(1, 0.2*inch))
+        
+        # ========================================
+        # KETERANGAN
+        # ========================================
+        elements.append(statis(self.judul_keterangan))
+        elements.append(statis(self.keterangan))
+        elements.append(Spacer(1, 0.3*inch))
+        
+        # ========================================
+        # FOOTER
+        # ========================================
+        elements.append(Spacer(1, 0.5*inch))
+        elements.extend(statis(p) for p in self.footer_atas)
+        elements.append(Paragraph(f"Generated on {sekarang.strftime('%d %B %Y, %H:%M:%S')}", self.footer_style))
+        elements.append(statis(self.footer_bawah))
+        
+        return elements
+    
+    def render(self, nama, nilai_akademik, minat, ekonomi, prospek_kerja,
+               hasil, detail, bobot_kriteria, output=None):
+        """
+        Build laporan satu siswa
+        
+        Args:
+            (sama dengan generate_pdf_report)
+            output (str | file, optional): Path atau file-like tujuan.
+                None = kembalikan bytes
+        
+        Returns:
+            bytes | None: Isi PDF jika output None
+        """
+        return self.build(self.elemen_laporan(nama, nilai_akademik, minat, ekonomi, prospek_kerja,
+                                              hasil, detail, bobot_kriteria), output)
+    
+    def build(self, elements, output=None):
+        """
+        Build flowable menjadi PDF dengan ukuran halaman & margin laporan
+        
+        Returns:
+            bytes | None: Isi PDF jika output None
+        """
+        buffer = BytesIO() if output is None else output
+        doc = self.buat_dokumen(buffer)
+        doc.build(elements)
+        if output is not None:
+            return None
+        
+        # Get PDF bytes
+        pdf_bytes = buffer.getvalue()
+        buffer.close()
+        return pdf_bytes
+    
+    def elemen_daftar_isi(self, daftar_isi, nomor_halaman, tautan):
+        """
+        Halaman daftar isi laporan gabungan
+        
+        Args:
+            daftar_isi (list): (nama, jurusan_terbaik, nilai_saw) per siswa,
+                sesuai urutan bagian di dokumen
+            nomor_halaman (iterable): Nomor halaman awal setiap siswa
+            tautan (list): Diisi saat build dengan (halaman, rect, i) untuk
+                setiap baris, posisi link ke bagian siswa ke-i
+        
+        Returns:
+            list: Flowable daftar isi (tabel dipecah otomatis ke beberapa halaman)
+        """
+        elements = [copy.copy(p) for p in self.header]
+        elements.append(Spacer(1, 0.2*inch))
+        elements.append(copy.copy(self.judul_daftar_isi))
+        
+        data = [['No', 'Nama Siswa', 'Rekomendasi Terbaik', 'Nilai SAW', 'Hal.']]
+        for i, ((nama, jurusan, nilai_saw), nomor) in enumerate(zip(daftar_isi, nomor_halaman)):
+            data.append([
+                str(i + 1),
+                str(nama)[:35],
+                str(jurusan)[:35],
+                f"{nilai_saw:.4f}",
+                _NomorHalaman(i, nomor, tautan)
+            ])
+        
+        table = Table(data, colWidths=[0.5*inch, 2.4*inch, 2.4*inch, 0.9*inch, 0.5*inch],
+                      repeatRows=1)
+        table.setStyle(self.table_daftar_isi_style)
+        elements.append(table)
+        return elements
+    
+    def render_gabungan(self, daftar_isi, laporan, output, ukuran_bagian=UKURAN_BAGIAN_GABUNGAN):
+        """
+        Build satu dokumen berisi laporan banyak siswa, didahului daftar isi
+        
+        Laporan dibangun per bagian (ukuran_bagian siswa) sebagai dokumen
+        ReportLab terpisah, lalu objek PDF-nya langsung disalin ke output
+        oleh PenulisPdfGabungan. Memori tidak bergantung jumlah siswa: yang
+        disimpan hanya nomor objek halaman dan halaman awal setiap siswa.
+        Daftar isi dibangun terakhir, setelah nomor halaman diketahui, lalu
+        ditaruh di depan dengan link ke bagian setiap siswa. Setiap siswa
+        juga mendapat bookmark (outline) PDF.
+        
+        Args:
+            daftar_isi (list): (nama, jurusan_terbaik, nilai_saw) per siswa
+            laporan (iterable): Tuple argumen elemen_laporan (nama,
+                nilai_akademik, minat, ekonomi, prospek_kerja, hasil, detail,
+                bobot_kriteria) per siswa, urutan sama dengan daftar_isi
+            output (str | file): Path atau file-like tujuan (ditulis bertahap)
+            ukuran_bagian (int): Jumlah siswa per dokumen ReportLab
+        
+        Returns:
+            int: Jumlah siswa yang ditulis
+        
+        Raises:
+            ValueError: Jika jumlah laporan tidak sama dengan daftar_isi
+        """
+        laporan = iter(laporan)
+        with PenulisPdfGabungan(output) as penulis:
+            halaman = array('q')
+            awal_siswa = array('q')
+            while True:
+                bagian = list(islice(laporan, ukuran_bagian))
+                if not bagian:
+                    break
+                penanda = []
+                elements = []
+                for argumen in bagian:
+                    if elements:
+                        elements.append(PageBreak())
+                    elements.append(_PenandaSiswa(penanda))
+                    elements.extend(self.elemen_laporan(*argumen))
+                pdf_bagian = self.build(elements)
+                awal_siswa.extend(len(halaman) + nomor - 1 for nomor in penanda)
+                halaman.extend(penulis.tambah(pdf_bagian))
+            
+            if len(awal_siswa) != len(daftar_isi):
+                raise ValueError(f"Jumlah laporan ({len(awal_siswa)}) tidak sama dengan "
+                                 f"jumlah entri daftar isi ({len(daftar_isi)})")
+            
+            # Jumlah halaman daftar isi menggeser nomor halaman siswa; tinggi
+            # baris tetap, jadi build kedua selalu sudah stabil
+            jumlah_daftar_isi = 0
+            while True:
+                tautan = []
+                pdf_daftar_isi = self.build(self.elemen_daftar_isi(
+                    daftar_isi, (jumlah_daftar_isi + awal + 1 for awal in awal_siswa), tautan
+                ))
+                jumlah = max((halaman_tautan for halaman_tautan, _, _ in tautan), default=1)
+                if jumlah == jumlah_daftar_isi:
+                    break
+                jumlah_daftar_isi = jumlah
+            
+            link = {}
+            for halaman_tautan, rect, i in tautan:
+                link.setdefault(halaman_tautan - 1, []).append((rect, halaman[awal_siswa[i]]))
+            halaman_daftar_isi = penulis.tambah(pdf_daftar_isi, tautan=link)
+            
+            outline = [(f"{i + 1}. {nama}", halaman[awal])
+                       for i, ((nama, _, _), awal) in enumerate(zip(daftar_isi, awal_siswa))]
+            penulis.selesai(array('q', halaman_daftar_isi) + halaman, outline)
+        return len(awal_siswa)
+
+
+# ========================================
+# FLOWABLE LAPORAN GABUNGAN
+# ========================================
+class _NomorHalaman(Flowable):
+    """Nomor halaman siswa ke-i di daftar isi, mencatat posisi link-nya"""
+    
+    def __init__(self, i, nomor, tautan):
+        Flowable.__init__(self)
+        self.i = i
+        self.nomor = nomor
+        self.tautan = tautan
+    
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        return availWidth, 10
+    
+    def draw(self):
+        canv = self.canv
+        canv.setFont('Helvetica', 9)
+        canv.drawCentredString(18, 1, str(self.nomor))
+        rect = canv.absolutePosition(0, 0) + canv.absolutePosition(self.width, 10)
+        self.tautan.append((canv.getPageNumber(), rect, self.i))
+
+
+class _PenandaSiswa(Flowable):
+    """Penanda awal bagian satu siswa (tidak terlihat): mencatat nomor halamannya"""
+    
+    def __init__(self, catatan):
+        Flowable.__init__(self)
+        self.catatan = catatan
+    
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+    
+    def draw(self):
+        self.catatan.append(self.canv.getPageNumber())
+
+
+_TEMPLATE_LAPORAN = None
+
+
+def get_template_laporan():
+    """TemplateLaporan milik proses ini (dibuat saat pertama kali dipakai)"""
+    global _TEMPLATE_LAPORAN
+    if _TEMPLATE_LAPORAN is None:
+        _TEMPLATE_LAPORAN = TemplateLaporan()
+    return _TEMPLATE_LAPORAN
+
+
+@terukur('generate_pdf_report')
 def generate_pdf_report(nama, nilai_akademik, minat, ekonomi, prospek_kerja, 
                        hasil, detail, bobot_kriteria):
     """
@@ -32,321 +618,28 @@ def generate_pdf_report(nama, nilai_akademik, minat, ekonomi, prospek_kerja,
     Returns:
         BytesIO: PDF file dalam bentuk bytes
     """
-    
-    # Buat buffer untuk PDF
-    buffer = BytesIO()
-    
-    # Setup document
-    doc = SimpleDocTemplate(
-        buffer,
-        pagesize=A4,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=1*inch,
-        bottomMargin=0.75*inch
-    )
-    
-    # Container untuk elements
-    elements = []
-    
-    # Styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        textColor=colors.HexColor('#1e40af'),
-        spaceAfter=10,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=colors.HexColor('#6b7280'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica'
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor('#1f2937'),
-        spaceAfter=12,
-        spaceBefore=12,
-        fontName='Helvetica-Bold'
-    )
-    
-    normal_style = ParagraphStyle(
-        'CustomNormal',
-        parent=styles['Normal'],
-        fontSize=10,
-        textColor=colors.HexColor('#374151'),
-        spaceAfter=6,
-        fontName='Helvetica'
-    )
-    
-    # ========================================
-    # HEADER
-    # ========================================
-    elements.append(Paragraph("🎓 SISTEM PENDUKUNG KEPUTUSAN", title_style))
-    elements.append(Paragraph("PEMILIHAN JURUSAN KULIAH", title_style))
-    elements.append(Paragraph("Metode SAW (Simple Additive Weighting)", subtitle_style))
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # ========================================
-    # INFO SISWA
-    # ========================================
-    elements.append(Paragraph("📋 DATA SISWA", heading_style))
-    
-    data_siswa = [
-        ['Nama Lengkap', ':', nama],
-        ['Nilai Akademik', ':', f'{nilai_akademik:.1f}'],
-        ['Minat Bidang Studi', ':', minat],
-        ['Kemampuan Ekonomi', ':', ekonomi],
-        ['Prioritas Prospek Kerja', ':', f'{prospek_kerja}/100'],
-        ['Tanggal Analisis', ':', datetime.now().strftime('%d %B %Y, %H:%M')]
-    ]
-    
-    table_siswa = Table(data_siswa, colWidths=[2*inch, 0.3*inch, 3*inch])
-    table_siswa.setStyle(TableStyle([
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#1f2937')),
-        ('TEXTCOLOR', (2, 0), (2, -1), colors.HexColor('#059669')),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 0),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-    ]))
-    
-    elements.append(table_siswa)
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # ========================================
-    # REKOMENDASI TERBAIK
-    # ========================================
-    best = hasil[0]
-    
-    elements.append(Paragraph("🏆 REKOMENDASI TERBAIK", heading_style))
-    
-    # Box untuk rekomendasi
-    rekomendasi_data = [
-        [Paragraph(f"<b>{best['Jurusan']}</b>", ParagraphStyle('Bold', fontSize=14, textColor=colors.HexColor('#059669')))],
-        [f"Kode: {best['Kode']}"],
-        [f"Nilai SAW: {best['Nilai SAW']:.4f}"],
-        ['Ranking: #1']
-    ]
-    
-    table_rekomendasi = Table(rekomendasi_data, colWidths=[5.5*inch])
-    table_rekomendasi.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#d1fae5')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#047857')),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 11),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#10b981')),
-        ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#10b981')),
-        ('TOPPADDING', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-    ]))
-    
-    elements.append(table_rekomendasi)
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # ========================================
-    # RANKING LENGKAP
-    # ========================================
-    elements.append(Paragraph("📊 RANKING LENGKAP SEMUA JURUSAN", heading_style))
-    
-    # Prepare data untuk tabel
-    ranking_data = [['Rank', 'Kode', 'Nama Jurusan', 'Nilai SAW']]
-    
-    for i, h in enumerate(hasil, 1):
-        ranking_data.append([
-            str(i),
-            h['Kode'],
-            h['Jurusan'],
-            f"{h['Nilai SAW']:.4f}"
-        ])
-    
-    table_ranking = Table(ranking_data, colWidths=[0.7*inch, 0.7*inch, 2.8*inch, 1.3*inch])
-    table_ranking.setStyle(TableStyle([
-        # Header
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3b82f6')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        
-        # Body
-        ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#d1fae5')),  # Rank 1
-        ('TEXTCOLOR', (0, 1), (-1, 1), colors.HexColor('#047857')),
-        ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
-        
-        ('BACKGROUND', (0, 2), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 2), (-1, -1), colors.black),
-        ('FONTNAME', (0, 2), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
-        ('ALIGN', (2, 1), (2, -1), 'LEFT'),
-        
-        # Grid
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#3b82f6')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
-    
-    elements.append(table_ranking)
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # ========================================
-    # BOBOT KRITERIA
-    # ========================================
-    elements.append(Paragraph("⚖️ BOBOT KRITERIA PENILAIAN", heading_style))
-    
-    bobot_data = [['Kriteria', 'Bobot', 'Persentase']]
-    for key, value in bobot_kriteria.items():
-        bobot_data.append([
-            key.replace('_', ' ').title(),
-            f'{value:.2f}',
-            f'{value*100:.0f}%'
-        ])
-    
-    table_bobot = Table(bobot_data, colWidths=[2.5*inch, 1.5*inch, 1.5*inch])
-    table_bobot.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f59e0b')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#f59e0b')),
-        ('TOPPADDING', (0, 0), (-1, -1), 6),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-    ]))
-    
-    elements.append(table_bobot)
-    elements.append(PageBreak())
-    
-    # ========================================
-    # DETAIL PERHITUNGAN (Page 2)
-    # ========================================
-    elements.append(Paragraph("🔢 DETAIL PERHITUNGAN NORMALISASI", heading_style))
-    elements.append(Paragraph("Tabel berikut menampilkan nilai normalisasi (R) untuk setiap kriteria:", normal_style))
-    elements.append(Spacer(1, 0.1*inch))
-    
-    # Prepare detail data
-    detail_data = [['Kode', 'Jurusan', 'R1', 'R2', 'R3', 'R4', 'Total']]
-    
-    for d in detail:
-        detail_data.append([
-            d['Kode'],
-            d['Jurusan'][:15],  # Trim nama kalau kepanjangan
-            f"{d['R1']:.3f}",
-            f"{d['R2']:.3f}",
-            f"{d['R3']:.3f}",
-            f"{d['R4']:.3f}",
-            f"{d['Total']:.4f}"
-        ])
-    
-    table_detail = Table(detail_data, colWidths=[0.5*inch, 1.8*inch, 0.6*inch, 0.6*inch, 0.6*inch, 0.6*inch, 0.8*inch])
-    table_detail.setStyle(TableStyle([
-        # Header
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366f1')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 9),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        
-        # Rank 1 row
-        ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#d1fae5')),
-        ('FONTNAME', (0, 1), (-1, 1), 'Helvetica-Bold'),
-        
-        # Body
-        ('BACKGROUND', (0, 2), (-1, -1), colors.white),
-        ('FONTNAME', (0, 2), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 8),
-        ('ALIGN', (0, 1), (-1, -1), 'CENTER'),
-        ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-        
-        ('INNERGRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('BOX', (0, 0), (-1, -1), 1, colors.HexColor('#6366f1')),
-        ('TOPPADDING', (0, 0), (-1, -1), 5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-    ]))
-    
-    elements.append(table_detail)
-    elements.append(Spacer(1, 0.2*inch))
-    
-    # ========================================
-    # KETERANGAN
-    # ========================================
-    elements.append(Paragraph("📖 KETERANGAN", heading_style))
-    
-    keterangan_text = """
-    <b>R1 - Nilai Akademik (Benefit):</b> Normalisasi berdasarkan nilai standar jurusan<br/>
-    <b>R2 - Minat (Benefit):</b> Nilai 1.0 jika minat cocok, 0.6 jika tidak cocok<br/>
-    <b>R3 - Ekonomi (Cost):</b> Normalisasi biaya kuliah vs kemampuan ekonomi<br/>
-    <b>R4 - Prospek Kerja (Benefit):</b> Normalisasi prioritas prospek kerja<br/>
-    <br/>
-    <b>Formula SAW:</b> Vi = Σ(Wj × Rij)<br/>
-    Di mana:<br/>
-    • Vi = Nilai preferensi alternatif ke-i<br/>
-    • Wj = Bobot kriteria ke-j<br/>
-    • Rij = Rating kinerja ternormalisasi<br/>
-    <br/>
-    <b>Kesimpulan:</b><br/>
-    Semakin tinggi nilai Total (Vi), semakin cocok jurusan tersebut dengan profil siswa.
+    return get_template_laporan().render(nama, nilai_akademik, minat, ekonomi, prospek_kerja,
+                                         hasil, detail, bobot_kriteria)
+
+
+@terukur('generate_pdf_gabungan')
+def generate_pdf_gabungan(daftar_isi, laporan, output):
     """
+    Generate satu PDF berisi laporan banyak siswa (dengan daftar isi)
+    langsung ke file atau stream, per bagian sehingga memori tetap
     
-    elements.append(Paragraph(keterangan_text, normal_style))
-    elements.append(Spacer(1, 0.3*inch))
-    
-    # ========================================
-    # FOOTER
-    # ========================================
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.HexColor('#9ca3af'),
-        alignment=TA_CENTER
-    )
-    
-    elements.append(Spacer(1, 0.5*inch))
-    elements.append(Paragraph("─" * 80, footer_style))
-    elements.append(Paragraph("Sistem Pendukung Keputusan Pemilihan Jurusan", footer_style))
-    elements.append(Paragraph("Metode SAW (Simple Additive Weighting)", footer_style))
-    elements.append(Paragraph(f"Generated on {datetime.now().strftime('%d %B %Y, %H:%M:%S')}", footer_style))
-    elements.append(Paragraph("© 2024 SPK Jurusan v1.0", footer_style))
-    
-    # Build PDF
-    doc.build(elements)
-    
-    # Get PDF bytes
-    pdf_bytes = buffer.getvalue()
-    buffer.close()
+    Args:
+        daftar_isi (list): (nama, jurusan_terbaik, nilai_saw) per siswa
+        laporan (iterable): Tuple argumen generate_pdf_report per siswa
+        output (str | file): Path atau file-like tujuan
     
-    return pdf_bytes
+    Returns:
+        int: Jumlah siswa yang ditulis
+    """
+    return get_template_laporan().render_gabungan(daftar_isi, laporan, output)
 
 
+@terukur('generate_simple_pdf')
 def generate_simple_pdf(nama, best_jurusan, nilai_saw):
     """
     Generate PDF simple (backup jika reportlab gagal)
@@ -356,7 +649,7 @@ def generate_simple_pdf(nama, best_jurusan, nilai_saw):
     
     doc = SimpleDocTemplate(buffer, pagesize=A4)
     elements = []
-    styles = getSampleStyleSheet()
+    styles = get_template_laporan().styles
     
     elements.append(Paragraph("HASIL REKOMENDASI JURUSAN", styles['Title']))
     elements.append(Spacer(1, 0.3*inch))
@@ -0,0 +1,249 @@
+"""
+Penulis PDF gabungan: menyambung PDF hasil ReportLab secara bertahap
+Canvas ReportLab menyimpan semua halaman di memori sampai dokumen disimpan,
+sehingga dokumen ribuan halaman (buku laporan satu angkatan) memakan memori
+sebanding jumlah halaman. Dengan PenulisPdfGabungan dokumen dibangun per
+bagian kecil, lalu objek PDF setiap bagian langsung ditulis ke file tujuan
+dengan nomor objek baru. Yang tersisa di memori hanya offset objek (xref)
+dan nomor objek halaman.
+
+Input yang didukung adalah PDF seperti yang ditulis ReportLab: tanpa
+enkripsi, tabel xref klasik, dan pohon halaman datar (/Kids berisi /Page).
+Modul ini bukan pembaca PDF umum.
+
+Contoh:
+    with PenulisPdfGabungan('buku.pdf') as penulis:
+        halaman = penulis.tambah(pdf_bagian_1) + penulis.tambah(pdf_bagian_2)
+        penulis.selesai(halaman, outline=[('Siswa 1', halaman[0])])
+"""
+
+import re
+from array import array
+
+_STARTXREF = re.compile(rb'startxref\s+(\d+)\s+%%EOF\s*$')
+_SUBSEKSI_XREF = re.compile(rb'(\d+) (\d+)\s*\r?\n')
+_TRAILER = re.compile(rb'trailer\s*<<(.*?)>>\s*startxref', re.S)
+_HEADER_OBJEK = re.compile(rb'(\d+) 0 obj\s*')
+_AWAL_STREAM = re.compile(rb'>>\s*stream\r?\n')
+_REFERENSI = re.compile(rb'(\d+) 0 R\b')
+_ENTRI_XREF = 20
+
+
+def _referensi(teks, nama):
+    """Nomor objek dari '/<nama> N 0 R' di dictionary, None jika tidak ada"""
+    cocok = re.search(rb'/' + nama + rb'\s+(\d+) 0 R', teks)
+    return int(cocok.group(1)) if cocok else None
+
+
+def baca_objek_pdf(data):
+    """
+    Pisahkan PDF (bytes) menjadi objek-objeknya memakai tabel xref
+    
+    Args:
+        data (bytes): Isi file PDF
+    
+    Returns:
+        tuple: (objek, trailer)
+            - objek: dict nomor -> (isi, stream); isi adalah teks objek tanpa
+              'N 0 obj'/'endobj', stream adalah bagian 'stream ... endstream'
+              (bytes kosong jika bukan stream)
+            - trailer: Isi dictionary trailer (bytes)
+    
+    Raises:
+        ValueError: Jika struktur PDF tidak didukung
+    """
+    cocok = _STARTXREF.search(data[-64:])
+    if cocok is None:
+        raise ValueError("PDF tidak diakhiri startxref / %%EOF")
+    posisi_xref = int(cocok.group(1))
+    if data[posisi_xref:posisi_xref + 4] != b'xref':
+        raise ValueError("Hanya tabel xref klasik yang didukung")
+    
+    offset = {}
+    posisi = data.index(b'\n', posisi_xref) + 1
+    while True:
+        subseksi = _SUBSEKSI_XREF.match(data, posisi)
+        if subseksi is None:
+            break
+        awal, jumlah = int(subseksi.group(1)), int(subseksi.group(2))
+        posisi = subseksi.end()
+        for nomor in range(awal, awal + jumlah):
+            entri = data[posisi:posisi + _ENTRI_XREF]
+            if entri[17:18] == b'n':
+                offset[nomor] = int(entri[:10])
+            posisi += _ENTRI_XREF
+    
+    trailer = _TRAILER.search(data, posisi_xref)
+    if trailer is None:
+        raise ValueError("Trailer PDF tidak ditemukan")
+    if b'/Encrypt' in trailer.group(1):
+        raise ValueError("PDF terenkripsi tidak didukung")
+    
+    # Objek ke-i berakhir sebelum objek berikutnya (atau tabel xref)
+    urutan = sorted(offset.items(), key=lambda x: x[1])
+    batas = [o for _, o in urutan[1:]] + [posisi_xref]
+    objek = {}
+    for (nomor, awal), akhir in zip(urutan, batas):
+        header = _HEADER_OBJEK.match(data, awal)
+        if header is None or int(header.group(1)) != nomor:
+            raise ValueError(f"Offset xref objek {nomor} tidak valid")
+        akhir = data.rfind(b'endobj', header.end(), akhir)
+        if akhir < 0:
+            raise ValueError(f"Objek {nomor} tidak diakhiri endobj")
+        stream = _AWAL_STREAM.search(data, header.end(), akhir)
+        if stream is None:
+            objek[nomor] = (data[header.end():akhir].rstrip(), b'')
+        else:
+            objek[nomor] = (data[header.end():stream.start() + 2], data[stream.start() + 2:akhir])
+    return objek, trailer.group(1)
+
+
+def _teks_pdf(teks):
+    """String PDF (UTF-16BE dengan BOM, hex) untuk teks bebas seperti judul outline"""
+    return b'<FEFF' + str(teks).encode('utf-16-be').hex().upper().encode('ascii') + b'>'
+
+
+def _tujuan(id_halaman):
+    return b'[ %d 0 R /Fit ]' % id_halaman
+
+
+class PenulisPdfGabungan:
+    """
+    Gabungkan beberapa PDF ReportLab menjadi satu file tanpa menyimpan halaman
+    
+    Urutan halaman di dokumen akhir ditentukan di selesai(), bukan urutan
+    tambah(), sehingga halaman yang dibuat belakangan (misalnya daftar isi
+    yang baru bisa diisi setelah nomor halaman diketahui) tetap bisa
+    ditaruh di depan.
+    
+    Args:
+        output (str | file): Path atau file-like (mode biner) tujuan
+    """
+    
+    def __init__(self, output):
+        self._milik_sendiri = not hasattr(output, 'write')
+        self._file = open(output, 'wb') if self._milik_sendiri else output
+        self._posisi = 0
+        self._offset = array('q')
+        self._id_pages = self._id_baru()
+        self._id_catalog = self._id_baru()
+        self._tulis(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+    
+    def _id_baru(self):
+        self._offset.append(0)
+        return len(self._offset)
+    
+    def _tulis(self, data):
+        self._file.write(data)
+        self._posisi += len(data)
+    
+    def _tulis_objek(self, nomor, isi, stream=b''):
+        self._offset[nomor - 1] = self._posisi
+        self._tulis(b'%d 0 obj\n' % nomor + isi + b'\n' + stream + b'endobj\n')
+    
+    def tambah(self, data, tautan=None):
+        """
+        Salin semua halaman (dan objek yang dipakainya) dari satu PDF
+        
+        Catalog, Info, dan node /Pages PDF sumber tidak disalin; halaman
+        disambungkan ke pohon halaman dokumen gabungan.
+        
+        Args:
+            data (bytes): Isi PDF hasil ReportLab
+            tautan (dict, optional): Indeks halaman (0-based) -> list
+                (rect, id_halaman_tujuan); rect (x0, y0, x1, y1) dalam
+                koordinat halaman. Ditambahkan sebagai anotasi link.
+        
+        Returns:
+            list: Nomor objek halaman di dokumen gabungan, sesuai urutan halaman
+        """
+        objek, trailer = baca_objek_pdf(data)
+        id_root = _referensi(trailer, b'Root')
+        id_info = _referensi(trailer, b'Info')
+        id_pages = _referensi(objek[id_root][0], b'Pages')
+        kids = re.search(rb'/Kids\s*\[([^\]]*)\]', objek[id_pages][0])
+        halaman_lama = [int(n) for n in _REFERENSI.findall(kids.group(1))] if kids else []
+        
+        peta = {id_pages: self._id_pages}
+        for nomor in sorted(objek):
+            if nomor not in (id_root, id_info, id_pages):
+                peta[nomor] = self._id_baru()
+        
+        def ganti(cocok):
+            nomor = int(cocok.group(1))
+            if nomor not in peta:
+                raise ValueError(f"Referensi ke objek {nomor} tidak bisa disalin")
+            return b'%d 0 R' % peta[nomor]
+        
+        # Anotasi link merujuk nomor objek baru, jadi disisipkan setelah renumbering
+        anotasi = {}
+        for i, nomor in enumerate(halaman_lama):
+            if not re.search(rb'/Type\s*/Page\b', objek[nomor][0]):
+                raise ValueError("Hanya pohon halaman datar yang didukung")
+            if tautan and i in tautan:
+                if b'/Annots' in objek[nomor][0]:
+                    raise ValueError("Halaman dengan anotasi tidak bisa diberi tautan")
+                anotasi[nomor] = b'<< /Annots [ ' + b' '.join(
+                    b'<< /Type /Annot /Subtype /Link /Border [ 0 0 0 ] /Rect [ %.2f %.2f %.2f %.2f ] '
+                    b'/Dest %s >>' % (*rect, _tujuan(tujuan))
+                    for rect, tujuan in tautan[i]
+                ) + b' ]'
+        
+        for nomor, (isi, stream) in sorted(objek.items()):
+            if nomor in (id_root, id_info, id_pages):
+                continue
+            isi = _REFERENSI.sub(ganti, isi)
+            if nomor in anotasi:
+                isi = isi.replace(b'<<', anotasi[nomor], 1)
+            self._tulis_objek(peta[nomor], isi, stream)
+        return [peta[nomor] for nomor in halaman_lama]
+    
+    def selesai(self, halaman, outline=()):
+        """
+        Tulis pohon halaman, outline, catalog, dan tabel xref
+        
+        Args:
+            halaman (list): Nomor objek halaman (dari tambah) sesuai urutan
+                di dokumen akhir
+            outline (list): (judul, id_halaman) untuk bookmark tingkat satu
+        """
+        if outline:
+            id_outlines = self._id_baru()
+            id_item = [self._id_baru() for _ in outline]
+            for i, (judul, tujuan) in enumerate(outline):
+                isi = b'<< /Title %s /Parent %d 0 R /Dest %s' % (_teks_pdf(judul), id_outlines,
+                                                                  _tujuan(tujuan))
+                if i:
+                    isi += b' /Prev %d 0 R' % id_item[i - 1]
+                if i + 1 < len(id_item):
+                    isi += b' /Next %d 0 R' % id_item[i + 1]
+                self._tulis_objek(id_item[i], isi + b' >>')
+            self._tulis_objek(id_outlines, b'<< /Type /Outlines /Count %d /First %d 0 R /Last %d 0 R >>'
+                              % (len(id_item), id_item[0], id_item[-1]))
+        
+        kids = b' '.join(b'%d 0 R' % nomor for nomor in halaman)
+        self._tulis_objek(self._id_pages, b'<< /Type /Pages /Count %d /Kids [ %s ] >>'
+                          % (len(halaman), kids))
+        catalog = b'<< /Type /Catalog /Pages %d 0 R' % self._id_pages
+        if outline:
+            catalog += b' /Outlines %d 0 R' % id_outlines
+        self._tulis_objek(self._id_catalog, catalog + b' >>')
+        
+        posisi_xref = self._posisi
+        jumlah = len(self._offset) + 1
+        self._tulis(b'xref\n0 %d\n0000000000 65535 f \n' % jumlah)
+        self._tulis(b''.join(b'%010d 00000 n \n' % o for o in self._offset))
+        self._tulis(b'trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                    % (jumlah, self._id_catalog, posisi_xref))
+        self.close()
+    
+    def close(self):
+        """Tutup file tujuan (hanya jika dibuka dari path)"""
+        if self._milik_sendiri and not self._file.closed:
+            self._file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,273 @@
+"""
+Antrian render PDF di background
+Render PDF (ReportLab) dijalankan di thread pool sehingga thread script
+Streamlit tidak ikut berhenti selama laporan dibuat. UI mengirim job dengan
+key hasil, memeriksa statusnya secara berkala, lalu mengambil bytes PDF dari
+cache hasil yang dibatasi ukurannya (byte).
+
+Job dengan key yang sama hanya dirender sekali: permintaan kedua selama job
+masih berjalan ikut menunggu job tersebut, dan setelah selesai langsung
+dilayani dari cache. Job yang gagal dipindah ke daftar kegagalan LRU yang
+kecil (maks_gagal), sehingga pesan error bisa ditampilkan tanpa menumpuk.
+
+Contoh:
+    antrian = AntrianRender(workers=2)
+    status = antrian.kirim(key, generate_pdf_report, nama, ...)
+    if status == 'selesai':
+        pdf_bytes = antrian.ambil(key)
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Status job
+MENUNGGU = 'menunggu'
+BERJALAN = 'berjalan'
+SELESAI = 'selesai'
+GAGAL = 'gagal'
+PENUH = 'penuh'
+TIDAK_ADA = 'tidak_ada'
+
+
+class _Job:
+    """Status satu job render"""
+    
+    __slots__ = ('status', 'urutan', 'dikirim', 'error')
+    
+    def __init__(self, urutan):
+        self.status = MENUNGGU
+        self.urutan = urutan
+        self.dikirim = time.monotonic()
+        self.error = None
+
+
+class AntrianRender:
+    """
+    Thread pool render dengan antrian terbatas dan cache hasil LRU (byte)
+    
+    Args:
+        workers (int): Jumlah thread render
+        maks_antrian (int): Jumlah job menunggu maksimum (di luar yang sedang
+            dirender); kirim() mengembalikan 'penuh' jika terlampaui
+        maks_bytes (int): Total ukuran hasil di cache sebelum hasil terlama dibuang
+        maks_gagal (int): Jumlah job gagal yang statusnya disimpan sebelum
+            kegagalan terlama dibuang
+    """
+    
+    def __init__(self, workers=2, maks_antrian=16, maks_bytes=32 * 2**20, maks_gagal=64):
+        self.workers = workers
+        self.maks_antrian = maks_antrian
+        self.maks_bytes = maks_bytes
+        self.maks_gagal = maks_gagal
+        self.hits = 0
+        self.misses = 0
+        self.duplikat = 0
+        self.ditolak = 0
+        self.gagal = 0
+        self._hasil = OrderedDict()
+        self._bytes = 0
+        self._job = {}
+        self._gagal = OrderedDict()
+        self._urutan = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix='spk-render')
+    
+    def kirim(self, key, fungsi, *args, **kwargs):
+        """
+        Kirim job render (idempotent untuk key yang sama)
+        
+        Jika hasil key sudah ada di cache, tidak ada render baru. Jika job key
+        masih menunggu/berjalan, job tersebut dipakai bersama. Job yang gagal
+        dikirim ulang.
+        
+        Args:
+            key (hashable): Identitas hasil, misalnya input siswa + sidik katalog + bobot
+            fungsi (callable): Fungsi render, mengembalikan bytes
+            *args, **kwargs: Argumen fungsi
+        
+        Returns:
+            str: 'selesai', 'menunggu', 'berjalan', atau 'penuh'
+        """
+        with self._lock:
+            if key in self._hasil:
+                self._hasil.move_to_end(key)
+                self.hits += 1
+                return SELESAI
+            
+            job = self._job.get(key)
+            if job is not None:
+                self.duplikat += 1
+                return job.status
+            
+            menunggu = sum(1 for j in self._job.values() if j.status == MENUNGGU)
+            if menunggu >= self.maks_antrian:
+                self.ditolak += 1
+                return PENUH
+            
+            self.misses += 1
+            self._urutan += 1
+            self._gagal.pop(key, None)
+            job = self._job[key] = _Job(self._urutan)
+        
+        self._pool.submit(self._jalankan, key, job, fungsi, args, kwargs)
+        return MENUNGGU
+    
+    def _jalankan(self, key, job, fungsi, args, kwargs):
+        """
+        Render satu job di thread pool lalu simpan hasilnya ke cache
+        
+        Semua error (termasuk hasil tanpa len()) dicatat sebagai GAGAL, karena
+        exception yang lolos tertelan oleh Future dan job tertahan di BERJALAN.
+        """
+        with self._lock:
+            job.status = BERJALAN
+        try:
+            hasil = fungsi(*args, **kwargs)
+            ukuran = len(hasil)
+        except Exception as e:
+            with self._lock:
+                self._catat_gagal(key, job, f"{type(e).__name__}: {e}")
+            return
+        
+        with self._lock:
+            if ukuran > self.maks_bytes:
+                self._catat_gagal(key, job, f"Hasil ({ukuran:,} byte) melebihi maks_bytes cache")
+                return
+            try:
+                self._simpan(key, hasil, ukuran)
+            except Exception as e:
+                self._catat_gagal(key, job, f"{type(e).__name__}: {e}")
+                return
+            self._job.pop(key, None)
+            job.status = SELESAI
+    
+    def _catat_gagal(self, key, job, error):
+        """Pindahkan job dari daftar aktif ke daftar kegagalan (LRU, maks_gagal)"""
+        job.status = GAGAL
+        job.error = error
+        self.gagal += 1
+        self._job.pop(key, None)
+        self._gagal[key] = job
+        self._gagal.move_to_end(key)
+        while len(self._gagal) > self.maks_gagal:
+            self._gagal.popitem(last=False)
+    
+    def _simpan(self, key, hasil, ukuran):
+        """Simpan hasil ke cache dan buang hasil terlama jika melebihi maks_bytes"""
+        self._hasil[key] = hasil
+        self._bytes += ukuran
+        while self._bytes > self.maks_bytes:
+            _, lama = self._hasil.popitem(last=False)
+            self._bytes -= len(lama)
+    
+    def status(self, key):
+        """
+        Status job untuk ditampilkan di UI
+        
+        Returns:
+            dict: status ('selesai', 'menunggu', 'berjalan', 'gagal', 'tidak_ada'),
+                posisi (jumlah job menunggu di depannya), detik (sejak dikirim),
+                error (pesan jika gagal)
+        """
+        with self._lock:
+            if key in self._hasil:
+                return {'status': SELESAI, 'posisi': 0, 'detik': 0.0, 'error': None}
+            job = self._job.get(key)
+            if job is None:
+                job = self._gagal.get(key)
+            if job is None:
+                return {'status': TIDAK_ADA, 'posisi': 0, 'detik': 0.0, 'error': None}
+            posisi = 0
+            if job.status == MENUNGGU:
+                posisi = sum(1 for j in self._job.values()
+                             if j.status == MENUNGGU and j.urutan < job.urutan)
+            return {
+                'status': job.status,
+                'posisi': posisi,
+                'detik': time.monotonic() - job.dikirim,
+                'error': job.error
+            }
+    
+    def ambil(self, key):
+        """
+        Bytes hasil render dari cache
+        
+        Returns:
+            bytes | None: None jika belum selesai atau sudah dibuang dari cache
+        """
+        with self._lock:
+            hasil = self._hasil.get(key)
+            if hasil is not None:
+                self._hasil.move_to_end(key)
+            return hasil
+    
+    def tunggu(self, key, timeout=None, interval=0.05):
+        """
+        Tunggu sampai job key selesai/gagal (untuk script & CLI, bukan UI)
+        
+        Returns:
+            dict: Status terakhir (lihat status())
+        """
+        batas = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.status(key)
+            if status['status'] not in (MENUNGGU, BERJALAN):
+                return status
+            if batas is not None and time.monotonic() >= batas:
+                return status
+            time.sleep(interval)
+    
+    def clear(self):
+        """Kosongkan cache hasil & kegagalan dan reset statistik (job berjalan tidak dibatalkan)"""
+        with self._lock:
+            self._hasil.clear()
+            self._gagal.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.duplikat = self.ditolak = self.gagal = 0
+    
+    def info(self):
+        """
+        Statistik antrian & cache
+        
+        Returns:
+            dict: hits, misses, size, bytes, maks_bytes, hit_rate, menunggu,
+                berjalan, duplikat, ditolak, gagal
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._hasil),
+                'bytes': self._bytes,
+                'maks_bytes': self.maks_bytes,
+                'hit_rate': self.hits / total if total else 0.0,
+                'menunggu': sum(1 for j in self._job.values() if j.status == MENUNGGU),
+                'berjalan': sum(1 for j in self._job.values() if j.status == BERJALAN),
+                'duplikat': self.duplikat,
+                'ditolak': self.ditolak,
+                'gagal': self.gagal
+            }
+    
+    def kolektor(self):
+        """
+        Sampel metrik untuk RegistryMetrik.daftar_kolektor (utils/metrics.py)
+        
+        Returns:
+            list: (nama, tipe, label, nilai)
+        """
+        info = self.info()
+        return [
+            ('spk_render_antrian', 'gauge', {'status': MENUNGGU}, info['menunggu']),
+            ('spk_render_antrian', 'gauge', {'status': BERJALAN}, info['berjalan']),
+            ('spk_render_duplikat_total', 'counter', {}, info['duplikat']),
+            ('spk_render_ditolak_total', 'counter', {}, info['ditolak']),
+            ('spk_render_gagal_total', 'counter', {}, info['gagal']),
+            ('spk_render_cache_bytes', 'gauge', {}, info['bytes']),
+        ]
+    
+    def tutup(self, wait=True):
+        """Hentikan thread pool"""
+        self._pool.shutdown(wait=wait)
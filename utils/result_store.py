@@ -0,0 +1,350 @@
+"""
+Format biner kolumnar untuk hasil SAW satu angkatan
+Hasil batch disimpan sebagai direktori berisi file .npy per kolom sehingga
+bisa dibuka dengan memory-map (np.load(mmap_mode='r')) dan satu kolom bisa
+dibaca tanpa mem-parse kolom lain.
+
+Layout direktori (contoh: hasil.saw/):
+    meta.json        versi format, jumlah siswa (N), kode & nama jurusan (M),
+                     urutan kriteria, bobot, dan daftar kolom
+    id_offset.npy    int64 (N+1,)    offset byte id siswa ke-i di id_data.bin
+                                      (id ke-i = id_data[offset[i]:offset[i+1]])
+    id_data.bin      UTF-8           semua id siswa disambung tanpa pemisah
+    nilai_saw.npy    float64 (N, M)  nilai preferensi V per jurusan
+    nilai_saw_t.npy  float64 (M, N)  salinan transpos nilai_saw (opsional):
+                                      nilai semua siswa untuk satu jurusan
+                                      berurutan di file, sehingga membaca satu
+                                      jurusan lewat memory-map hanya menyentuh
+                                      N x 8 byte, bukan seluruh file
+    r.npy            float64 (N, M, 4) R1-R4 sesuai URUTAN_KRITERIA (opsional)
+    peringkat.npy    int32 (N, M)    peringkat jurusan ke-j untuk siswa ke-i
+                                      (1 = terbaik, 0 = di luar top_k)
+
+Semua file .npy memakai format NumPy standar (versi 1.0, little-endian,
+C-order) sehingga bisa dibaca tanpa modul ini.
+
+nilai_saw.npy disimpan per baris (per siswa) karena ditulis per chunk;
+salinan transpos dibuat saat close() dengan biaya tambahan N x M x 8 byte
+di disk. Tanpa salinan ini (simpan_kolom=False), kolom_jurusan tetap benar
+tetapi membaca hampir seluruh nilai_saw.npy begitu M x 8 byte melebihi
+ukuran halaman.
+"""
+
+import json
+import os
+import struct
+
+import numpy as np
+
+from data.jurusan_data import URUTAN_KRITERIA
+
+VERSI_FORMAT = 1
+
+# Panjang header .npy tetap (kelipatan 64) supaya shape bisa ditulis ulang
+# setelah jumlah baris diketahui
+_PANJANG_HEADER_NPY = 128
+_MAGIC_NPY = b'\x93NUMPY\x01\x00'
+
+# Ukuran blok (byte) saat membuat salinan transpos nilai_saw
+_BLOK_TRANSPOS_BYTES = 32 * 2**20
+
+
+class _PenulisNpy:
+    """
+    Penulis file .npy yang bisa ditambah per chunk (jumlah baris belum diketahui)
+    
+    Header ditulis dengan placeholder, lalu ditulis ulang dengan shape akhir
+    saat close().
+    """
+    
+    def __init__(self, path, dtype, shape_ekor=()):
+        self.path = path
+        self.dtype = np.dtype(dtype).newbyteorder('<')
+        self.shape_ekor = tuple(shape_ekor)
+        self.jumlah_baris = 0
+        self._file = open(path, 'wb')
+        self._file.write(self._header())
+    
+    def _header(self):
+        teks = repr({
+            'descr': np.lib.format.dtype_to_descr(self.dtype),
+            'fortran_order': False,
+            'shape': (self.jumlah_baris,) + self.shape_ekor,
+        })
+        panjang_teks = _PANJANG_HEADER_NPY - len(_MAGIC_NPY) - 2
+        teks = teks.ljust(panjang_teks - 1) + '\n'
+        if len(teks) != panjang_teks:
+            raise ValueError("Shape terlalu panjang untuk header .npy")
+        return _MAGIC_NPY + struct.pack('<H', panjang_teks) + teks.encode('latin1')
+    
+    def tulis(self, array):
+        array = np.ascontiguousarray(array, dtype=self.dtype)
+        if array.shape[1:] != self.shape_ekor:
+            raise ValueError(
+                f"Shape {array.shape[1:]} tidak sesuai dengan {self.shape_ekor} ({self.path})"
+            )
+        self._file.write(array.tobytes())
+        self.jumlah_baris += len(array)
+    
+    def close(self):
+        if self._file is None:
+            return
+        self._file.seek(0)
+        self._file.write(self._header())
+        self._file.close()
+        self._file = None
+
+
+class PenulisHasilBiner:
+    """
+    Tulis hasil SAW batch ke direktori format biner kolumnar, per chunk
+    
+    Contoh:
+        with PenulisHasilBiner('hasil.saw', kode, nama) as penulis:
+            for hasil in pipeline_kohort('siswa.csv', dengan_r=True):
+                penulis.tulis(hasil.chunk.ids, hasil.nilai_saw,
+                              hasil.ranking, hasil.matriks_r)
+    
+    Args:
+        path (str): Direktori tujuan (dibuat jika belum ada)
+        kode_jurusan (list): Kode jurusan sesuai urutan kolom
+        nama_jurusan (list, optional): Nama jurusan sesuai urutan kolom
+        bobot_kriteria (dict, optional): Bobot yang dipakai (disimpan di meta)
+        simpan_r (bool): Simpan R1-R4 (r.npy)
+        simpan_kolom (bool): Simpan salinan transpos nilai_saw (nilai_saw_t.npy)
+            untuk membaca per jurusan
+    """
+    
+    def __init__(self, path, kode_jurusan, nama_jurusan=None, bobot_kriteria=None,
+                 simpan_r=True, simpan_kolom=True):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.kode_jurusan = list(kode_jurusan)
+        self.nama_jurusan = list(nama_jurusan) if nama_jurusan is not None else None
+        self.bobot_kriteria = dict(bobot_kriteria) if bobot_kriteria is not None else None
+        self.simpan_r = simpan_r
+        self.simpan_kolom = simpan_kolom
+        
+        m = len(self.kode_jurusan)
+        self._offset = _PenulisNpy(os.path.join(path, 'id_offset.npy'), np.int64)
+        self._offset.tulis(np.zeros(1, dtype=np.int64))
+        self._id_data = open(os.path.join(path, 'id_data.bin'), 'wb')
+        self._posisi_id = 0
+        self._nilai = _PenulisNpy(os.path.join(path, 'nilai_saw.npy'), np.float64, (m,))
+        self._peringkat = _PenulisNpy(os.path.join(path, 'peringkat.npy'), np.int32, (m,))
+        self._r = _PenulisNpy(os.path.join(path, 'r.npy'), np.float64,
+                              (m, len(URUTAN_KRITERIA))) if simpan_r else None
+    
+    def tulis(self, ids, nilai_saw, ranking, matriks_r=None):
+        """
+        Tambahkan satu chunk hasil
+        
+        Args:
+            ids (list): Id siswa (N,)
+            nilai_saw (np.ndarray): Nilai SAW (N, M)
+            ranking (np.ndarray): Indeks jurusan urut dari terbaik (N, M) atau (N, k)
+            matriks_r (np.ndarray, optional): R1-R4 (N, M, 4), wajib jika simpan_r
+        """
+        encoded = [str(i).encode('utf-8') for i in ids]
+        panjang = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+        self._offset.tulis(self._posisi_id + np.cumsum(panjang))
+        self._id_data.write(b''.join(encoded))
+        self._posisi_id += int(panjang.sum())
+        
+        self._nilai.tulis(nilai_saw)
+        self._peringkat.tulis(peringkat_dari_ranking(ranking, len(self.kode_jurusan)))
+        
+        if self._r is not None:
+            if matriks_r is None:
+                raise ValueError("matriks_r wajib diisi jika simpan_r=True")
+            self._r.tulis(matriks_r)
+    
+    def close(self):
+        """Tulis ulang header dengan jumlah baris akhir dan simpan meta.json"""
+        if self._id_data is None:
+            return
+        self._id_data.close()
+        self._id_data = None
+        for penulis in (self._offset, self._nilai, self._peringkat, self._r):
+            if penulis is not None:
+                penulis.close()
+        if self.simpan_kolom:
+            _tulis_transpos(os.path.join(self.path, 'nilai_saw.npy'),
+                            os.path.join(self.path, 'nilai_saw_t.npy'))
+        
+        kolom = ['id', 'nilai_saw', 'peringkat']
+        if self.simpan_kolom:
+            kolom.append('nilai_saw_t')
+        if self.simpan_r:
+            kolom.append('r')
+        meta = {
+            'versi_format': VERSI_FORMAT,
+            'jumlah_siswa': self._nilai.jumlah_baris,
+            'kode_jurusan': self.kode_jurusan,
+            'nama_jurusan': self.nama_jurusan,
+            'urutan_kriteria': list(URUTAN_KRITERIA),
+            'bobot_kriteria': self.bobot_kriteria,
+            'kolom': kolom
+        }
+        with open(os.path.join(self.path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _tulis_transpos(path_sumber, path_tujuan):
+    """
+    Tulis transpos file .npy 2D per blok baris (memori dibatasi
+    _BLOK_TRANSPOS_BYTES, tidak bergantung pada N)
+    """
+    sumber = np.load(path_sumber, mmap_mode='r')
+    n, m = sumber.shape
+    if n == 0 or m == 0:
+        np.save(path_tujuan, np.zeros((m, n), dtype=sumber.dtype))
+        return
+    tujuan = np.lib.format.open_memmap(path_tujuan, mode='w+', dtype=sumber.dtype, shape=(m, n))
+    ukuran_blok = max(1, _BLOK_TRANSPOS_BYTES // (m * sumber.dtype.itemsize))
+    for awal in range(0, n, ukuran_blok):
+        tujuan[:, awal:awal + ukuran_blok] = sumber[awal:awal + ukuran_blok].T
+    tujuan.flush()
+    del tujuan
+
+
+def peringkat_dari_ranking(ranking, jumlah_jurusan):
+    """
+    Ubah ranking (indeks jurusan urut dari terbaik) menjadi peringkat per jurusan
+    
+    Args:
+        ranking (np.ndarray): Indeks jurusan (N, k)
+        jumlah_jurusan (int): M
+    
+    Returns:
+        np.ndarray: int32 (N, M), 1 = terbaik, 0 = tidak masuk ranking
+    """
+    ranking = np.asarray(ranking)
+    peringkat = np.zeros((len(ranking), jumlah_jurusan), dtype=np.int32)
+    posisi = np.broadcast_to(np.arange(1, ranking.shape[1] + 1, dtype=np.int32), ranking.shape)
+    np.put_along_axis(peringkat, ranking, posisi, axis=1)
+    return peringkat
+
+
+class HasilBiner:
+    """
+    Pembaca direktori hasil biner, semua kolom dibuka dengan memory-map
+    
+    Kolom hanya dibuka saat pertama kali diakses, sehingga membaca
+    nilai_saw tidak menyentuh r.npy sama sekali.
+    
+    Args:
+        path (str): Direktori hasil
+        mmap (bool): Buka dengan memory-map (default) atau baca ke memori
+    """
+    
+    def __init__(self, path, mmap=True):
+        self.path = path
+        self._mode = 'r' if mmap else None
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            self.meta = json.load(f)
+        if self.meta.get('versi_format') != VERSI_FORMAT:
+            raise ValueError(f"Versi format tidak didukung: {self.meta.get('versi_format')}")
+        self.kode_jurusan = self.meta['kode_jurusan']
+        self._indeks_kode = {k: i for i, k in enumerate(self.kode_jurusan)}
+        self._kolom = {}
+    
+    def __len__(self):
+        return self.meta['jumlah_siswa']
+    
+    def _buka(self, nama):
+        if nama not in self._kolom:
+            self._kolom[nama] = np.load(os.path.join(self.path, f'{nama}.npy'),
+                                        mmap_mode=self._mode)
+        return self._kolom[nama]
+    
+    @property
+    def nilai_saw(self):
+        """np.ndarray (N, M) nilai SAW"""
+        return self._buka('nilai_saw')
+    
+    @property
+    def nilai_saw_kolom(self):
+        """np.ndarray (M, N) nilai SAW per jurusan (salinan transpos)"""
+        if 'nilai_saw_t' not in self.meta['kolom']:
+            raise KeyError("File hasil tidak menyimpan salinan transpos nilai_saw")
+        return self._buka('nilai_saw_t')
+    
+    @property
+    def peringkat(self):
+        """np.ndarray (N, M) peringkat jurusan (1 = terbaik)"""
+        return self._buka('peringkat')
+    
+    @property
+    def matriks_r(self):
+        """np.ndarray (N, M, 4) R1-R4"""
+        if 'r' not in self.meta['kolom']:
+            raise KeyError("File hasil tidak menyimpan R1-R4")
+        return self._buka('r')
+    
+    def _id_data(self):
+        if 'id_data' not in self._kolom:
+            path = os.path.join(self.path, 'id_data.bin')
+            if os.path.getsize(path) == 0:
+                self._kolom['id_data'] = np.zeros(0, dtype=np.uint8)
+            elif self._mode is None:
+                self._kolom['id_data'] = np.fromfile(path, dtype=np.uint8)
+            else:
+                self._kolom['id_data'] = np.memmap(path, dtype=np.uint8, mode='r')
+        return self._kolom['id_data']
+    
+    def id(self, i):
+        """Id siswa ke-i"""
+        offset = self._buka('id_offset')
+        return bytes(self._id_data()[offset[i]:offset[i + 1]]).decode('utf-8')
+    
+    def ids(self, awal=0, akhir=None):
+        """
+        Id siswa baris awal..akhir sebagai list (default semua baris)
+        
+        Hanya potongan kolom id untuk rentang tersebut yang dimuat ke memori.
+        """
+        offset = np.asarray(self._buka('id_offset')[awal:len(self) + 1 if akhir is None else akhir + 1])
+        if not len(offset):
+            return []
+        data = bytes(self._id_data()[offset[0]:offset[-1]])
+        offset = offset - offset[0]
+        return [data[a:b].decode('utf-8') for a, b in zip(offset[:-1].tolist(), offset[1:].tolist())]
+    
+    def kolom_jurusan(self, kode):
+        """
+        Nilai SAW semua siswa untuk satu jurusan
+        
+        Memakai nilai_saw_t.npy jika ada (satu blok berurutan di file);
+        file lama tanpa salinan transpos dibaca dengan stride dari nilai_saw.
+        
+        Args:
+            kode (str): Kode jurusan
+        
+        Returns:
+            np.ndarray: (N,) float64
+        """
+        j = self._indeks_kode[kode]
+        if 'nilai_saw_t' in self.meta['kolom']:
+            return self._buka('nilai_saw_t')[j]
+        return self.nilai_saw[:, j]
+
+
+def baca_hasil_biner(path, mmap=True):
+    """
+    Buka direktori hasil biner
+    
+    Args:
+        path (str): Direktori hasil
+        mmap (bool): Buka dengan memory-map
+    
+    Returns:
+        HasilBiner: Pembaca hasil
+    """
+    return HasilBiner(path, mmap=mmap)
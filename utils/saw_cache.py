@@ -0,0 +1,145 @@
+"""
+Cache hasil perhitungan SAW (LRU)
+Profil siswa yang sama sering dihitung berulang kali, sehingga hasil
+hitung_saw disimpan berdasarkan input yang sudah dinormalisasi
+"""
+
+import threading
+from collections import OrderedDict
+
+from data.jurusan_data import EKONOMI_SISWA_MAP, BIAYA_JURUSAN_MAP, get_katalog
+from utils.metrics import METRIK, kolektor_cache
+from utils.saw_calculator import hitung_saw_ringkas
+
+
+class CacheSAW:
+    """
+    Cache LRU untuk hasil hitung_saw dengan batas jumlah entri
+    
+    Key cache terdiri dari input siswa yang dinormalisasi. Entri disimpan
+    sebagai HasilSAW (array) supaya kecil di memori. Seluruh isi cache
+    dibuang otomatis jika katalog jurusan, bobot kriteria, atau mapping
+    ekonomi/biaya berubah.
+    
+    Args:
+        maxsize (int): Jumlah maksimum entri sebelum entri terlama dibuang
+    """
+    
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._versi = None
+        self._lock = threading.Lock()
+    
+    def hitung(self, nilai_akademik, minat, ekonomi, prospek_kerja,
+               jurusan_data, bobot_kriteria, top_k=None):
+        """
+        Sama seperti hitung_saw, tetapi memakai cache
+        
+        Returns:
+            tuple: (hasil_ranking, detail_perhitungan) seperti hitung_saw
+        """
+        katalog = get_katalog(jurusan_data)
+        versi = versi_perhitungan(katalog, bobot_kriteria)
+        key = normalisasi_key(nilai_akademik, minat, ekonomi, prospek_kerja, top_k)
+        
+        with self._lock:
+            if versi != self._versi:
+                self._data.clear()
+                self._versi = versi
+            
+            tersimpan = self._data.get(key)
+            if tersimpan is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+        
+        if tersimpan is None:
+            tersimpan = hitung_saw_ringkas(nilai_akademik, minat, ekonomi, prospek_kerja,
+                                           katalog, bobot_kriteria, top_k=top_k)
+            with self._lock:
+                self.misses += 1
+                if versi == self._versi:
+                    self._data[key] = tersimpan
+                    if len(self._data) > self.maxsize:
+                        self._data.popitem(last=False)
+        
+        # Dictionary dibuat baru setiap kali, isi cache tidak bisa diubah caller
+        return tersimpan.hasil.to_list(), tersimpan.detail.to_list()
+    
+    def clear(self):
+        """Kosongkan cache dan reset statistik"""
+        with self._lock:
+            self._data.clear()
+            self._versi = None
+            self.hits = 0
+            self.misses = 0
+    
+    def info(self):
+        """
+        Statistik cache
+        
+        Returns:
+            dict: hits, misses, size, maxsize, hit_rate
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+
+
+def normalisasi_key(nilai_akademik, minat, ekonomi, prospek_kerja, top_k=None):
+    """
+    Normalisasi input siswa menjadi key cache
+    
+    Angka diubah ke float sehingga 85 dan 85.0 menghasilkan key yang sama.
+    """
+    return (float(nilai_akademik), minat, ekonomi, float(prospek_kerja), top_k)
+
+
+def versi_perhitungan(jurusan_data, bobot_kriteria):
+    """
+    Identitas semua data yang mempengaruhi hasil SAW selain input siswa
+    
+    Katalog diambil lewat get_katalog, sehingga JURUSAN_DATA yang diubah
+    di tempat langsung menghasilkan sidik (dan versi) baru.
+    
+    Args:
+        jurusan_data (dict | KatalogJurusan | str): Data jurusan atau katalog
+        bobot_kriteria (dict): Bobot untuk setiap kriteria
+    
+    Returns:
+        tuple: Sidik katalog, bobot, dan mapping ekonomi/biaya
+    """
+    return (
+        get_katalog(jurusan_data).sidik,
+        tuple(sorted(bobot_kriteria.items())),
+        tuple(EKONOMI_SISWA_MAP.items()),
+        tuple(BIAYA_JURUSAN_MAP.items())
+    )
+
+
+# Cache default untuk satu proses
+CACHE_SAW = CacheSAW()
+METRIK.daftar_kolektor(kolektor_cache('saw', CACHE_SAW))
+
+
+def hitung_saw_cached(nilai_akademik, minat, ekonomi, prospek_kerja,
+                      jurusan_data, bobot_kriteria, top_k=None):
+    """
+    Versi hitung_saw yang memakai CACHE_SAW
+    
+    Args:
+        Sama seperti hitung_saw
+    
+    Returns:
+        tuple: (hasil_ranking, detail_perhitungan)
+    """
+    return CACHE_SAW.hitung(nilai_akademik, minat, ekonomi, prospek_kerja,
+                            jurusan_data, bobot_kriteria, top_k=top_k)
@@ -3,7 +3,15 @@ Modul untuk perhitungan SAW (Simple Additive Weighting)
 Berisi semua fungsi logic untuk menghitung rekomendasi jurusan
 """
 
-from data.jurusan_data import EKONOMI_SISWA_MAP, BIAYA_JURUSAN_MAP
+from collections import namedtuple
+
+import numpy as np
+
+from data.jurusan_data import (
+    EKONOMI_SISWA_MAP, BIAYA_JURUSAN_MAP, URUTAN_KRITERIA, get_katalog
+)
+from utils.metrics import terukur
+from utils.saw_result import susun_hasil
 
 
 def normalisasi_benefit(nilai, nilai_max):
@@ -138,8 +146,190 @@ def hitung_nilai_preferensi(r1, r2, r3, r4, bobot):
     return nilai_preferensi
 
 
+def _kodekan_kategori(nilai, pilihan):
+    """
+    Ubah kolom kategori (string) menjadi kode integer sesuai urutan pilihan
+    
+    Nilai yang tidak ada di pilihan mendapat kode -1.
+    """
+    nilai = np.asarray(nilai)
+    if nilai.dtype.kind in 'iu':
+        return nilai.astype(np.int64)
+    kode = np.full(nilai.shape, -1, dtype=np.int64)
+    for i, p in enumerate(pilihan):
+        kode[nilai == p] = i
+    return kode
+
+
+TabelKategori = namedtuple('TabelKategori', ['kunci', 'pilihan_ekonomi', 'minat', 'ekonomi'])
+TabelKategori.__doc__ = """
+Tabel R2 dan R3 yang sudah dihitung untuk setiap kategori input siswa
+
+Attributes:
+    kunci (tuple): Sidik katalog dan snapshot EKONOMI_SISWA_MAP &
+        BIAYA_JURUSAN_MAP saat dibangun
+    pilihan_ekonomi (tuple): Kategori ekonomi siswa sesuai baris tabel ekonomi
+    minat (np.ndarray): R2 (len(pilihan_minat) + 1, M), baris terakhir
+        untuk minat yang tidak dikenal (kode -1)
+    ekonomi (np.ndarray): R3 (len(pilihan_ekonomi), M)
+"""
+
+
+def _bangun_tabel_kategori(katalog, kunci):
+    """
+    Bangun tabel R2/R3 memakai hitung_r2_minat dan hitung_r3_ekonomi
+    
+    Fungsi skalar hanya dipanggil untuk setiap pasangan kategori
+    (siswa x jurusan), lalu hasilnya disebar ke M jurusan dengan gather.
+    """
+    # Objek sentinel tidak pernah sama dengan minat jurusan manapun
+    minat_siswa = list(katalog.pilihan_minat) + [object()]
+    tabel_minat = np.array([
+        [hitung_r2_minat(m_siswa, m_jurusan) for m_jurusan in katalog.pilihan_minat]
+        for m_siswa in minat_siswa
+    ], dtype=np.float64).reshape(len(minat_siswa), len(katalog.pilihan_minat))
+    
+    pilihan_ekonomi = tuple(EKONOMI_SISWA_MAP.keys())
+    tabel_ekonomi = np.array([
+        [hitung_r3_ekonomi(e, b) for b in katalog.pilihan_biaya]
+        for e in pilihan_ekonomi
+    ], dtype=np.float64).reshape(len(pilihan_ekonomi), len(katalog.pilihan_biaya))
+    
+    tabel_minat = np.ascontiguousarray(tabel_minat[:, katalog.minat])
+    tabel_ekonomi = np.ascontiguousarray(tabel_ekonomi[:, katalog.biaya_kategori])
+    tabel_minat.setflags(write=False)
+    tabel_ekonomi.setflags(write=False)
+    
+    return TabelKategori(kunci, pilihan_ekonomi, tabel_minat, tabel_ekonomi)
+
+
+def get_tabel_kategori(katalog):
+    """
+    Dapatkan tabel R2/R3 untuk katalog, dibangun ulang otomatis jika
+    isi katalog (sidik), EKONOMI_SISWA_MAP, atau BIAYA_JURUSAN_MAP berubah
+    
+    Args:
+        katalog (KatalogJurusan): Katalog terkompilasi
+    
+    Returns:
+        TabelKategori: Tabel R2 & R3 siap pakai
+    """
+    kunci = (katalog.sidik, tuple(EKONOMI_SISWA_MAP.items()), tuple(BIAYA_JURUSAN_MAP.items()))
+    tabel = katalog.tabel_kategori
+    if tabel is None or tabel.kunci != kunci:
+        tabel = _bangun_tabel_kategori(katalog, kunci)
+        katalog.tabel_kategori = tabel
+    return tabel
+
+
+def _hitung_matriks_r(katalog, tabel, nilai_akademik, minat_kode, ekonomi_kode, prospek_kerja):
+    """
+    Hitung R1-R4 untuk N siswa x M jurusan dari katalog terkompilasi
+    
+    R1 & R4 dihitung dengan rumus yang sama persis dengan hitung_r1/hitung_r4
+    (termasuk kasus pembagi 0), R2 & R3 diambil dari tabel kategori.
+    
+    Returns:
+        tuple: (r1, r2, r3, r4) masing-masing np.ndarray (N, M)
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # R1 - benefit, 0 jika nilai standar jurusan 0
+        r1 = np.where(
+            katalog.nilai_standar == 0, 0.0,
+            nilai_akademik[:, None] / katalog.nilai_standar
+        )
+    
+    # R2 & R3 - gather baris tabel sesuai kategori siswa
+    r2 = tabel.minat[minat_kode]
+    r3 = tabel.ekonomi[ekonomi_kode]
+    
+    # R4 - 0.5 (netral) jika siswa tidak peduli prospek
+    r4 = np.where(
+        prospek_kerja[:, None] == 0,
+        0.5,
+        (prospek_kerja[:, None] * (katalog.prospek / 100)) / 100
+    )
+    
+    return r1, r2, r3, r4
+
+
+def _urutkan_descending(nilai_saw):
+    """Sort stabil descending per baris (sama seperti list.sort(reverse=True))"""
+    return np.argsort(-nilai_saw, axis=-1, kind='stable')
+
+
+# Partial selection punya overhead tetap (~30-40 µs): sort penuh lebih cepat
+# untuk katalog di bawah _BATAS_SORT_PENUH jurusan, atau jika total nilai
+# (N x M) di bawah _BATAS_ELEMEN_SORT_PENUH (lihat benchmarks/bench_top_k.py)
+_BATAS_SORT_PENUH = 128
+_BATAS_ELEMEN_SORT_PENUH = 2048
+
+
+def validasi_top_k(top_k, jumlah_jurusan):
+    """
+    Periksa top_k dan batasi ke jumlah jurusan
+    
+    Args:
+        top_k (int): Jumlah jurusan terbaik yang diminta
+        jumlah_jurusan (int): Jumlah jurusan di katalog (M)
+    
+    Returns:
+        int: min(top_k, jumlah_jurusan)
+    
+    Raises:
+        ValueError: Jika top_k bukan bilangan bulat >= 1
+    """
+    if isinstance(top_k, bool) or not isinstance(top_k, (int, np.integer)) or top_k < 1:
+        raise ValueError(f"top_k harus bilangan bulat >= 1, saat ini: {top_k!r}")
+    return min(int(top_k), jumlah_jurusan)
+
+
+def _pilih_top_k(nilai_saw, k):
+    """
+    Ambil indeks k jurusan terbaik per baris dengan partial selection
+    
+    Hasilnya sama dengan _urutkan_descending(nilai_saw)[:, :k] (termasuk
+    urutan nilai yang sama), tetapi tanpa sort penuh O(M log M): batas nilai
+    ke-k dicari dengan np.partition, lalu hanya k kandidat yang di-sort.
+    
+    Args:
+        nilai_saw (np.ndarray): Nilai SAW (N, M)
+        k (int): Jumlah jurusan terbaik yang diambil
+    
+    Returns:
+        np.ndarray: Indeks kolom (N, min(k, M)) urut dari nilai tertinggi
+    
+    Raises:
+        ValueError: Jika k bukan bilangan bulat >= 1
+    """
+    n, m = nilai_saw.shape
+    k = validasi_top_k(k, m)
+    if k == m or m < _BATAS_SORT_PENUH or n * m < _BATAS_ELEMEN_SORT_PENUH:
+        # Katalog kecil: sort penuh lebih murah dari overhead partition
+        return _urutkan_descending(nilai_saw)[:, :k]
+    
+    # Nilai terbesar ke-k setiap baris
+    batas = -np.partition(-nilai_saw, k - 1, axis=1)[:, k - 1:k]
+    if np.isnan(batas).any():
+        # Baris dengan kurang dari k nilai non-NaN: pakai sort penuh
+        # (NaN selalu di akhir, sama seperti jalur tanpa top_k)
+        return _urutkan_descending(nilai_saw)[:, :k]
+    
+    # Semua nilai di atas batas pasti masuk, sisanya diisi nilai == batas
+    # dengan indeks terkecil dulu (sama seperti sort stabil)
+    lebih = nilai_saw > batas
+    sama = nilai_saw == batas
+    sisa = k - lebih.sum(axis=1, keepdims=True)
+    terpilih = lebih | (sama & (np.cumsum(sama, axis=1) <= sisa))
+    
+    kandidat = np.nonzero(terpilih)[1].reshape(n, k)
+    urutan = _urutkan_descending(np.take_along_axis(nilai_saw, kandidat, axis=1))
+    return np.take_along_axis(kandidat, urutan, axis=1)
+
+
+@terukur('hitung_saw')
 def hitung_saw(nilai_akademik, minat, ekonomi, prospek_kerja, 
-               jurusan_data, bobot_kriteria):
+               jurusan_data, bobot_kriteria, top_k=None):
     """
     Fungsi utama untuk menghitung SAW untuk semua alternatif jurusan
     
@@ -148,51 +338,260 @@ def hitung_saw(nilai_akademik, minat, ekonomi, prospek_kerja,
         minat (str): Minat siswa ('IPA', 'IPS', 'Seni')
         ekonomi (str): Kemampuan ekonomi ('Rendah', 'Sedang', 'Tinggi')
         prospek_kerja (float): Prioritas prospek kerja (0-100)
-        jurusan_data (dict): Data semua jurusan
+        jurusan_data (dict | KatalogJurusan): Data semua jurusan
         bobot_kriteria (dict): Bobot untuk setiap kriteria
+        top_k (int, optional): Jika diisi, hanya k jurusan terbaik yang
+            dikembalikan (partial selection, tanpa sort penuh)
     
     Returns:
         tuple: (hasil_ranking, detail_perhitungan)
             - hasil_ranking: List dictionary berisi ranking jurusan
             - detail_perhitungan: List dictionary berisi detail normalisasi
     """
-    hasil = []
-    detail = []
+    ringkas = _hitung_saw_ringkas(nilai_akademik, minat, ekonomi, prospek_kerja,
+                                  jurusan_data, bobot_kriteria, top_k)
+    return ringkas.hasil.to_list(), ringkas.detail.to_list()
+
+
+@terukur('hitung_saw_ringkas')
+def hitung_saw_ringkas(nilai_akademik, minat, ekonomi, prospek_kerja,
+                       jurusan_data, bobot_kriteria, top_k=None):
+    """
+    Sama seperti hitung_saw, tetapi hasil dikembalikan sebagai HasilSAW
+    (array + satu urutan ranking) tanpa membuat dictionary per jurusan
     
-    # Hitung untuk setiap jurusan
-    for kode, data in jurusan_data.items():
-        # Hitung masing-masing R (normalisasi)
-        r1 = hitung_r1_nilai_akademik(nilai_akademik, data['nilai_standar'])
-        r2 = hitung_r2_minat(minat, data['minat'])
-        r3 = hitung_r3_ekonomi(ekonomi, data['biaya'])
-        r4 = hitung_r4_prospek_kerja(prospek_kerja, data['prospek'])
-        
-        # Hitung nilai preferensi (V)
-        nilai_preferensi = hitung_nilai_preferensi(r1, r2, r3, r4, bobot_kriteria)
-        
-        # Simpan hasil
-        hasil.append({
-            'Kode': kode,
-            'Jurusan': data['nama'],
-            'Nilai SAW': nilai_preferensi
-        })
-        
-        # Simpan detail untuk tabel
-        detail.append({
-            'Kode': kode,
-            'Jurusan': data['nama'],
-            'R1': r1,
-            'R2': r2,
-            'R3': r3,
-            'R4': r4,
-            'Total': nilai_preferensi
-        })
+    HasilSAW bisa di-unpack menjadi (hasil, detail) yang diakses seperti
+    list of dict, sehingga bisa langsung dipakai oleh format_hasil,
+    pd.DataFrame, dan generate_pdf_report.
+    
+    Args:
+        (sama dengan hitung_saw)
+    
+    Returns:
+        HasilSAW: Hasil ranking dalam bentuk array
+    """
+    return _hitung_saw_ringkas(nilai_akademik, minat, ekonomi, prospek_kerja,
+                               jurusan_data, bobot_kriteria, top_k)
+
+
+def _hitung_saw_ringkas(nilai_akademik, minat, ekonomi, prospek_kerja,
+                        jurusan_data, bobot_kriteria, top_k):
+    """
+    Isi hitung_saw_ringkas tanpa metrik, dipakai bersama oleh hitung_saw
+    agar satu panggilan hanya tercatat di satu tahap
+    """
+    katalog = get_katalog(jurusan_data)
+    tabel = get_tabel_kategori(katalog)
+    
+    if ekonomi not in tabel.pilihan_ekonomi:
+        raise KeyError(ekonomi)
+    
+    # Hitung masing-masing R (normalisasi) untuk semua jurusan sekaligus
+    r1, r2, r3, r4 = _hitung_matriks_r(
+        katalog,
+        tabel,
+        np.array([nilai_akademik], dtype=np.float64),
+        np.array([katalog.pilihan_minat.index(minat) if minat in katalog.pilihan_minat else -1]),
+        np.array([tabel.pilihan_ekonomi.index(ekonomi)]),
+        np.array([prospek_kerja], dtype=np.float64)
+    )
+    
+    # Hitung nilai preferensi (V)
+    nilai_preferensi = hitung_nilai_preferensi(r1[0], r2[0], r3[0], r4[0], bobot_kriteria)
+    
+    # Sort berdasarkan nilai SAW (descending), satu urutan untuk hasil & detail
+    if top_k is None:
+        urutan = _urutkan_descending(nilai_preferensi)
+    else:
+        urutan = _pilih_top_k(nilai_preferensi[None, :], top_k)[0]
+    
+    matriks_r = np.stack((r1[0], r2[0], r3[0], r4[0]), axis=-1)
+    return susun_hasil(katalog, urutan, nilai_preferensi, matriks_r)
+
+
+@terukur('hitung_saw_batch')
+def hitung_saw_batch(nilai_akademik, minat, ekonomi, prospek_kerja,
+                     jurusan_data, bobot_kriteria, top_k=None):
+    """
+    Hitung SAW untuk banyak siswa sekaligus (vectorized dengan NumPy)
+    
+    Setiap argumen siswa berupa array/kolom dengan panjang N. Rumus yang
+    dipakai sama persis dengan hitung_saw, sehingga nilai_saw[i] identik
+    dengan hasil hitung_saw untuk siswa ke-i.
+    
+    Args:
+        nilai_akademik (array-like): Nilai akademik siswa (N,)
+        minat (array-like): Minat siswa ('IPA', 'IPS', 'Seni') (N,)
+        ekonomi (array-like): Kemampuan ekonomi siswa (N,)
+        prospek_kerja (array-like): Prioritas prospek kerja (N,)
+        jurusan_data (dict | KatalogJurusan): Data semua jurusan
+        bobot_kriteria (dict): Bobot untuk setiap kriteria
+        top_k (int, optional): Jika diisi, ranking hanya berisi k jurusan
+            terbaik per siswa
+    
+    Returns:
+        tuple: (kode_jurusan, nilai_saw, ranking)
+            - kode_jurusan: List kode jurusan sesuai urutan kolom
+            - nilai_saw: np.ndarray (N, M) berisi nilai preferensi
+            - ranking: np.ndarray (N, M) atau (N, k) berisi indeks kolom
+              jurusan, urut dari nilai SAW tertinggi (urutan sama dengan hitung_saw)
+    """
+    katalog = get_katalog(jurusan_data)
+    r1, r2, r3, r4 = _hitung_r_kolom(katalog, nilai_akademik, minat, ekonomi, prospek_kerja)
+    
+    nilai_saw = hitung_nilai_preferensi(r1, r2, r3, r4, bobot_kriteria)
+    
+    return katalog.kode.tolist(), nilai_saw, urutkan_ranking(nilai_saw, top_k)
+
+
+@terukur('hitung_saw_batch_ringkas')
+def hitung_saw_batch_ringkas(nilai_akademik, minat, ekonomi, prospek_kerja,
+                             jurusan_data, bobot_kriteria, top_k=None):
+    """
+    Hitung SAW banyak siswa dan kembalikan HasilSAWBatch
+    
+    Hanya k jurusan teratas (top_k) yang disimpan per siswa: indeks jurusan
+    int32, nilai SAW dan R1-R4 float64 (44 byte per siswa x jurusan).
+    hasil[i] adalah HasilSAW siswa ke-i.
+    
+    Args:
+        (sama dengan hitung_saw_batch)
+    
+    Returns:
+        HasilSAWBatch: Hasil ranking semua siswa
+    """
+    katalog = get_katalog(jurusan_data)
+    r = _hitung_r_kolom(katalog, nilai_akademik, minat, ekonomi, prospek_kerja)
+    
+    nilai_saw = hitung_nilai_preferensi(*r, bobot_kriteria)
+    
+    return susun_hasil(katalog, urutkan_ranking(nilai_saw, top_k), nilai_saw,
+                       np.stack(r, axis=-1))
+
+
+def _hitung_r_kolom(katalog, nilai_akademik, minat, ekonomi, prospek_kerja):
+    """Kodekan kolom input siswa lalu hitung R1-R4 (N, M)"""
+    tabel = get_tabel_kategori(katalog)
+    
+    ekonomi_kode = _kodekan_kategori(ekonomi, tabel.pilihan_ekonomi)
+    if (ekonomi_kode < 0).any():
+        tidak_dikenal = np.asarray(ekonomi)[ekonomi_kode < 0][0]
+        raise KeyError(tidak_dikenal)
+    
+    return _hitung_matriks_r(
+        katalog,
+        tabel,
+        np.asarray(nilai_akademik, dtype=np.float64),
+        _kodekan_kategori(minat, katalog.pilihan_minat),
+        ekonomi_kode,
+        np.asarray(prospek_kerja, dtype=np.float64)
+    )
+
+
+def urutkan_ranking(nilai_saw, top_k=None):
+    """
+    Ranking jurusan dari matriks nilai SAW (sumbu terakhir)
+    
+    Args:
+        nilai_saw (np.ndarray): Nilai SAW (N, M)
+        top_k (int, optional): Jika diisi, hanya k jurusan terbaik
+            (dibatasi ke M)
     
-    # Sort hasil berdasarkan nilai SAW (descending)
-    hasil.sort(key=lambda x: x['Nilai SAW'], reverse=True)
-    detail.sort(key=lambda x: x['Total'], reverse=True)
+    Returns:
+        np.ndarray: Indeks jurusan urut dari nilai tertinggi (N, M) atau (N, k)
+    
+    Raises:
+        ValueError: Jika top_k bukan bilangan bulat >= 1
+    """
+    if top_k is None:
+        return _urutkan_descending(nilai_saw)
+    return _pilih_top_k(nilai_saw, top_k)
+
+
+# ========================================
+# REWEIGHT CEPAT (MATRIKS R DIPAKAI ULANG)
+# ========================================
+def hitung_matriks_normalisasi(nilai_akademik, minat, ekonomi, prospek_kerja,
+                               jurusan_data):
+    """
+    Hitung tensor normalisasi R untuk banyak siswa, tanpa bobot
+    
+    R hanya bergantung pada input siswa dan katalog, sehingga bisa disimpan
+    lalu dipakai ulang dengan terapkan_bobot() setiap kali bobot berubah.
+    
+    Args:
+        nilai_akademik (array-like): Nilai akademik siswa (N,)
+        minat (array-like): Minat siswa (N,)
+        ekonomi (array-like): Kemampuan ekonomi siswa (N,)
+        prospek_kerja (array-like): Prioritas prospek kerja (N,)
+        jurusan_data (dict | KatalogJurusan): Data semua jurusan
+    
+    Returns:
+        tuple: (kode_jurusan, matriks_r)
+            - kode_jurusan: List kode jurusan sesuai urutan kolom
+            - matriks_r: np.ndarray (N, M, 4) float64, sumbu terakhir
+              mengikuti URUTAN_KRITERIA (R1, R2, R3, R4)
+    """
+    katalog = get_katalog(jurusan_data)
+    r = _hitung_r_kolom(katalog, nilai_akademik, minat, ekonomi, prospek_kerja)
+    return katalog.kode.tolist(), np.stack(r, axis=-1)
+
+
+def vektor_bobot(bobot_kriteria):
+    """
+    Ubah bobot menjadi vektor sesuai URUTAN_KRITERIA
+    
+    Args:
+        bobot_kriteria (dict | array-like): Dictionary bobot, vektor (4,),
+            atau beberapa vektor bobot sekaligus (K, 4)
+    
+    Returns:
+        np.ndarray: Vektor bobot (4,) atau (K, 4) float64
+    """
+    if isinstance(bobot_kriteria, dict):
+        return np.array([bobot_kriteria[k] for k in URUTAN_KRITERIA], dtype=np.float64)
+    
+    bobot = np.asarray(bobot_kriteria, dtype=np.float64)
+    if bobot.shape[-1] != len(URUTAN_KRITERIA):
+        raise ValueError(
+            f"Vektor bobot harus berisi {len(URUTAN_KRITERIA)} kriteria, "
+            f"saat ini: {bobot.shape[-1]}"
+        )
+    return bobot
+
+
+def terapkan_bobot(matriks_r, bobot_kriteria, top_k=None):
+    """
+    Hitung ulang nilai SAW dari matriks R yang sudah ada dengan satu matmul
+    
+    Formula: V = R · W, tanpa normalisasi ulang. Nilai bisa berbeda di
+    digit terakhir (pembulatan floating point) dibanding hitung_saw karena
+    urutan penjumlahan matmul tidak dijamin sama.
+    
+    Args:
+        matriks_r (np.ndarray): Tensor R (N, M, 4) dari hitung_matriks_normalisasi
+        bobot_kriteria (dict | array-like): Bobot (lihat vektor_bobot)
+        top_k (int, optional): Jika diisi, ranking hanya berisi k jurusan terbaik
+    
+    Returns:
+        tuple: (nilai_saw, ranking)
+            - nilai_saw: np.ndarray (N, M), atau (K, N, M) untuk K vektor bobot
+            - ranking: Indeks jurusan urut dari nilai tertinggi (sumbu terakhir)
+    """
+    bobot = vektor_bobot(bobot_kriteria)
+    
+    if bobot.ndim == 1:
+        nilai_saw = matriks_r @ bobot
+    else:
+        nilai_saw = np.moveaxis(matriks_r @ bobot.T, -1, 0)
+    
+    if top_k is not None and nilai_saw.ndim == 3:
+        k, n, m = nilai_saw.shape
+        ranking = _pilih_top_k(nilai_saw.reshape(k * n, m), top_k).reshape(k, n, -1)
+    else:
+        ranking = urutkan_ranking(nilai_saw, top_k)
     
-    return hasil, detail
+    return nilai_saw, ranking
 
 
 def format_hasil(hasil, nama_siswa):
@@ -261,9 +660,10 @@ def validasi_input(nilai_akademik, minat, ekonomi, prospek_kerja):
 
 # ========================================
 # TESTING FUNGSI (jika file dijalankan langsung)
+# Jalankan dari root project: python -m utils.saw_calculator
 # ========================================
 if __name__ == "__main__":
-    from jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA
+    from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA
     
     print("="*60)
     print("TESTING MODUL SAW CALCULATOR")
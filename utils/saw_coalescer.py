@@ -0,0 +1,204 @@
+"""
+Penggabung (micro-batching) permintaan hitung SAW yang datang bersamaan
+Permintaan satu siswa yang tiba dalam beberapa milidetik dikumpulkan lalu
+dihitung sekaligus dengan hitung_saw_batch_ringkas (satu operasi matriks),
+kemudian hasilnya dibagikan kembali ke masing-masing pemanggil.
+
+Dua pengaturan menentukan trade-off latency vs throughput:
+    jendela_ms  Waktu tunggu maksimum sejak permintaan pertama di batch.
+                Makin besar, batch makin penuh tetapi latency bertambah.
+                0 = hanya gabungkan permintaan di iterasi event loop yang sama.
+    maks_batch  Batch langsung dihitung begitu berisi sebanyak ini, tanpa
+                menunggu jendela habis.
+
+Dipakai dari satu event loop asyncio (lihat utils/api_server.py):
+    penggabung = PenggabungSAW(JURUSAN_DATA, BOBOT_KRITERIA, jendela_ms=2)
+    hasil, detail = await penggabung.hitung(85, 'IPA', 'Sedang', 90)
+"""
+
+import asyncio
+from collections import Counter
+
+from data.jurusan_data import JURUSAN_DATA, BOBOT_KRITERIA, get_katalog
+from utils.saw_cache import normalisasi_key
+from utils.saw_calculator import hitung_saw_batch_ringkas, hitung_saw_ringkas
+
+JENDELA_MS_DEFAULT = 0.0
+MAKS_BATCH_DEFAULT = 64
+
+
+def label_ukuran_batch(ukuran):
+    """
+    Rentang ukuran batch (kelipatan 2) untuk distribusi statistik
+    
+    Contoh: 1 -> '1', 2 -> '2', 3 -> '3-4', 7 -> '5-8', 64 -> '33-64'
+    """
+    atas = 1 << (ukuran - 1).bit_length()
+    bawah = atas // 2 + 1
+    return str(atas) if bawah >= atas else f"{bawah}-{atas}"
+
+
+class PenggabungSAW:
+    """
+    Kumpulkan permintaan hitung SAW bersamaan menjadi satu batch
+    
+    Tidak thread-safe: semua pemanggilan hitung() harus dari event loop
+    yang sama. Input sebaiknya sudah lolos validasi_input; input yang tidak
+    valid tidak menggagalkan batch, hanya pemanggilnya yang menerima error.
+    
+    Args:
+        jurusan_data (dict | KatalogJurusan | str, optional): Data jurusan atau
+            path katalog biner (default: JURUSAN_DATA)
+        bobot_kriteria (dict, optional): Bobot (default: BOBOT_KRITERIA)
+        jendela_ms (float): Waktu tunggu maksimum batch (milidetik)
+        maks_batch (int): Jumlah permintaan maksimum per batch
+    """
+    
+    def __init__(self, jurusan_data=None, bobot_kriteria=None,
+                 jendela_ms=JENDELA_MS_DEFAULT, maks_batch=MAKS_BATCH_DEFAULT):
+        if maks_batch < 1:
+            raise ValueError(f"maks_batch harus >= 1, saat ini: {maks_batch}")
+        self.katalog = get_katalog(JURUSAN_DATA if jurusan_data is None else jurusan_data)
+        self.bobot_kriteria = BOBOT_KRITERIA if bobot_kriteria is None else bobot_kriteria
+        self.jendela_ms = jendela_ms
+        self.maks_batch = maks_batch
+        # Antrian & timer per top_k, karena satu batch dihitung dengan satu top_k
+        self._antrian = {}
+        self._timer = {}
+        self.reset_statistik()
+    
+    async def hitung(self, nilai_akademik, minat, ekonomi, prospek_kerja, top_k=None):
+        """
+        Hitung SAW satu siswa lewat batch bersama
+        
+        Args:
+            (sama dengan hitung_saw, tanpa jurusan_data & bobot_kriteria)
+        
+        Returns:
+            HasilSAW: Sama dengan hasil hitung_saw_ringkas
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        antrian = self._antrian.setdefault(top_k, [])
+        antrian.append(((nilai_akademik, minat, ekonomi, prospek_kerja), future))
+        
+        if len(antrian) >= self.maks_batch:
+            self._proses(top_k, 'penuh')
+        elif len(antrian) == 1:
+            if self.jendela_ms > 0:
+                self._timer[top_k] = loop.call_later(self.jendela_ms / 1000, self._proses,
+                                                     top_k, 'jendela')
+            else:
+                self._timer[top_k] = loop.call_soon(self._proses, top_k, 'jendela')
+        return await future
+    
+    def _proses(self, top_k, alasan):
+        """Hitung satu batch dan kirim hasilnya ke setiap future"""
+        antrian = self._antrian.pop(top_k, [])
+        timer = self._timer.pop(top_k, None)
+        if timer is not None:
+            timer.cancel()
+        if not antrian:
+            return
+        
+        # Input yang sama di satu batch cukup dihitung sekali
+        posisi = {}
+        siswa_unik = []
+        indeks = []
+        for siswa, _ in antrian:
+            try:
+                key = normalisasi_key(*siswa)
+                hash(key)
+            except (TypeError, ValueError):
+                key = object()  # Input tidak wajar: jangan digabung, error muncul saat dihitung
+            if key not in posisi:
+                posisi[key] = len(siswa_unik)
+                siswa_unik.append(siswa)
+            indeks.append(posisi[key])
+        
+        hasil = self._hitung_batch(siswa_unik, top_k)
+        
+        for (_, future), i in zip(antrian, indeks):
+            if future.done():
+                continue  # pemanggil sudah batal
+            if isinstance(hasil[i], Exception):
+                future.set_exception(hasil[i])
+            else:
+                future.set_result(hasil[i])
+        
+        self.permintaan += len(antrian)
+        self.batch += 1
+        self.duplikat += len(antrian) - len(siswa_unik)
+        self.maks_terpakai = max(self.maks_terpakai, len(antrian))
+        self.alasan[alasan] += 1
+        self.distribusi[label_ukuran_batch(len(antrian))] += 1
+    
+    def _hitung_batch(self, siswa_unik, top_k):
+        """List HasilSAW (atau Exception) sesuai urutan siswa_unik"""
+        try:
+            # Batch berisi satu siswa lebih murah lewat jalur skalar
+            if len(siswa_unik) == 1:
+                return [hitung_saw_ringkas(*siswa_unik[0], self.katalog, self.bobot_kriteria,
+                                           top_k=top_k)]
+            kolom = list(zip(*siswa_unik))
+            batch = hitung_saw_batch_ringkas(*kolom, self.katalog, self.bobot_kriteria, top_k=top_k)
+            return list(batch)
+        except Exception:
+            # Ada input tidak valid: hitung satu per satu agar error hanya
+            # diterima pemanggil yang bersangkutan
+            hasil = []
+            for siswa in siswa_unik:
+                try:
+                    hasil.append(hitung_saw_ringkas(*siswa, self.katalog, self.bobot_kriteria,
+                                                    top_k=top_k))
+                except Exception as e:
+                    hasil.append(e)
+            return hasil
+    
+    def reset_statistik(self):
+        """Reset semua statistik batch"""
+        self.permintaan = 0
+        self.batch = 0
+        self.duplikat = 0
+        self.maks_terpakai = 0
+        self.alasan = Counter({'jendela': 0, 'penuh': 0})
+        self.distribusi = Counter()
+    
+    def statistik(self):
+        """
+        Statistik batch sejak dibuat / reset
+        
+        Returns:
+            dict: permintaan, batch, rata_rata_batch, maks_terpakai, duplikat,
+                alasan (jumlah batch per penyebab: 'jendela' / 'penuh'),
+                distribusi (jumlah batch per rentang ukuran, urut dari kecil)
+        """
+        urutan = sorted(self.distribusi, key=lambda label: int(label.split('-')[-1]))
+        return {
+            'permintaan': self.permintaan,
+            'batch': self.batch,
+            'rata_rata_batch': self.permintaan / self.batch if self.batch else 0.0,
+            'maks_terpakai': self.maks_terpakai,
+            'duplikat': self.duplikat,
+            'alasan': dict(self.alasan),
+            'distribusi': {label: self.distribusi[label] for label in urutan}
+        }
+    
+    def kolektor(self):
+        """
+        Sampel metrik untuk RegistryMetrik.daftar_kolektor (utils/metrics.py)
+        
+        Returns:
+            list: (nama, tipe, label, nilai)
+        """
+        sampel = [
+            ('spk_coalescer_permintaan_total', 'counter', {}, self.permintaan),
+            ('spk_coalescer_duplikat_total', 'counter', {}, self.duplikat),
+            ('spk_coalescer_jendela_ms', 'gauge', {}, self.jendela_ms),
+            ('spk_coalescer_maks_batch', 'gauge', {}, self.maks_batch),
+        ]
+        for alasan, jumlah in self.alasan.items():
+            sampel.append(('spk_coalescer_batch_total', 'counter', {'alasan': alasan}, jumlah))
+        for label, jumlah in self.distribusi.items():
+            sampel.append(('spk_coalescer_batch_ukuran_total', 'counter', {'ukuran': label}, jumlah))
+        return sampel
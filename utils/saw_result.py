@@ -0,0 +1,226 @@
+"""
+Representasi ringkas hasil perhitungan SAW
+Hasil disimpan sebagai array (kode jurusan sebagai integer, nilai sebagai
+float64) dengan satu urutan ranking yang dipakai bersama oleh tampilan
+'hasil' dan 'detail'. Setiap baris tetap bisa diakses seperti dictionary
+(row['Jurusan'], row['Nilai SAW']) sehingga app.py, format_hasil, dan
+generate_pdf_report tetap berjalan tanpa perubahan.
+"""
+
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+KOLOM_HASIL = ('Kode', 'Jurusan', 'Nilai SAW')
+KOLOM_DETAIL = ('Kode', 'Jurusan', 'R1', 'R2', 'R3', 'R4', 'Total')
+
+# Posisi R1-R4 pada sumbu terakhir array r
+_KOLOM_R = {'R1': 0, 'R2': 1, 'R3': 2, 'R4': 3}
+
+
+class BarisJurusan(Mapping):
+    """
+    Satu baris ranking (read-only) yang bisa diakses seperti dictionary
+    
+    Nilai dibaca langsung dari array HasilSAW, tidak ada dictionary yang
+    dibuat sampai dict(baris) dipanggil.
+    """
+    
+    __slots__ = ('_hasil', '_posisi', '_kolom')
+    
+    def __init__(self, hasil, posisi, kolom):
+        self._hasil = hasil
+        self._posisi = posisi
+        self._kolom = kolom
+    
+    def __getitem__(self, key):
+        if key not in self._kolom:
+            raise KeyError(key)
+        return self._hasil._nilai_kolom(key, self._posisi)
+    
+    def __iter__(self):
+        return iter(self._kolom)
+    
+    def __len__(self):
+        return len(self._kolom)
+    
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class TampilanHasil(Sequence):
+    """
+    Tampilan list-of-dict di atas HasilSAW ('hasil' atau 'detail')
+    
+    Args:
+        hasil (HasilSAW): Sumber data
+        kolom (tuple): KOLOM_HASIL atau KOLOM_DETAIL
+    """
+    
+    __slots__ = ('_hasil', '_kolom')
+    
+    def __init__(self, hasil, kolom):
+        self._hasil = hasil
+        self._kolom = kolom
+    
+    def __len__(self):
+        return len(self._hasil)
+    
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return BarisJurusan(self._hasil, i, self._kolom)
+    
+    def to_list(self):
+        """
+        Ubah menjadi list of dict (format lama hitung_saw)
+        
+        Returns:
+            list: List dictionary, satu per jurusan sesuai ranking
+        """
+        kolom = {k: self._hasil._kolom_list(k) for k in self._kolom}
+        return [
+            {k: kolom[k][i] for k in self._kolom}
+            for i in range(len(self))
+        ]
+    
+    def __repr__(self):
+        return repr(self.to_list())
+
+
+class HasilSAW:
+    """
+    Hasil SAW satu siswa dalam bentuk array
+    
+    Semua array sudah diurutkan sesuai ranking (indeks 0 = terbaik).
+    Mendukung unpacking seperti hasil hitung_saw:
+        hasil, detail = hitung_saw_ringkas(...)
+    
+    Attributes:
+        katalog (KatalogJurusan): Katalog sumber kode & nama jurusan
+        indeks (np.ndarray): Posisi jurusan di katalog (k,) int32
+        nilai_saw (np.ndarray): Nilai SAW (k,) float64
+        r (np.ndarray): R1-R4 (k, 4) float64
+    """
+    
+    __slots__ = ('katalog', 'indeks', 'nilai_saw', 'r')
+    
+    def __init__(self, katalog, indeks, nilai_saw, r):
+        self.katalog = katalog
+        self.indeks = indeks
+        self.nilai_saw = nilai_saw
+        self.r = r
+    
+    def __len__(self):
+        return len(self.indeks)
+    
+    def __iter__(self):
+        return iter((self.hasil, self.detail))
+    
+    @property
+    def hasil(self):
+        """Tampilan ranking (Kode, Jurusan, Nilai SAW)"""
+        return TampilanHasil(self, KOLOM_HASIL)
+    
+    @property
+    def detail(self):
+        """Tampilan detail normalisasi (Kode, Jurusan, R1-R4, Total)"""
+        return TampilanHasil(self, KOLOM_DETAIL)
+    
+    @property
+    def kode(self):
+        """np.ndarray kode jurusan sesuai ranking"""
+        return self.katalog.kode[self.indeks]
+    
+    @property
+    def nama(self):
+        """np.ndarray nama jurusan sesuai ranking"""
+        return self.katalog.nama[self.indeks]
+    
+    def _nilai_kolom(self, key, posisi):
+        if key == 'Kode':
+            return self.katalog.kode[self.indeks[posisi]]
+        if key == 'Jurusan':
+            return self.katalog.nama[self.indeks[posisi]]
+        if key in ('Nilai SAW', 'Total'):
+            return float(self.nilai_saw[posisi])
+        return float(self.r[posisi, _KOLOM_R[key]])
+    
+    def _kolom_list(self, key):
+        if key == 'Kode':
+            return self.kode.tolist()
+        if key == 'Jurusan':
+            return self.nama.tolist()
+        if key in ('Nilai SAW', 'Total'):
+            return self.nilai_saw.tolist()
+        return self.r[:, _KOLOM_R[key]].tolist()
+    
+    def __repr__(self):
+        return f"HasilSAW({len(self)} jurusan, terbaik={self.katalog.kode[self.indeks[0]]!r})" \
+            if len(self) else "HasilSAW(kosong)"
+
+
+class HasilSAWBatch:
+    """
+    Hasil SAW banyak siswa dalam bentuk array (N, k)
+    
+    hasil_batch[i] mengembalikan HasilSAW siswa ke-i tanpa menyalin data.
+    
+    Attributes:
+        katalog (KatalogJurusan): Katalog sumber kode & nama jurusan
+        indeks (np.ndarray): Posisi jurusan di katalog (N, k) int32
+        nilai_saw (np.ndarray): Nilai SAW sesuai ranking (N, k) float64
+        r (np.ndarray): R1-R4 sesuai ranking (N, k, 4) float64
+    """
+    
+    __slots__ = ('katalog', 'indeks', 'nilai_saw', 'r')
+    
+    def __init__(self, katalog, indeks, nilai_saw, r):
+        self.katalog = katalog
+        self.indeks = indeks
+        self.nilai_saw = nilai_saw
+        self.r = r
+    
+    def __len__(self):
+        return len(self.indeks)
+    
+    def __getitem__(self, i):
+        return HasilSAW(self.katalog, self.indeks[i], self.nilai_saw[i], self.r[i])
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+    
+    @property
+    def nbytes(self):
+        """Total ukuran array (byte)"""
+        return self.indeks.nbytes + self.nilai_saw.nbytes + self.r.nbytes
+    
+    def __repr__(self):
+        return f"HasilSAWBatch({len(self)} siswa x {self.indeks.shape[1]} jurusan)"
+
+
+def susun_hasil(katalog, urutan, nilai_saw, matriks_r):
+    """
+    Susun HasilSAW / HasilSAWBatch dari nilai dan urutan ranking
+    
+    Args:
+        katalog (KatalogJurusan): Katalog terkompilasi
+        urutan (np.ndarray): Ranking (k,) atau (N, k)
+        nilai_saw (np.ndarray): Nilai SAW (M,) atau (N, M)
+        matriks_r (np.ndarray): R1-R4 (M, 4) atau (N, M, 4)
+    
+    Returns:
+        HasilSAW | HasilSAWBatch
+    """
+    indeks = urutan.astype(np.int32)
+    if indeks.ndim == 1:
+        return HasilSAW(katalog, indeks, nilai_saw[urutan], matriks_r[urutan])
+    
+    nilai = np.take_along_axis(nilai_saw, urutan, axis=-1)
+    r = np.take_along_axis(matriks_r, urutan[..., None], axis=-2)
+    return HasilSAWBatch(katalog, indeks, nilai, r)
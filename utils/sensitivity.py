@@ -0,0 +1,271 @@
+"""
+Analisis sensitivitas bobot kriteria SAW
+Mengukur seberapa sering rekomendasi terbaik berubah jika bobot kriteria
+digeser, untuk satu siswa maupun satu angkatan sekaligus
+"""
+
+import itertools
+
+import numpy as np
+
+from data.jurusan_data import BOBOT_KRITERIA, URUTAN_KRITERIA
+from utils.saw_calculator import vektor_bobot
+
+# Batas memori default untuk satu blok perhitungan (MB)
+BATAS_MEMORI_MB = 64
+
+
+# ========================================
+# PEMBUATAN VEKTOR BOBOT
+# ========================================
+def grid_bobot(langkah=0.05):
+    """
+    Semua vektor bobot pada simplex dengan jarak grid tertentu
+    
+    Args:
+        langkah (float): Jarak grid, 1/langkah harus bilangan bulat (contoh: 0.05)
+    
+    Returns:
+        np.ndarray: Vektor bobot (K, 4) dengan total setiap baris = 1.0
+    """
+    n = int(round(1 / langkah))
+    if n <= 0 or abs(n * langkah - 1) > 1e-9:
+        raise ValueError(f"1/langkah harus bilangan bulat positif, saat ini: {langkah}")
+    
+    jumlah_kriteria = len(URUTAN_KRITERIA)
+    
+    # Stars and bars: posisi pembatas menentukan pembagian n ke 4 kriteria
+    baris = []
+    for pembatas in itertools.combinations(range(n + jumlah_kriteria - 1), jumlah_kriteria - 1):
+        batas = (-1,) + pembatas + (n + jumlah_kriteria - 1,)
+        baris.append([batas[i + 1] - batas[i] - 1 for i in range(jumlah_kriteria)])
+    
+    return np.array(baris, dtype=np.float64) / n
+
+
+def sampel_bobot(jumlah, seed=None, pusat=None, konsentrasi=50.0):
+    """
+    Sampel acak vektor bobot dari distribusi Dirichlet
+    
+    Args:
+        jumlah (int): Jumlah vektor bobot
+        seed (int, optional): Seed random
+        pusat (dict | array-like, optional): Jika diisi, sampel diambil di
+            sekitar bobot ini (perturbasi lokal). Jika kosong, sampel
+            tersebar merata di seluruh simplex.
+        konsentrasi (float): Semakin besar, semakin dekat sampel ke pusat
+    
+    Returns:
+        np.ndarray: Vektor bobot (jumlah, 4)
+    """
+    rng = np.random.default_rng(seed)
+    if pusat is None:
+        alpha = np.ones(len(URUTAN_KRITERIA))
+    else:
+        alpha = vektor_bobot(pusat) * konsentrasi
+    return rng.dirichlet(alpha, size=jumlah)
+
+
+# ========================================
+# STABILITAS RANKING
+# ========================================
+def _ukuran_blok(jumlah_siswa, jumlah_jurusan, batas_memori_mb):
+    """Jumlah siswa per blok agar satu blok (siswa x jurusan) muat di memori"""
+    batas_elemen = max(1, int(batas_memori_mb * 2**20) // 8)
+    return max(1, min(jumlah_siswa, batas_elemen // max(jumlah_jurusan, 1)))
+
+
+def analisis_sensitivitas(matriks_r, daftar_bobot, bobot_dasar=None,
+                          batas_memori_mb=BATAS_MEMORI_MB):
+    """
+    Hitung stabilitas rekomendasi terbaik terhadap banyak vektor bobot
+    
+    Perhitungan dilakukan per blok (siswa x bobot) sehingga tensor
+    nilai (N, M, K) tidak pernah dibuat utuh di memori.
+    
+    Args:
+        matriks_r (np.ndarray): Tensor R (N, M, 4) dari hitung_matriks_normalisasi
+        daftar_bobot (array-like): Vektor bobot (K, 4), dari grid_bobot/sampel_bobot
+        bobot_dasar (dict, optional): Bobot acuan (default: BOBOT_KRITERIA)
+        batas_memori_mb (float): Batas memori kira-kira untuk satu blok
+    
+    Returns:
+        dict: Ringkasan sensitivitas
+            - top_dasar: Indeks jurusan terbaik dengan bobot dasar (N,)
+            - stabilitas_siswa: Proporsi bobot yang tidak mengubah jurusan
+              terbaik, per siswa (N,)
+            - stabilitas_bobot: Proporsi siswa yang jurusan terbaiknya tetap,
+              per vektor bobot (K,)
+            - skor_stabilitas: Rata-rata proporsi keseluruhan (0-1)
+            - frekuensi_top1: Berapa kali setiap jurusan menjadi terbaik (M,)
+    """
+    matriks_r = np.asarray(matriks_r, dtype=np.float64)
+    daftar_bobot = vektor_bobot(daftar_bobot).reshape(-1, len(URUTAN_KRITERIA))
+    w_dasar = vektor_bobot(BOBOT_KRITERIA if bobot_dasar is None else bobot_dasar)
+    
+    n, m, c = matriks_r.shape
+    k = len(daftar_bobot)
+    
+    # argmax mengambil indeks pertama jika seri, sama dengan sort stabil
+    top_dasar = np.argmax(matriks_r @ w_dasar, axis=1)
+    
+    sama_siswa = np.zeros(n, dtype=np.int64)
+    sama_bobot = np.zeros(k, dtype=np.int64)
+    frekuensi = np.zeros(m, dtype=np.int64)
+    
+    ukuran_siswa = _ukuran_blok(n, m, batas_memori_mb)
+    ukuran_bobot = max(1, (int(batas_memori_mb * 2**20) // 8) // (ukuran_siswa * m))
+    
+    for s0 in range(0, n, ukuran_siswa):
+        blok_r = matriks_r[s0:s0 + ukuran_siswa]
+        s = len(blok_r)
+        # (S*M, 4) supaya perkalian menjadi satu GEMM besar
+        datar = blok_r.reshape(s * m, c)
+        top_blok = top_dasar[s0:s0 + s, None]
+        
+        for k0 in range(0, k, ukuran_bobot):
+            blok_bobot = daftar_bobot[k0:k0 + ukuran_bobot]
+            nilai = (datar @ blok_bobot.T).reshape(s, m, len(blok_bobot))
+            top = np.argmax(nilai, axis=1)
+            
+            cocok = top == top_blok
+            sama_siswa[s0:s0 + s] += cocok.sum(axis=1)
+            sama_bobot[k0:k0 + len(blok_bobot)] += cocok.sum(axis=0)
+            frekuensi += np.bincount(top.ravel(), minlength=m)
+    
+    return {
+        'top_dasar': top_dasar,
+        'stabilitas_siswa': sama_siswa / k if k else np.ones(n),
+        'stabilitas_bobot': sama_bobot / n if n else np.ones(k),
+        'skor_stabilitas': float(sama_siswa.sum() / (n * k)) if n and k else 1.0,
+        'frekuensi_top1': frekuensi
+    }
+
+
+# ========================================
+# AMBANG PERUBAHAN (RANK FLIP)
+# ========================================
+def ambang_perubahan(matriks_r, bobot_dasar=None, batas_memori_mb=BATAS_MEMORI_MB):
+    """
+    Cari bobot satu kriteria di mana jurusan terbaik mulai berubah
+    
+    Bobot kriteria j digeser dari nilai dasarnya ke x (0-1), bobot kriteria
+    lain diskalakan proporsional agar total tetap 1. Nilai setiap jurusan
+    linear terhadap x, sehingga titik potong dengan jurusan terbaik bisa
+    dihitung langsung tanpa sweep.
+    
+    Args:
+        matriks_r (np.ndarray): Tensor R (N, M, 4)
+        bobot_dasar (dict, optional): Bobot acuan (default: BOBOT_KRITERIA)
+        batas_memori_mb (float): Batas memori kira-kira untuk satu blok
+    
+    Returns:
+        dict: Per kriteria (key sesuai URUTAN_KRITERIA) berisi dictionary:
+            - naik: Bobot terkecil > bobot dasar yang mengubah jurusan
+              terbaik (N,), NaN jika tidak pernah berubah
+            - turun: Bobot terbesar < bobot dasar yang mengubah jurusan
+              terbaik (N,), NaN jika tidak pernah berubah
+            - pengganti_naik / pengganti_turun: Indeks jurusan yang
+              menggantikan (N,), -1 jika tidak ada
+    """
+    matriks_r = np.asarray(matriks_r, dtype=np.float64)
+    w_dasar = vektor_bobot(BOBOT_KRITERIA if bobot_dasar is None else bobot_dasar)
+    n, m, _ = matriks_r.shape
+    
+    hasil = {}
+    for j, kriteria in enumerate(URUTAN_KRITERIA):
+        hasil[kriteria] = {
+            'naik': np.full(n, np.nan),
+            'turun': np.full(n, np.nan),
+            'pengganti_naik': np.full(n, -1, dtype=np.int64),
+            'pengganti_turun': np.full(n, -1, dtype=np.int64)
+        }
+    
+    ukuran_siswa = _ukuran_blok(n, m, batas_memori_mb / 4)
+    
+    for s0 in range(0, n, ukuran_siswa):
+        blok_r = matriks_r[s0:s0 + ukuran_siswa]
+        s = len(blok_r)
+        baris = np.arange(s)
+        nilai_dasar = blok_r @ w_dasar
+        top = np.argmax(nilai_dasar, axis=1)
+        
+        for j, kriteria in enumerate(URUTAN_KRITERIA):
+            wj = w_dasar[j]
+            if wj >= 1:
+                continue
+            
+            # V(x) = x * a + (1 - x) * b
+            a = blok_r[:, :, j]
+            b = (nilai_dasar - wj * a) / (1 - wj)
+            
+            # Selisih jurusan terbaik dengan jurusan lain: db + x * (da - db)
+            da = a[baris, top][:, None] - a
+            db = b[baris, top][:, None] - b
+            penyebut = db - da
+            with np.errstate(divide='ignore', invalid='ignore'):
+                x = np.where(penyebut != 0, db / penyebut, np.nan)
+            x[baris, top] = np.nan
+            x[(x < 0) | (x > 1)] = np.nan
+            # Di batas x = 0 / 1 tidak ada bobot sesudah titik potong: nilai
+            # seri hanya mengganti jurusan terbaik jika penantang menang
+            # tie-break (indeks lebih kecil, sama seperti argmax/sort stabil)
+            kalah_seri = np.arange(m) > top[:, None]
+            x[((x == 0) | (x == 1)) & kalah_seri] = np.nan
+            
+            atas = np.where(x > wj, x, np.inf)
+            bawah = np.where(x < wj, x, -np.inf)
+            idx_atas = np.argmin(atas, axis=1)
+            idx_bawah = np.argmax(bawah, axis=1)
+            nilai_atas = atas[baris, idx_atas]
+            nilai_bawah = bawah[baris, idx_bawah]
+            
+            ada_atas = np.isfinite(nilai_atas)
+            ada_bawah = np.isfinite(nilai_bawah)
+            
+            keluaran = hasil[kriteria]
+            potong = slice(s0, s0 + s)
+            keluaran['naik'][potong] = np.where(ada_atas, nilai_atas, np.nan)
+            keluaran['turun'][potong] = np.where(ada_bawah, nilai_bawah, np.nan)
+            keluaran['pengganti_naik'][potong] = np.where(ada_atas, idx_atas, -1)
+            keluaran['pengganti_turun'][potong] = np.where(ada_bawah, idx_bawah, -1)
+    
+    return hasil
+
+
+# ========================================
+# TESTING FUNGSI (jika file dijalankan langsung)
+# ========================================
+if __name__ == "__main__":
+    from data.jurusan_data import JURUSAN_DATA, CONTOH_DATA_SISWA
+    from utils.saw_calculator import hitung_matriks_normalisasi
+    
+    print("=" * 60)
+    print("ANALISIS SENSITIVITAS BOBOT KRITERIA")
+    print("=" * 60)
+    
+    kode, matriks_r = hitung_matriks_normalisasi(
+        [s['nilai_akademik'] for s in CONTOH_DATA_SISWA],
+        [s['minat'] for s in CONTOH_DATA_SISWA],
+        [s['ekonomi'] for s in CONTOH_DATA_SISWA],
+        [s['prospek_kerja'] for s in CONTOH_DATA_SISWA],
+        JURUSAN_DATA
+    )
+    
+    daftar_bobot = grid_bobot(0.05)
+    ringkasan = analisis_sensitivitas(matriks_r, daftar_bobot)
+    ambang = ambang_perubahan(matriks_r)
+    
+    print(f"\nGrid bobot: {len(daftar_bobot)} vektor")
+    print(f"Skor stabilitas keseluruhan: {ringkasan['skor_stabilitas']:.3f}\n")
+    
+    for i, siswa in enumerate(CONTOH_DATA_SISWA):
+        terbaik = JURUSAN_DATA[kode[ringkasan['top_dasar'][i]]]['nama']
+        print(f"{siswa['nama']:<20} | {terbaik:<20} | "
+              f"stabil {ringkasan['stabilitas_siswa'][i]:.1%}")
+        for kriteria in URUTAN_KRITERIA:
+            naik = ambang[kriteria]['naik'][i]
+            turun = ambang[kriteria]['turun'][i]
+            print(f"    {kriteria:<16} berubah jika bobot > {naik:.3f} atau < {turun:.3f}")
+    
+    print("\n" + "=" * 60)